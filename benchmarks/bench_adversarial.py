@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Latencia de los validadores con entradas hostiles y con entradas típicas.
+
+Compara los validadores actuales (con el límite de longitud en O(1) y el
+modo seguro) contra una réplica de las reglas anteriores, que limpiaban
+la entrada o ejecutaban la expresión regular antes de mirar la longitud.
+
+Ejecutar desde la raíz del repositorio:
+    python benchmarks/bench_adversarial.py [megabytes]
+"""
+
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from jorge_choque_pg2_tecba.validators import (  # noqa: E402
+    ValidadorDatosPersonales,
+    ValidadorDatosContacto,
+)
+
+
+def anterior_nombre(nombre):
+    if not nombre or len(nombre.strip()) < 2:
+        return False
+    limpio = ' '.join(nombre.split())
+    return (bool(re.match(r'^[a-zA-ZáéíóúÁÉÍÓÚñÑüÜ\s]+$', limpio))
+            and 2 <= len(limpio) <= 50)
+
+
+def anterior_email(email):
+    if not email:
+        return False
+    patron = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    return bool(re.match(patron, email)) and len(email) <= 100
+
+
+def anterior_direccion(direccion):
+    if not direccion or len(direccion.strip()) < 5:
+        return False
+    limpia = ' '.join(direccion.split())
+    patron = r'^[a-zA-Z0-9áéíóúÁÉÍÓÚñÑüÜ\s.,#-]+$'
+    return bool(re.match(patron, limpia)) and 5 <= len(limpia) <= 200
+
+
+def anterior_celular(celular):
+    if not celular:
+        return False
+    limpio = (celular.replace(' ', '').replace('-', '').replace('(', '')
+              .replace(')', '').replace('+', ''))
+    return limpio.isdigit() and 8 <= len(limpio) <= 15
+
+
+def latencia(funcion, valor, repeticiones: int) -> float:
+    """Mejor latencia en microsegundos de varias ejecuciones."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion(valor)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor * 1e6
+
+
+def main() -> None:
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    n = int(megabytes * 1024 * 1024)
+    personales = ValidadorDatosPersonales()
+    contacto = ValidadorDatosContacto()
+    seguro = ValidadorDatosContacto(modo_seguro=True)
+
+    casos = [
+        ("nombre típico", "Juan Carlos Pérez",
+         anterior_nombre, personales.validar_nombre, None),
+        ("nombre: espacios", "Juan " + " " * n + "Pérez",
+         anterior_nombre, personales.validar_nombre, None),
+        ("nombre: letras", "a" * n,
+         anterior_nombre, personales.validar_nombre, None),
+        ("email típico", "juan.perez@correo.com.bo",
+         anterior_email, contacto.validar_email, seguro.validar_email),
+        ("email: parte local", "a" * n + "@correo.bo",
+         anterior_email, contacto.validar_email, seguro.validar_email),
+        ("email: dominio", "a@" + "a." * (n // 2) + "1",
+         anterior_email, contacto.validar_email, seguro.validar_email),
+        ("dirección típica", "Calle 25 de Mayo #345",
+         anterior_direccion, contacto.validar_direccion, seguro.validar_direccion),
+        ("dirección: espacios", "Calle" + "\t " * (n // 2),
+         anterior_direccion, contacto.validar_direccion, seguro.validar_direccion),
+        ("celular: guiones", "7" + "-" * n,
+         anterior_celular, contacto.validar_celular, seguro.validar_celular),
+    ]
+
+    print(f"entradas hostiles de {megabytes:g} MB")
+    print(f"{'caso':<22} {'anterior (µs)':>14} {'actual (µs)':>12} {'seguro (µs)':>12}")
+    for nombre, valor, anterior, actual, modo_seguro in casos:
+        repeticiones = 3 if len(valor) > 1000 else 1000
+        fila = f"{nombre:<22} {latencia(anterior, valor, repeticiones):>14.1f} "
+        fila += f"{latencia(actual, valor, repeticiones):>12.1f} "
+        if modo_seguro is not None:
+            fila += f"{latencia(modo_seguro, valor, repeticiones):>12.1f}"
+        print(fila)
+
+
+if __name__ == "__main__":
+    main()
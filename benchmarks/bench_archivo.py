@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Archivo binario de personas (archivo.py) frente a JSON Lines.
+
+Guarda N personas válidas en JSON Lines y en el formato binario, y mide
+el tamaño de cada archivo, el tiempo de recargarlas (JSON más
+Persona.desde_dict frente a LectorArchivo sin revalidar), el acceso
+aleatorio por índice y la lectura de un solo campo. También comprueba
+que los datos recargados sean idénticos.
+
+Ejecutar desde la raíz del repositorio:
+    python benchmarks/bench_archivo.py --personas 1000000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from jorge_choque_pg2_tecba.archivo import LectorArchivo, guardar_personas  # noqa: E402
+from jorge_choque_pg2_tecba.core import Persona  # noqa: E402
+from datos_sinteticos import GeneradorPersonas  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark del archivo binario de personas")
+    parser.add_argument("--personas", type=int, default=200_000)
+    parser.add_argument("--accesos", type=int, default=100_000)
+    parser.add_argument("--semilla", type=int, default=42)
+    args = parser.parse_args()
+
+    personas = [Persona.desde_dict(fila)
+                for fila in GeneradorPersonas(args.semilla).iterar(args.personas)]
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta_json = os.path.join(directorio, "personas.jsonl")
+        ruta_binaria = os.path.join(directorio, "personas.jcpa")
+
+        inicio = time.perf_counter()
+        with open(ruta_json, "w", encoding="utf-8") as salida:
+            for persona in personas:
+                salida.write(json.dumps(persona.obtener_todos_los_datos(),
+                                        ensure_ascii=False) + "\n")
+        escritura_json = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        guardar_personas(ruta_binaria, personas)
+        escritura_binaria = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        with open(ruta_json, encoding="utf-8") as entrada:
+            desde_json = [Persona.desde_dict(json.loads(linea)) for linea in entrada]
+        carga_json = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        lector = LectorArchivo(ruta_binaria)
+        apertura = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        desde_binario = list(lector)
+        carga_binaria = time.perf_counter() - inicio
+
+        azar = random.Random(args.semilla)
+        indices = [azar.randrange(len(lector)) for _ in range(args.accesos)]
+        inicio = time.perf_counter()
+        for indice in indices:
+            lector.persona(indice)
+        aleatorio = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        for indice in indices:
+            lector[indice].email
+        un_campo = time.perf_counter() - inicio
+
+        iguales = all(a.obtener_todos_los_datos() == b.obtener_todos_los_datos()
+                      == c.obtener_todos_los_datos()
+                      for a, b, c in zip(personas, desde_json, desde_binario))
+        tamano_json = os.path.getsize(ruta_json)
+        tamano_binario = os.path.getsize(ruta_binaria)
+        lector.cerrar()
+
+    n = args.personas
+    print(f"personas:            {n:,}")
+    print(f"tamaño:              JSONL {tamano_json / 1e6:.1f} MB, "
+          f"binario {tamano_binario / 1e6:.1f} MB ({tamano_binario / tamano_json:.0%})")
+    print(f"escritura:           JSONL {escritura_json:.2f} s, "
+          f"binario {escritura_binaria:.2f} s")
+    print(f"carga completa:      JSONL + desde_dict {carga_json:.2f} s "
+          f"({n / carga_json:,.0f}/s), binario {carga_binaria:.2f} s "
+          f"({n / carga_binaria:,.0f}/s), {carga_json / carga_binaria:.1f}x")
+    print(f"abrir el archivo:    {apertura * 1e3:.2f} ms")
+    print(f"acceso aleatorio:    {args.accesos / aleatorio:,.0f} personas/s, "
+          f"{args.accesos / un_campo:,.0f} emails/s (un solo campo)")
+    print(f"datos idénticos:     {'sí' if iguales else 'NO'}")
+    return 0 if iguales else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Accesor DataFrame.validacion frente a DataFrame.apply con los validadores.
+
+Construye un DataFrame con filas sintéticas más los valores inválidos de
+datos_sinteticos y mide filas por segundo de df.apply(validar_persona,
+axis=1) frente a df.validacion.validos(), con columnas object, cadenas de
+Python y cadenas de pyarrow. Comprueba que ambos den el mismo resultado;
+la equivalencia campo por campo con los validadores escalares se prueba
+en tests/test_dataframe.py.
+
+Ejecutar desde la raíz del repositorio:
+    python benchmarks/bench_dataframe.py --filas 200000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pandas as pd  # noqa: E402
+
+# Importar el módulo registra el accesor df.validacion
+import jorge_choque_pg2_tecba.dataframe  # noqa: E402,F401
+from jorge_choque_pg2_tecba.esquema import validar_persona  # noqa: E402
+from datos_sinteticos import CAMPOS, INVALIDOS, GeneradorPersonas  # noqa: E402
+
+
+def construir(filas: int, tipo):
+    """DataFrame de filas sintéticas seguido de los inválidos de cada campo."""
+    datos = GeneradorPersonas(42, 0.3).filas(filas)
+    base = GeneradorPersonas(7).fila()
+    for campo in CAMPOS:
+        for valor in INVALIDOS[campo]:
+            datos.append(dict(base, **{campo: valor}))
+    return pd.DataFrame(datos, columns=list(CAMPOS), dtype=tipo)
+
+
+def con_apply(df):
+    """validar_persona fila por fila con DataFrame.apply."""
+    return df.apply(lambda fila: validar_persona(
+        {campo: valor for campo, valor in fila.items() if pd.notna(valor)}).valido,
+        axis=1)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark del accesor de pandas")
+    parser.add_argument("--filas", type=int, default=100_000)
+    args = parser.parse_args()
+
+    df = construir(args.filas, object)
+    inicio = time.perf_counter()
+    esperado = list(con_apply(df))
+    t_apply = time.perf_counter() - inicio
+    print(f"{'object':>16}: apply   {len(df) / t_apply:>10,.0f} filas/s")
+
+    correcto = True
+    tipos = {"object": object, "string[python]": pd.StringDtype("python"),
+             "string[pyarrow]": pd.StringDtype("pyarrow")}
+    for nombre, tipo in tipos.items():
+        df = construir(args.filas, tipo)
+        inicio = time.perf_counter()
+        validos = df.validacion.validos()
+        t_accesor = time.perf_counter() - inicio
+        iguales = list(validos) == esperado
+        correcto &= iguales
+        print(f"{nombre:>16}: accesor {len(df) / t_accesor:>10,.0f} filas/s "
+              f"({t_apply / t_accesor:.0f}x)"
+              f"{'' if iguales else '  RESULTADOS DISTINTOS'}")
+
+    print("resultados idénticos a DataFrame.apply: " + ("sí" if correcto else "NO"))
+    return 0 if correcto else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+ListaDominios frente a recorrer la lista de dominios en un bucle.
+
+Genera una lista de N dominios bloqueados (parte de ellos comodines
+'*.dominio'), la guarda en un archivo de texto y mide el tiempo de
+cargarla con ListaDominios.desde_archivo. Después comprueba emails
+sintéticos (la mitad con dominios de la lista o subdominios de un
+comodín) con ListaDominios, con ValidadorContactoConDominios (formato más
+dominio) y, sobre una muestra, con un bucle que compara cada email con
+cada entrada. Verifica que los resultados coincidan con el bucle.
+
+Ejecutar desde la raíz del repositorio:
+    python benchmarks/bench_dominios.py --dominios 1000000
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from jorge_choque_pg2_tecba.dominios import (  # noqa: E402
+    ListaDominios,
+    ValidadorContactoConDominios,
+    dominio_de,
+)
+from jorge_choque_pg2_tecba.validators import ValidadorDatosContacto  # noqa: E402
+from datos_sinteticos import DOMINIOS  # noqa: E402
+
+TLDS = ["com", "net", "org", "io", "xyz", "bo", "com.bo", "info", "top"]
+
+
+def etiqueta(azar: random.Random) -> str:
+    return "".join(azar.choices(string.ascii_lowercase + string.digits,
+                                k=azar.randint(5, 12)))
+
+
+def bloqueado_en_bucle(dominio: str, entradas) -> bool:
+    """Lo que hace una lista recorrida con un bucle de Python."""
+    for entrada in entradas:
+        if entrada.startswith("*."):
+            if dominio.endswith(entrada[1:]):
+                return True
+        elif dominio == entrada:
+            return True
+    return False
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de las listas de dominios")
+    parser.add_argument("--dominios", type=int, default=1_000_000)
+    parser.add_argument("--emails", type=int, default=500_000)
+    parser.add_argument("--muestra-bucle", type=int, default=100,
+                        help="Emails comprobados con el bucle")
+    parser.add_argument("--comodines", type=float, default=0.1)
+    args = parser.parse_args()
+
+    azar = random.Random(42)
+    entradas = [("*." if azar.random() < args.comodines else "")
+                + f"{etiqueta(azar)}.{azar.choice(TLDS)}" for _ in range(args.dominios)]
+
+    emails = []
+    for _ in range(args.emails):
+        if azar.random() < 0.5:
+            entrada = azar.choice(entradas)
+            if entrada.startswith("*."):
+                dominio = f"{etiqueta(azar)}.{entrada[2:]}"
+            else:
+                dominio = entrada
+        else:
+            dominio = azar.choice(DOMINIOS)
+        usuario = etiqueta(azar)
+        if azar.random() < 0.05:
+            dominio = dominio.upper()
+        emails.append(f"{usuario}@{dominio}")
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "bloqueados.txt")
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write("# dominios bloqueados\n" + "\n".join(entradas) + "\n")
+        inicio = time.perf_counter()
+        lista = ListaDominios.desde_archivo(ruta)
+        t_carga = time.perf_counter() - inicio
+    print(f"carga de {len(lista):,} entradas: {t_carga:.2f} s ({lista!r})")
+
+    inicio = time.perf_counter()
+    bloqueados = [lista.contiene_email(email) for email in emails]
+    t_lista = time.perf_counter() - inicio
+    print("ListaDominios.contiene_email:      "
+          f"{len(emails) / t_lista:>12,.0f} emails/s")
+
+    solo_formato = ValidadorDatosContacto()
+    inicio = time.perf_counter()
+    formato = [solo_formato.validar_email(email) for email in emails]
+    t_formato = time.perf_counter() - inicio
+    validador = ValidadorContactoConDominios(bloqueados=lista)
+    inicio = time.perf_counter()
+    mascara = validador.validar_emails(emails)
+    t_validador = time.perf_counter() - inicio
+    print("validar_email (solo formato):      "
+          f"{len(emails) / t_formato:>12,.0f} emails/s")
+    print("ValidadorContactoConDominios:      "
+          f"{len(emails) / t_validador:>12,.0f} emails/s")
+
+    muestra = emails[:args.muestra_bucle]
+    inicio = time.perf_counter()
+    en_bucle = [bloqueado_en_bucle(email.rsplit("@", 1)[1].lower(), entradas)
+                for email in muestra]
+    t_bucle = time.perf_counter() - inicio
+    print("bucle sobre la lista (muestra):    "
+          f"{len(muestra) / t_bucle:>12,.1f} emails/s "
+          f"({t_bucle / len(muestra) / (t_lista / len(emails)):,.0f}x más lento)")
+
+    internados = [dominio_de(email) for email in emails]
+    sin_internar = [email.rsplit("@", 1)[1].lower() for email in emails]
+    print("cadenas de dominio en memoria: "
+          f"{len(set(map(id, internados))):,} internadas, "
+          f"{len(set(map(id, sin_internar))):,} sin internar")
+
+    correcto = (en_bucle == bloqueados[:len(muestra)]
+                and list(mascara) == [int(f and not b)
+                                      for f, b in zip(formato, bloqueados)]
+                and sum(bloqueados) >= len(emails) * 0.45)
+    print("resultados idénticos al bucle: " + ("sí" if correcto else "NO"))
+    return 0 if correcto else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Escalamiento de ValidadorConcurrente con la cantidad de hilos.
+
+Valida N filas en serie, con 1, 2, 4, ... hilos y con un pool de
+procesos del mismo tamaño, comprueba que todos los resultados sean
+idénticos a los de la validación en serie y reporta filas por segundo.
+Indica si el intérprete tiene GIL: los hilos solo escalan en una
+compilación sin GIL (python3.13t o posterior).
+
+Ejecutar desde la raíz del repositorio:
+    python benchmarks/bench_hilos.py --filas 500000 --hilos 1 2 4 8
+    python3.13t benchmarks/bench_hilos.py --filas 500000 --hilos 1 2 4 8
+"""
+
+import argparse
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from jorge_choque_pg2_tecba.concurrente import (  # noqa: E402
+    ValidadorConcurrente,
+    gil_habilitado,
+)
+from jorge_choque_pg2_tecba.esquema import validar_persona  # noqa: E402
+from jorge_choque_pg2_tecba.ingest import en_bloques, validar_filas  # noqa: E402
+from datos_sinteticos import GeneradorPersonas  # noqa: E402
+
+
+def resumen(resultado):
+    """Reduce un ResultadoValidacion a valores comparables."""
+    if resultado.persona is None:
+        return False, resultado.codigos
+    return True, tuple(resultado.persona.obtener_todos_los_datos().values())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de validación con hilos")
+    parser.add_argument("--filas", type=int, default=200_000)
+    parser.add_argument("--hilos", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--tamano-bloque", type=int, default=1_000)
+    parser.add_argument("--invalidos", type=float, default=0.2)
+    parser.add_argument("--sin-procesos", action="store_true",
+                        help="No medir el pool de procesos")
+    args = parser.parse_args()
+
+    filas = GeneradorPersonas(42, args.invalidos).filas(args.filas)
+    print(f"Python {platform.python_version()} ({sys.implementation.name}), "
+          f"GIL {'habilitado' if gil_habilitado() else 'deshabilitado'}, "
+          f"{os.cpu_count()} CPU")
+
+    inicio = time.perf_counter()
+    esperado = [resumen(validar_persona(fila)) for fila in filas]
+    serie = time.perf_counter() - inicio
+    print(f"{'serie':>12}: {args.filas / serie:>10,.0f} filas/s")
+
+    correcto = True
+    for hilos in args.hilos:
+        with ValidadorConcurrente(hilos, args.tamano_bloque) as validador:
+            inicio = time.perf_counter()
+            resultados = validador.validar(filas)
+            duracion = time.perf_counter() - inicio
+        iguales = [resumen(resultado) for resultado in resultados] == esperado
+        correcto &= iguales
+        print(f"{hilos:>4} hilos   : {args.filas / duracion:>10,.0f} filas/s "
+              f"({serie / duracion:.2f}x){'' if iguales else '  RESULTADOS DISTINTOS'}")
+
+        if args.sin_procesos:
+            continue
+        with ProcessPoolExecutor(max_workers=hilos) as pool:
+            inicio = time.perf_counter()
+            bloques = en_bloques(filas, args.tamano_bloque)
+            validos = sum(valido for bloque in pool.map(validar_filas, bloques)
+                          for valido, _ in bloque)
+            duracion = time.perf_counter() - inicio
+        correcto &= validos == sum(valido for valido, _ in esperado)
+        print(f"{hilos:>4} procesos: {args.filas / duracion:>10,.0f} filas/s "
+              f"({serie / duracion:.2f}x)")
+
+    print("resultados idénticos a la validación en serie: "
+          + ("sí" if correcto else "NO"))
+    return 0 if correcto else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
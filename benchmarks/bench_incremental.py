@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Ingesta incremental (CacheIncremental) frente a validar todo de nuevo.
+
+Genera un CSV de N filas y lo ingiere tres veces: sin caché, con la caché
+vacía (primera ingesta) y con la caché llena después de modificar una
+proporción de las filas (la ingesta del día siguiente). Verifica que las
+salidas sean idénticas a las de la ingesta sin caché y compara, aparte
+de la lectura y escritura de los CSV, validar todas las filas con
+resolverlas desde la caché.
+
+Ejecutar desde la raíz del repositorio:
+    python benchmarks/bench_incremental.py --filas 500000 --cambios 0.05
+"""
+
+import argparse
+import csv
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from jorge_choque_pg2_tecba.incremental import CacheIncremental  # noqa: E402
+from jorge_choque_pg2_tecba.ingest import ingerir, validar_filas  # noqa: E402
+from datos_sinteticos import CAMPOS, GeneradorPersonas  # noqa: E402
+
+
+def a_csv(filas) -> str:
+    salida = io.StringIO()
+    escritor = csv.DictWriter(salida, fieldnames=CAMPOS)
+    escritor.writeheader()
+    escritor.writerows(filas)
+    return salida.getvalue()
+
+
+def ingerir_texto(texto: str, procesos: int, cache=None):
+    validos, rechazados = io.StringIO(), io.StringIO()
+    inicio = time.perf_counter()
+    ingerir(io.StringIO(texto), validos, rechazados, "csv", procesos=procesos,
+            cache=cache)
+    return time.perf_counter() - inicio, validos.getvalue(), rechazados.getvalue()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de la ingesta incremental")
+    parser.add_argument("--filas", type=int, default=200_000)
+    parser.add_argument("--cambios", type=float, default=0.05,
+                        help="Proporción de filas modificadas en la segunda ingesta")
+    parser.add_argument("--invalidos", type=float, default=0.2)
+    parser.add_argument("--procesos", type=int, default=1)
+    parser.add_argument("--semilla", type=int, default=42)
+    args = parser.parse_args()
+
+    generador = GeneradorPersonas(args.semilla, args.invalidos)
+    filas = generador.filas(args.filas)
+    azar = random.Random(args.semilla)
+    modificadas = [dict(fila) for fila in filas]
+    for indice in azar.sample(range(args.filas), int(args.filas * args.cambios)):
+        modificadas[indice] = generador.fila()
+    dia1, dia2 = a_csv(filas), a_csv(modificadas)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "validacion.sqlite")
+        completo, *esperado1 = ingerir_texto(dia1, args.procesos)
+        completo2, *esperado2 = ingerir_texto(dia2, args.procesos)
+        with CacheIncremental(ruta) as cache:
+            primera, *salida1 = ingerir_texto(dia1, args.procesos, cache)
+        with CacheIncremental(ruta) as cache:
+            segunda, *salida2 = ingerir_texto(dia2, args.procesos, cache)
+            aciertos, fallos = cache.aciertos, cache.fallos
+            inicio = time.perf_counter()
+            cache.resolver(modificadas)
+            resolver = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        validar_filas(modificadas)
+        validar = time.perf_counter() - inicio
+        tamano = os.path.getsize(ruta)
+
+    iguales = salida1 == esperado1 and salida2 == esperado2
+    print(f"filas:                      {args.filas:,} "
+          f"({args.cambios:.0%} modificadas el día 2)")
+    print(f"sin caché:                  día 1 {completo:.2f} s, "
+          f"día 2 {completo2:.2f} s")
+    print(f"incremental, caché vacía:   {primera:.2f} s ({primera / completo:.2f}x)")
+    print(f"incremental, día 2:         {segunda:.2f} s "
+          f"({completo2 / segunda:.1f}x más rápido), "
+          f"{aciertos:,} reutilizadas, {fallos:,} validadas")
+    print(f"solo validación, por fila:  validar {validar / args.filas * 1e6:.1f} µs, "
+          f"resolver desde la caché {resolver / args.filas * 1e6:.1f} µs")
+    print(f"base SQLite:                {tamano / 1e6:.1f} MB")
+    print(f"salidas idénticas:          {'sí' if iguales else 'NO'}")
+    return 0 if iguales else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Comparación de rendimiento entre los validadores escalares y ValidadorLote.
+
+Ejecutar desde la raíz del repositorio:
+    python benchmarks/bench_lote.py [filas]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from jorge_choque_pg2_tecba.validators import (  # noqa: E402
+    ValidadorDatosPersonales,
+    ValidadorDatosContacto,
+    ValidadorLote,
+)
+from datos_sinteticos import GeneradorPersonas  # noqa: E402
+
+
+def medir(funcion, *args, repeticiones: int = 3) -> tuple:
+    """Ejecuta la función varias veces; devuelve (resultado, mejor tiempo en s)."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion(*args)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return resultado, mejor
+
+
+def main() -> None:
+    filas = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    columnas = GeneradorPersonas(semilla=42, proporcion_invalidos=0.2).columnas(filas)
+    personales = ValidadorDatosPersonales()
+    contacto = ValidadorDatosContacto()
+    lote = ValidadorLote()
+
+    casos = [
+        ("nombre", personales.validar_nombre, lote.validar_nombres),
+        ("edad", personales.validar_edad, lote.validar_edades),
+        ("documento_identidad", personales.validar_documento_identidad,
+         lote.validar_documentos),
+        ("email", contacto.validar_email, lote.validar_emails),
+        ("celular", contacto.validar_celular, lote.validar_celulares),
+        ("direccion", contacto.validar_direccion, lote.validar_direcciones),
+    ]
+
+    print(f"{'campo':<20} {'escalar (filas/s)':>18} {'lote (filas/s)':>16} "
+          f"{'mejora':>8}")
+    for campo, escalar, por_lote in casos:
+        valores = columnas[campo]
+        esperado, t_escalar = medir(lambda v: [escalar(x) for x in v], valores)
+        mascara, t_lote = medir(por_lote, valores)
+        assert list(map(bool, mascara)) == esperado, f"diferencia en {campo}"
+        print(f"{campo:<20} {filas / t_escalar:>18,.0f} {filas / t_lote:>16,.0f} "
+              f"{t_escalar / t_lote:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
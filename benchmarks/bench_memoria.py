@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Memoria por instancia de Persona medida con tracemalloc.
+
+Compara la Persona actual (__slots__ y validadores compartidos) con una
+réplica del diseño anterior (__dict__ por instancia y dos validadores
+nuevos por cada Persona).
+
+Ejecutar desde la raíz del repositorio:
+    python benchmarks/bench_memoria.py [instancias]
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from jorge_choque_pg2_tecba.core import Persona  # noqa: E402
+from jorge_choque_pg2_tecba.validators import (  # noqa: E402
+    ValidadorDatosPersonales,
+    ValidadorDatosContacto,
+)
+
+
+class PersonaConDict(Persona):
+    """Réplica del diseño anterior: __dict__ y validadores por instancia."""
+
+    def __init__(self):
+        super().__init__()
+        self._validador_personales = ValidadorDatosPersonales()
+        self._validador_contacto = ValidadorDatosContacto()
+
+
+def construir(clase, indice: int):
+    """Construye una persona completa con datos que varían por fila."""
+    return (clase()
+            .establecer_nombre("María José Gutiérrez")
+            .establecer_edad(indice % 100)
+            .establecer_documento_identidad(str(10_000_000 + indice))
+            .establecer_email(f"persona{indice}@correo.bo")
+            .establecer_celular(f"7{indice % 10_000_000:07d}")
+            .establecer_direccion("Av. Ballivián 1234, Cochabamba")
+            .construir())
+
+
+def bytes_por_instancia(clase, instancias: int) -> float:
+    """Mide los bytes retenidos por instancia tras construir `instancias` personas."""
+    gc.collect()
+    tracemalloc.start()
+    antes = tracemalloc.take_snapshot()
+    personas = [construir(clase, i) for i in range(instancias)]
+    despues = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in despues.compare_to(antes, "filename"))
+    del personas
+    return total / instancias
+
+
+def main() -> None:
+    instancias = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    anterior = bytes_por_instancia(PersonaConDict, instancias)
+    actual = bytes_por_instancia(Persona, instancias)
+    print(f"instancias: {instancias:,}")
+    print("antes (__dict__ + validadores por instancia): "
+          f"{anterior:8.1f} bytes/persona")
+    print("ahora (__slots__ + validadores compartidos):  "
+          f"{actual:8.1f} bytes/persona")
+    print(f"ahorro: {anterior - actual:.1f} bytes/persona "
+          f"({1 - actual / anterior:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Verificación diferencial y rendimiento del motor de clases de caracteres.
+
+Compara validar_solo_letras, validar_alfanumerico, validar_email (también
+en modo seguro) y validar_direccion con los patrones re.match originales:
+- cada punto de código Unicode, solo y rodeado de letras válidas;
+- cadenas aleatorias que mezclan caracteres válidos e inválidos;
+- una mezcla típica de nombres y direcciones, que además se cronometra.
+
+Ejecutar desde la raíz del repositorio:
+    python benchmarks/bench_motor.py [repeticiones]
+"""
+
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from jorge_choque_pg2_tecba.validators import (  # noqa: E402
+    ValidadorBase,
+    ValidadorDatosPersonales,
+    ValidadorDatosContacto,
+)
+
+# Implementaciones de referencia: las reglas originales con re.match
+PATRON_LETRAS = r'^[a-zA-ZáéíóúÁÉÍÓÚñÑüÜ\s]+$'
+PATRON_ALFANUMERICO = r'^[a-zA-Z0-9áéíóúÁÉÍÓÚñÑüÜ\s]+$'
+PATRON_EMAIL = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+PATRON_DIRECCION = r'^[a-zA-Z0-9áéíóúÁÉÍÓÚñÑüÜ\s.,#-]+$'
+
+
+def referencia_letras(valor):
+    return bool(valor) and bool(re.match(PATRON_LETRAS, valor))
+
+
+def referencia_alfanumerico(valor):
+    return bool(valor) and bool(re.match(PATRON_ALFANUMERICO, valor))
+
+
+def referencia_email(email):
+    return bool(email) and bool(re.match(PATRON_EMAIL, email)) and len(email) <= 100
+
+
+def referencia_direccion(direccion):
+    if not direccion or len(direccion.strip()) < 5:
+        return False
+    limpia = ' '.join(direccion.split())
+    return bool(re.match(PATRON_DIRECCION, limpia)) and 5 <= len(limpia) <= 200
+
+
+CONTACTO = ValidadorDatosContacto()
+CONTACTO_SEGURO = ValidadorDatosContacto(modo_seguro=True)
+PARES = [
+    ("validar_solo_letras", ValidadorBase.validar_solo_letras, referencia_letras),
+    ("validar_alfanumerico", ValidadorBase.validar_alfanumerico,
+     referencia_alfanumerico),
+    ("validar_email", CONTACTO.validar_email, referencia_email),
+    ("validar_email (modo seguro)", CONTACTO_SEGURO.validar_email, referencia_email),
+    ("validar_direccion", CONTACTO.validar_direccion, referencia_direccion),
+]
+
+
+def casos_diferenciales(semilla: int = 7):
+    """Genera las cadenas usadas en la verificación diferencial."""
+    for codigo in range(sys.maxunicode + 1):
+        if 0xD800 <= codigo <= 0xDFFF:
+            continue
+        caracter = chr(codigo)
+        yield caracter
+        yield f"Calle{caracter}ñ 12"
+        yield f"ana{caracter}@correo.bo"
+
+    azar = random.Random(semilla)
+    alfabeto = "aZñÁü09 .,#-@_%+\t\n\r\x0b 　éx!?/\\()[]"
+    for _ in range(200_000):
+        yield "".join(azar.choice(alfabeto) for _ in range(azar.randint(0, 24)))
+
+    # Emails casi válidos: mismas piezas, distinto orden y cantidad
+    piezas = "ab.Z9_%+-@.\nñ"
+    for _ in range(200_000):
+        yield ("".join(azar.choice(piezas) for _ in range(azar.randint(0, 6)))
+               + azar.choice(["@", "", "@@"])
+               + "".join(azar.choice(piezas) for _ in range(azar.randint(0, 8))))
+    yield "ana@correo.bo\n"
+    yield "ana@correo.bo\n\n"
+    yield "ana@.bo"
+    yield "ana@correo."
+    yield "ana@correo.b"
+    yield "a" * 60 + "@correo.bo"
+    yield "a" * 95 + "@c.bo"
+
+
+def verificar() -> int:
+    """Verifica que cada validador acepte y rechace lo mismo que su referencia."""
+    casos = 0
+    for valor in casos_diferenciales():
+        casos += 1
+        for nombre, actual, referencia in PARES:
+            if actual(valor) != referencia(valor):
+                raise AssertionError(f"{nombre} difiere para {valor!r}")
+    return casos
+
+
+def cronometrar(funcion, valores, repeticiones: int) -> float:
+    """Devuelve los nanosegundos por valor de la mejor de varias repeticiones."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter_ns()
+        for valor in valores:
+            funcion(valor)
+        mejor = min(mejor, time.perf_counter_ns() - inicio)
+    return mejor / len(valores)
+
+
+def main() -> None:
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"verificación diferencial: {verificar():,} cadenas sin diferencias")
+
+    azar = random.Random(1)
+    nombres = ["Juan Carlos Pérez", "María José Gutiérrez", "Ñuflo Chávez", "Ana123"]
+    calles = ["Av. Blanco Galindo Km 5", "Calle 25 de Mayo #345", "Zona Sur, Calle 21"]
+    mezcla_nombres = [azar.choice(nombres) for _ in range(50_000)]
+    mezcla_direcciones = [azar.choice(calles) for _ in range(50_000)]
+    mezcla_emails = [f"usuario{i}@correo.com.bo" for i in range(50_000)]
+    personales = ValidadorDatosPersonales()
+
+    filas = [
+        ("validar_solo_letras", ValidadorBase.validar_solo_letras, referencia_letras,
+         mezcla_nombres),
+        ("validar_nombre", personales.validar_nombre,
+         lambda n: bool(n) and len(n.strip()) >= 2
+         and referencia_letras(' '.join(n.split())), mezcla_nombres),
+        ("validar_direccion", CONTACTO.validar_direccion, referencia_direccion,
+         mezcla_direcciones),
+        ("validar_email", CONTACTO.validar_email, referencia_email, mezcla_emails),
+        ("validar_email seguro", CONTACTO_SEGURO.validar_email, referencia_email,
+         mezcla_emails),
+    ]
+    print(f"{'método':<22} {'re.match (ns)':>14} {'actual (ns)':>12} {'mejora':>8}")
+    for nombre, actual, referencia, valores in filas:
+        t_referencia = cronometrar(referencia, valores, repeticiones)
+        t_actual = cronometrar(actual, valores, repeticiones)
+        print(f"{nombre:<22} {t_referencia:>14.0f} {t_actual:>12.0f} "
+              f"{t_referencia / t_actual:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Enlace aproximado de nombres con IndiceNombres.
+
+Indexa N nombres sintéticos (apellidos inventados a partir de sílabas,
+para tener la variedad de un padrón real), busca versiones alteradas de
+una muestra (sin acentos, en mayúsculas, con una letra cambiada o con
+las palabras en otro orden) y reporta el tiempo de construcción, las
+consultas por segundo y la proporción de nombres originales encontrados.
+Con una muestra pequeña también verifica el resultado contra la
+comparación de todos los pares.
+
+Ejecutar desde la raíz del repositorio:
+    python benchmarks/bench_nombres.py --nombres 1000000 --consultas 5000
+    python benchmarks/bench_nombres.py --nombres 1000000 --bloqueo fonetico
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from jorge_choque_pg2_tecba.nombres import (  # noqa: E402
+    IndiceNombres,
+    plegar,
+    trigramas,
+)
+from datos_sinteticos import APELLIDOS, NOMBRES  # noqa: E402
+
+SILABAS = ["ba", "ca", "cho", "da", "fe", "gue", "hua", "ja", "ki", "la", "lla", "ma",
+           "mi", "na", "ña", "pa", "que", "ra", "rro", "sa", "ta", "ti", "va", "ya",
+           "za", "bel", "cón", "dín", "gal", "lán", "mén", "nez", "rez", "sán", "tos"]
+
+
+def generar_nombres(cantidad: int, semilla: int):
+    azar = random.Random(semilla)
+    apellidos = list(APELLIDOS)
+    apellidos += ["".join(azar.choice(SILABAS)
+                          for _ in range(azar.randint(2, 4))).title()
+                  for _ in range(max(cantidad // 20, 1000))]
+    return [" ".join(azar.sample(NOMBRES, azar.choice((1, 2)))
+                     + azar.sample(apellidos, 2))
+            for _ in range(cantidad)]
+
+
+def alterar(nombre: str, azar: random.Random) -> str:
+    opcion = azar.randrange(4)
+    if opcion == 0:
+        return plegar(nombre)
+    if opcion == 1:
+        return nombre.upper()
+    if opcion == 2:
+        posicion = azar.randrange(len(nombre))
+        return nombre[:posicion] + azar.choice("aeiourstln") + nombre[posicion + 1:]
+    palabras = nombre.split()
+    return " ".join(palabras[-2:] + palabras[:-2])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de IndiceNombres")
+    parser.add_argument("--nombres", type=int, default=200_000)
+    parser.add_argument("--consultas", type=int, default=2_000)
+    parser.add_argument("--umbral", type=float, default=0.8)
+    parser.add_argument("--fonetico", action="store_true")
+    parser.add_argument("--bloqueo", choices=IndiceNombres.BLOQUEOS,
+                        default="trigramas")
+    parser.add_argument("--semilla", type=int, default=42)
+    args = parser.parse_args()
+
+    nombres = generar_nombres(args.nombres, args.semilla)
+    inicio = time.perf_counter()
+    indice = IndiceNombres(fonetico=args.fonetico, bloqueo=args.bloqueo)
+    for nombre in nombres:
+        indice.agregar(nombre)
+    construccion = time.perf_counter() - inicio
+
+    azar = random.Random(args.semilla + 1)
+    muestra = [azar.randrange(len(nombres)) for _ in range(args.consultas)]
+    consultas = [alterar(nombres[i], azar) for i in muestra]
+    inicio = time.perf_counter()
+    encontrados = 0
+    for posicion, consulta in zip(muestra, consultas):
+        coincidencias = indice.buscar(consulta, args.umbral, limite=10)
+        encontrados += any(plegar(c.nombre) == plegar(nombres[posicion])
+                           for c in coincidencias)
+    busqueda = time.perf_counter() - inicio
+
+    print(f"{indice!r}")
+    print(f"construcción: {construccion:.1f} s "
+          f"({args.nombres / construccion:,.0f} nombres/s)")
+    print(f"consultas:    {args.consultas / busqueda:,.0f} por segundo "
+          f"({busqueda / args.consultas * 1e3:.2f} ms cada una)")
+    print(f"encontrados:  {encontrados / args.consultas:.1%} con umbral {args.umbral}")
+    print(f"estimado para enlazar todos los nombres: "
+          f"{args.nombres * busqueda / args.consultas / 60:.1f} min")
+
+    # Verificación contra la comparación de todos los pares en una muestra
+    base = nombres[:2_000]
+    pequeno = IndiceNombres()
+    for nombre in base:
+        pequeno.agregar(nombre)
+    gramas = [set(trigramas(plegar(nombre))) for nombre in base]
+    for consulta in consultas[:100]:
+        buscados = set(trigramas(plegar(consulta)))
+        esperado = sorted(
+            ((2 * len(buscados & g) / (len(buscados) + len(g)), -i)
+             for i, g in enumerate(gramas)
+             if 2 * len(buscados & g) / (len(buscados) + len(g)) >= args.umbral),
+            reverse=True)[:10]
+        obtenido = [(c.similitud, -c.identificador)
+                    for c in pequeno.buscar(consulta, args.umbral, limite=10)]
+        if obtenido != esperado:
+            print(f"DIFERENCIA con la comparación exhaustiva: {consulta!r}")
+            return 1
+    print("verificación contra la comparación de todos los pares: OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+PlanificadorValidacion frente al orden fijo de los setters.
+
+Genera filas donde los celulares y los emails fallan mucho más que los
+nombres (la proporción de inválidos por campo se configura) y mide
+registros por segundo para obtener solo el veredicto válido/inválido:
+validar_persona completo, el veredicto compilado en el orden del
+esquema y el planificador adaptativo. Verifica que los tres coincidan y
+muestra el plan elegido con sus estadísticas.
+
+Ejecutar desde la raíz del repositorio:
+    python benchmarks/bench_planificador.py --filas 500000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from jorge_choque_pg2_tecba.esquema import (  # noqa: E402
+    ESQUEMA_PERSONA,
+    validar_persona,
+)
+from jorge_choque_pg2_tecba.planificador import PlanificadorValidacion  # noqa: E402
+from datos_sinteticos import CAMPOS, INVALIDOS, GeneradorPersonas  # noqa: E402
+
+# Proporción de filas con cada campo inválido
+FALLOS_POR_CAMPO = {
+    "nombre": 0.01,
+    "edad": 0.02,
+    "documento_identidad": 0.03,
+    "email": 0.15,
+    "celular": 0.20,
+    "direccion": 0.02,
+}
+
+
+def generar(cantidad: int, semilla: int):
+    azar = random.Random(semilla)
+    filas = GeneradorPersonas(semilla).filas(cantidad)
+    for fila in filas:
+        for campo in CAMPOS:
+            if azar.random() < FALLOS_POR_CAMPO[campo]:
+                fila[campo] = azar.choice([v for v in INVALIDOS[campo] if v]
+                                          if campo == "nombre" else INVALIDOS[campo])
+    return filas
+
+
+def medir(funcion, filas):
+    inicio = time.perf_counter()
+    resultado = [funcion(fila) for fila in filas]
+    return resultado, time.perf_counter() - inicio
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark del planificador de validación")
+    parser.add_argument("--filas", type=int, default=200_000)
+    parser.add_argument("--semilla", type=int, default=42)
+    args = parser.parse_args()
+
+    filas = generar(args.filas, args.semilla)
+    completo, t_completo = medir(lambda fila: validar_persona(fila).valido, filas)
+    fijo, t_fijo = medir(ESQUEMA_PERSONA.compilar_veredicto(), filas)
+    planificador = PlanificadorValidacion()
+    medir(planificador.es_valido, filas[:20_000])   # calentamiento: aprende el plan
+    adaptativo, t_adaptativo = medir(planificador.es_valido, filas)
+
+    n = args.filas
+    print(f"filas: {n:,}, válidas: {sum(completo) / n:.1%}")
+    print(f"validar_persona completo:     {n / t_completo:>10,.0f} registros/s")
+    print(f"veredicto, orden del esquema: {n / t_fijo:>10,.0f} registros/s "
+          f"({t_completo / t_fijo:.2f}x)")
+    print(f"veredicto, planificador:      {n / t_adaptativo:>10,.0f} registros/s "
+          f"({t_completo / t_adaptativo:.2f}x)")
+    print(f"plan: {' -> '.join(planificador.plan)} "
+          f"({planificador.muestras:,} muestras, "
+          f"{planificador.replanificaciones} cambios)")
+    for estadistica in planificador.estadisticas():
+        print(f"  {estadistica.campo:<20} fallos {estadistica.tasa_fallos:6.1%}  "
+              f"costo {estadistica.costo_ns:7.0f} ns  "
+              f"prioridad {estadistica.prioridad:10.0f}")
+    iguales = completo == fijo == adaptativo
+    print(f"veredictos idénticos: {'sí' if iguales else 'NO'}")
+    return 0 if iguales else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
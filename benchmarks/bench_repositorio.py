@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+RepositorioPersonas frente a una escritura por persona.
+
+Guarda N personas válidas en SQLite de dos formas: una sentencia y un
+commit por persona con los dicts de obtener_todos_los_datos() (sobre una
+muestra), y RepositorioPersonas.insertar por lotes. Mide también el
+upsert, la lectura en streaming como Persona y como PersonaTabla, y las
+búsquedas por documento desde varios hilos. Comprueba que las personas
+leídas sean idénticas a las guardadas.
+
+Ejecutar desde la raíz del repositorio:
+    python benchmarks/bench_repositorio.py --personas 1000000
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from jorge_choque_pg2_tecba.core import Persona  # noqa: E402
+from jorge_choque_pg2_tecba.registro import normalizar_documento  # noqa: E402
+from jorge_choque_pg2_tecba.repositorio import RepositorioPersonas  # noqa: E402
+from datos_sinteticos import GeneradorPersonas  # noqa: E402
+
+
+def una_por_una(ruta: str, personas) -> float:
+    """Una sentencia INSERT y un commit por persona, como antes."""
+    conexion = sqlite3.connect(ruta)
+    conexion.execute("PRAGMA journal_mode=WAL")
+    conexion.execute("CREATE TABLE personas (nombre TEXT, edad INTEGER, "
+                     "documento_identidad TEXT, email TEXT, celular TEXT, "
+                     "direccion TEXT)")
+    inicio = time.perf_counter()
+    for persona in personas:
+        datos = persona.obtener_todos_los_datos()
+        conexion.execute("INSERT INTO personas VALUES (:nombre, :edad, "
+                         ":documento_identidad, :email, :celular, :direccion)",
+                         datos)
+        conexion.commit()
+    duracion = time.perf_counter() - inicio
+    conexion.close()
+    return duracion
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark del repositorio SQLite")
+    parser.add_argument("--personas", type=int, default=200_000)
+    parser.add_argument("--muestra", type=int, default=5_000,
+                        help="Personas escritas una por una")
+    parser.add_argument("--hilos", type=int, default=4)
+    parser.add_argument("--busquedas", type=int, default=20_000)
+    args = parser.parse_args()
+
+    personas, documentos = [], set()
+    for fila in GeneradorPersonas(42).iterar(args.personas):
+        clave = normalizar_documento(fila["documento_identidad"])
+        if clave not in documentos:
+            documentos.add(clave)
+            personas.append(Persona.desde_dict(fila))
+    n = len(personas)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        muestra = personas[:args.muestra]
+        t_una = una_por_una(os.path.join(directorio, "una.sqlite"), muestra)
+        print(f"una por una (muestra de {len(muestra):,}): "
+              f"{len(muestra) / t_una:>10,.0f} filas/s")
+
+        with RepositorioPersonas(os.path.join(directorio, "personas.sqlite"),
+                                 lectores=args.hilos) as repositorio:
+            inicio = time.perf_counter()
+            repositorio.insertar(personas)
+            t_insertar = time.perf_counter() - inicio
+            print(f"insertar por lotes ({n:,}):      {n / t_insertar:>10,.0f} filas/s "
+                  f"({t_una / len(muestra) * n / t_insertar:.0f}x); "
+                  f"10M filas en ~{1e7 / (n / t_insertar) / 60:.1f} min")
+
+            cambios = [persona.reemplazar(direccion="Calle Nueva 123")
+                       for persona in personas[::10]]
+            inicio = time.perf_counter()
+            repositorio.guardar(cambios)
+            t_guardar = time.perf_counter() - inicio
+            print(f"guardar (upsert, {len(cambios):,}):     "
+                  f"{len(cambios) / t_guardar:>10,.0f} filas/s")
+            for i in range(0, n, 10):
+                personas[i] = cambios[i // 10]
+
+            inicio = time.perf_counter()
+            leidas = list(repositorio.iterar())
+            t_iterar = time.perf_counter() - inicio
+            print(f"iterar como Persona:           {n / t_iterar:>10,.0f} filas/s")
+            inicio = time.perf_counter()
+            filas_tablas = sum(len(tabla) for tabla in repositorio.iterar_lotes())
+            t_lotes = time.perf_counter() - inicio
+            print(f"iterar como PersonaTabla:      {n / t_lotes:>10,.0f} filas/s")
+
+            azar = random.Random(7)
+            buscados = [azar.choice(personas).documento_identidad
+                        for _ in range(args.busquedas)]
+            inicio = time.perf_counter()
+            with ThreadPoolExecutor(args.hilos) as pool:
+                encontrados = sum(persona is not None for persona in
+                                  pool.map(repositorio.buscar_por_documento, buscados,
+                                           chunksize=256))
+            t_buscar = time.perf_counter() - inicio
+            print(f"buscar_por_documento ({args.hilos} hilos): "
+                  f"{args.busquedas / t_buscar:>10,.0f} consultas/s")
+
+            iguales = (len(repositorio) == n == filas_tablas
+                       and encontrados == args.busquedas
+                       and all(a.obtener_todos_los_datos()
+                               == b.obtener_todos_los_datos()
+                               for a, b in zip(personas, leidas)))
+    print("datos leídos idénticos a los guardados: " + ("sí" if iguales else "NO"))
+    return 0 if iguales else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
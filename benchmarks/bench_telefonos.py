@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Normalización de celulares a E.164 con el trie de telefonos.py.
+
+Normaliza N celulares sintéticos (bolivianos en los formatos
+'71234567', '+591 71234567', '7123-4567' y '(591) 712 34567') y mide
+números por segundo con ValidadorDatosContacto.normalizar_e164 uno por
+uno, con ValidadorLote.normalizar_celulares y, como referencia, con la
+limpieza de normalizar_celular que no produce una forma canónica.
+Comprueba que todos los formatos de un mismo número den la misma clave
+y una lista de casos de otras regiones.
+
+Ejecutar desde la raíz del repositorio:
+    python benchmarks/bench_telefonos.py --celulares 1000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from jorge_choque_pg2_tecba.validators import (  # noqa: E402
+    ValidadorDatosContacto,
+    ValidadorLote,
+)
+from datos_sinteticos import GeneradorPersonas  # noqa: E402
+
+# (celular, región, E.164 esperado)
+CASOS = [
+    ("71234567", "BO", "+59171234567"),
+    ("+591 7123-4567", "BO", "+59171234567"),
+    ("(591) 712 34567", "BO", "+59171234567"),
+    ("00591 71234567", "BO", "+59171234567"),
+    ("21234567", "BO", None),            # fijo de La Paz, no es celular
+    ("7123456", "BO", None),
+    ("+1 (415) 555-2671", "BO", "+14155552671"),
+    ("415 555 2671", "US", "+14155552671"),
+    ("+54 9 11 1234-5678", "BO", "+5491112345678"),
+    ("612 345 678", "ES", "+34612345678"),
+    ("07911 123456", "GB", "+447911123456"),
+    ("0171 2345678", "DE", "+491712345678"),
+    ("+999 12345678", "BO", None),       # código de país desconocido
+    ("٧١٢٣٤٥٦٧", "BO", None),
+]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de la normalización E.164")
+    parser.add_argument("--celulares", type=int, default=500_000)
+    args = parser.parse_args()
+
+    generador = GeneradorPersonas(42)
+    celulares = [generador.celular() for _ in range(args.celulares)]
+    n = len(celulares)
+    normalizar = ValidadorDatosContacto.normalizar_e164
+    limpiar = ValidadorDatosContacto.normalizar_celular
+
+    inicio = time.perf_counter()
+    limpios = [limpiar(c) for c in celulares]
+    t_limpiar = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    uno_a_uno = [normalizar(c) for c in celulares]
+    t_uno = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    lote = ValidadorLote().normalizar_celulares(celulares)
+    t_lote = time.perf_counter() - inicio
+
+    print(f"normalizar_celular (sin forma canónica): {n / t_limpiar:>12,.0f} números/s")
+    print(f"normalizar_e164 uno por uno:             {n / t_uno:>12,.0f} números/s")
+    print(f"ValidadorLote.normalizar_celulares:      {n / t_lote:>12,.0f} números/s")
+    print(f"claves distintas: {len(set(limpios)):,} limpiando, "
+          f"{len(set(uno_a_uno)):,} en E.164")
+
+    # Cada número sintético, sin importar el formato, debe dar +591 y sus 8 dígitos
+    correcto = uno_a_uno == lote and all(
+        e164 == "+591" + limpio[-8:] for e164, limpio in zip(uno_a_uno, limpios))
+    for celular, region, esperado in CASOS:
+        obtenido = normalizar(celular, region)
+        if obtenido != esperado:
+            correcto = False
+            print(f"  {celular!r} ({region}): {obtenido!r}, se esperaba {esperado!r}")
+    print("normalización correcta: " + ("sí" if correcto else "NO"))
+    return 0 if correcto else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Prueba de carga del servidor de validación en localhost.
+
+Inicia el servidor en un subproceso (o usa uno ya iniciado con --puerto),
+abre varias conexiones keep-alive concurrentes que envían registros
+sintéticos a POST /validar durante un tiempo fijo, y reporta el
+throughput, las latencias p50/p99/p99.9/máxima y las respuestas 503.
+
+Ejecutar desde la raíz del repositorio:
+    python benchmarks/carga_servidor.py --conexiones 64 --segundos 10
+    # sin micro-lotes
+    python benchmarks/carga_servidor.py --lote-maximo 1 --espera-ms 0
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from datos_sinteticos import GeneradorPersonas  # noqa: E402
+
+RAIZ = os.path.join(os.path.dirname(__file__), "..")
+
+
+async def _peticion(lector, escritor, cuerpo: bytes) -> int:
+    escritor.write(b"POST /validar HTTP/1.1\r\nHost: localhost\r\n"
+                   b"Content-Type: application/json\r\n"
+                   + f"Content-Length: {len(cuerpo)}\r\n\r\n".encode() + cuerpo)
+    await escritor.drain()
+    cabecera = await lector.readuntil(b"\r\n\r\n")
+    estado = int(cabecera.split(b" ", 2)[1])
+    longitud = 0
+    for linea in cabecera.split(b"\r\n"):
+        if linea.lower().startswith(b"content-length:"):
+            longitud = int(linea.split(b":", 1)[1])
+    await lector.readexactly(longitud)
+    return estado
+
+
+async def _conexion(puerto: int, cuerpos, fin: float, latencias, estados) -> None:
+    lector, escritor = await asyncio.open_connection("127.0.0.1", puerto)
+    reloj = time.perf_counter
+    indice = 0
+    try:
+        while reloj() < fin:
+            inicio = reloj()
+            estado = await _peticion(lector, escritor, cuerpos[indice % len(cuerpos)])
+            latencias.append(reloj() - inicio)
+            estados[estado] = estados.get(estado, 0) + 1
+            indice += 1
+    finally:
+        escritor.close()
+
+
+async def _cargar(puerto: int, conexiones: int, segundos: float, cuerpos):
+    latencias, estados = [], {}
+    fin = time.perf_counter() + segundos
+    inicio = time.perf_counter()
+    await asyncio.gather(*(_conexion(puerto, cuerpos[i::conexiones], fin,
+                                     latencias, estados)
+                           for i in range(conexiones)))
+    return latencias, estados, time.perf_counter() - inicio
+
+
+def _percentil(valores, proporcion: float) -> float:
+    return valores[min(len(valores) - 1, int(len(valores) * proporcion))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Prueba de carga del servidor de validación")
+    parser.add_argument("--puerto", type=int, default=None,
+                        help="Puerto de un servidor ya iniciado "
+                             "(por defecto se inicia uno)")
+    parser.add_argument("--conexiones", type=int, default=32)
+    parser.add_argument("--segundos", type=float, default=5.0)
+    parser.add_argument("--registros-por-peticion", type=int, default=1)
+    parser.add_argument("--invalidos", type=float, default=0.2)
+    parser.add_argument("--lote-maximo", type=int, default=256)
+    parser.add_argument("--espera-ms", type=float, default=2.0)
+    parser.add_argument("--trabajadores", type=int, default=None)
+    parser.add_argument("--hilos", action="store_true")
+    args = parser.parse_args()
+
+    generador = GeneradorPersonas(42, args.invalidos)
+    por_peticion = args.registros_por_peticion
+    cuerpos = []
+    for _ in range(2_000):
+        filas = generador.filas(por_peticion)
+        cuerpos.append(json.dumps(filas[0] if por_peticion == 1 else filas).encode())
+
+    proceso = None
+    puerto = args.puerto
+    if puerto is None:
+        comando = [sys.executable, "-m", "jorge_choque_pg2_tecba.servidor",
+                   "--puerto", "0", "--lote-maximo", str(args.lote_maximo),
+                   "--espera-ms", str(args.espera_ms)]
+        if args.trabajadores:
+            comando += ["--trabajadores", str(args.trabajadores)]
+        if args.hilos:
+            comando.append("--hilos")
+        entorno = dict(os.environ, PYTHONPATH=os.path.join(RAIZ, "src"))
+        proceso = subprocess.Popen(comando, env=entorno, stdout=subprocess.PIPE,
+                                   text=True)
+        # El servidor imprime "Escuchando en http://host:puerto" al estar listo
+        linea = proceso.stdout.readline()
+        if not linea:
+            print("El servidor no pudo iniciarse.", file=sys.stderr)
+            return 1
+        puerto = int(linea.rsplit(":", 1)[1])
+    try:
+        latencias, estados, duracion = asyncio.run(
+            _cargar(puerto, args.conexiones, args.segundos, cuerpos))
+    finally:
+        if proceso is not None:
+            proceso.terminate()
+            proceso.wait()
+
+    latencias.sort()
+    total = len(latencias)
+    print(f"peticiones:  {total:,} en {duracion:.1f} s "
+          f"con {args.conexiones} conexiones")
+    print(f"throughput:  {total / duracion:,.0f} peticiones/s "
+          f"({total * por_peticion / duracion:,.0f} registros/s)")
+    print("latencia ms: " + "  ".join(
+        f"{nombre}={_percentil(latencias, p) * 1e3:.2f}"
+        for nombre, p in (("p50", 0.5), ("p99", 0.99), ("p99.9", 0.999), ("max", 1.0))))
+    print(f"estados:     {dict(sorted(estados.items()))}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
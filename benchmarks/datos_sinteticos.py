@@ -0,0 +1,164 @@
+"""
+Generador reproducible de datos sintéticos de personas.
+
+Produce filas con nombres en español (con acentos y ñ), documentos de
+identidad al estilo boliviano, celulares, emails y direcciones. Una
+proporción configurable de filas tiene exactamente un campo inválido.
+
+Ejemplo:
+    >>> generador = GeneradorPersonas(semilla=42, proporcion_invalidos=0.3)
+    >>> filas = generador.filas(1000)
+"""
+
+import random
+import unicodedata
+from typing import Dict, Iterator, List
+
+
+NOMBRES = [
+    "Juan", "José", "Luis", "Carlos", "Jorge", "Álvaro", "Andrés", "Nicolás",
+    "Sebastián", "Martín", "Iván", "Rubén", "Raúl", "Óscar", "Ramón", "Germán",
+    "María", "Ana", "Lucía", "Sofía", "Valeria", "Camila", "Mónica", "Verónica",
+    "Inés", "Begoña", "Noelia", "Rocío", "Jimena", "Pamela", "Gabriela", "Fátima",
+]
+
+APELLIDOS = [
+    "Pérez", "González", "Rodríguez", "Fernández", "López", "Martínez", "Sánchez",
+    "Gutiérrez", "Choque", "Mamani", "Quispe", "Condori", "Flores", "Vargas",
+    "Ñuflo", "Chávez", "Rojas", "Suárez", "Gómez", "Núñez", "Ibáñez", "Peña",
+    "Castaño", "Muñoz", "Ortúzar", "Céspedes", "Arancibia", "Villarroel",
+]
+
+CIUDADES = ["La Paz", "Cochabamba", "Santa Cruz", "Sucre", "Oruro", "Potosí",
+            "Tarija", "Trinidad", "Cobija", "El Alto"]
+
+VIAS = ["Av.", "Calle", "Pasaje", "Avenida", "Zona"]
+
+NOMBRES_VIA = ["6 de Agosto", "Ballivián", "Blanco Galindo", "Heroínas", "Sucre",
+               "Ayacucho", "Jordán", "América", "Arce", "Camacho", "Potosí"]
+
+DOMINIOS = ["gmail.com", "hotmail.com", "yahoo.es", "outlook.com", "entel.bo",
+            "tecba.edu.bo", "correo.gob.bo", "empresa.com.bo"]
+
+# Valores inválidos por campo, para las filas sucias
+INVALIDOS = {
+    "nombre": ["J", "Juan123", "María_José", "", "Ana@Pérez", "X" * 60],
+    "edad": ["-1", "151", "200", "abc", "", "25.5"],
+    "documento_identidad": ["12345", "1234567LP", "ABC1234", "1234567890123", ""],
+    "email": ["sin_arroba.com", "ana@", "@correo.bo", "ana@correo", "ana @correo.bo",
+              "a" * 95 + "@c.com"],
+    "celular": ["123", "7123456a", "+591 7123", "1234567890123456", "71-23-ab"],
+    "direccion": ["Av.", "Calle 1 N° 23", "Casa!!", "Zona Sur ~ 5", ""],
+}
+
+CAMPOS = ("nombre", "edad", "documento_identidad", "email", "celular", "direccion")
+
+
+def _sin_acentos(texto: str) -> str:
+    """Elimina los acentos y la ñ para construir emails ASCII."""
+    descompuesto = unicodedata.normalize("NFKD", texto)
+    return "".join(c for c in descompuesto if not unicodedata.combining(c))
+
+
+class GeneradorPersonas:
+    """
+    Generador de filas sintéticas de personas.
+    
+    Con la misma semilla produce siempre las mismas filas, de modo que los
+    resultados de distintas versiones se pueden comparar.
+    """
+
+    def __init__(self, semilla: int = 42, proporcion_invalidos: float = 0.0):
+        """
+        Inicializa el generador.
+        
+        Args:
+            semilla (int): Semilla del generador aleatorio
+            proporcion_invalidos (float): Proporción (0.0 a 1.0) de filas
+                con un campo inválido
+        """
+        if not 0.0 <= proporcion_invalidos <= 1.0:
+            raise ValueError("La proporción de inválidos debe estar entre 0.0 y 1.0.")
+        self._azar = random.Random(semilla)
+        self._proporcion_invalidos = proporcion_invalidos
+
+    def nombre(self) -> str:
+        """Nombre completo con uno o dos nombres y dos apellidos."""
+        azar = self._azar
+        nombres = azar.sample(NOMBRES, azar.choice((1, 1, 2)))
+        return " ".join(nombres + azar.sample(APELLIDOS, 2))
+
+    def edad(self) -> str:
+        """Edad entre 0 y 100 como texto."""
+        return str(self._azar.randint(0, 100))
+
+    def documento_identidad(self) -> str:
+        """Carnet de identidad de 7 u 8 dígitos, a veces con complemento numérico."""
+        azar = self._azar
+        numero = str(azar.randint(1_000_000, 99_999_999))
+        if azar.random() < 0.1:
+            return f"{numero}-{azar.randint(1, 9)}"
+        return numero
+
+    def celular(self) -> str:
+        """Celular boliviano (6xxxxxxx o 7xxxxxxx) en distintos formatos."""
+        azar = self._azar
+        numero = f"{azar.choice('67')}{azar.randint(0, 9_999_999):07d}"
+        formato = azar.random()
+        if formato < 0.4:
+            return numero
+        if formato < 0.7:
+            return f"+591 {numero}"
+        if formato < 0.9:
+            return f"{numero[:4]}-{numero[4:]}"
+        return f"(591) {numero[:3]} {numero[3:]}"
+
+    def email(self, nombre: str) -> str:
+        """Email derivado del nombre de la persona."""
+        azar = self._azar
+        partes = _sin_acentos(nombre).lower().split()
+        usuario = azar.choice(("{0}.{1}", "{0}{1}", "{0}_{1}{2}", "{1}.{0}{2}")).format(
+            partes[0], partes[-1], azar.randint(1, 999))
+        return f"{usuario}@{azar.choice(DOMINIOS)}"
+
+    def direccion(self) -> str:
+        """Dirección urbana boliviana."""
+        azar = self._azar
+        return (f"{azar.choice(VIAS)} {azar.choice(NOMBRES_VIA)} "
+                f"#{azar.randint(1, 9999)}, {azar.choice(CIUDADES)}")
+
+    def fila(self) -> Dict[str, str]:
+        """
+        Genera una fila con los seis campos de Persona.
+        
+        Returns:
+            Dict[str, str]: La fila; con la probabilidad configurada, uno
+            de sus campos es inválido
+        """
+        nombre = self.nombre()
+        fila = {
+            "nombre": nombre,
+            "edad": self.edad(),
+            "documento_identidad": self.documento_identidad(),
+            "email": self.email(nombre),
+            "celular": self.celular(),
+            "direccion": self.direccion(),
+        }
+        if self._azar.random() < self._proporcion_invalidos:
+            campo = self._azar.choice(CAMPOS)
+            fila[campo] = self._azar.choice(INVALIDOS[campo])
+        return fila
+
+    def filas(self, cantidad: int) -> List[Dict[str, str]]:
+        """Genera una lista de filas."""
+        return [self.fila() for _ in range(cantidad)]
+
+    def iterar(self, cantidad: int) -> Iterator[Dict[str, str]]:
+        """Genera filas de forma perezosa."""
+        for _ in range(cantidad):
+            yield self.fila()
+
+    def columnas(self, cantidad: int) -> Dict[str, List[str]]:
+        """Genera `cantidad` filas y las devuelve agrupadas por columna."""
+        filas = self.filas(cantidad)
+        return {campo: [fila[campo] for fila in filas] for campo in CAMPOS}
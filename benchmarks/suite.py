@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Suite de benchmarks de los validadores y de Persona.
+
+Mide cada método de validación, la cadena completa del builder de
+Persona, PersonaBuilder.copia_desde y obtener_todos_los_datos con datos
+sintéticos reproducibles. Reporta operaciones por segundo y latencias
+p50/p99, y puede guardar los resultados en JSON para compararlos entre
+versiones sin conexión.
+
+Ejecutar desde la raíz del repositorio:
+    python benchmarks/suite.py --salida resultados.json
+    python benchmarks/suite.py --comparar resultados.json
+    python benchmarks/suite.py --casos validar_email persona_builder
+    python benchmarks/suite.py --metricas --comparar resultados.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+import jorge_choque_pg2_tecba  # noqa: E402
+from jorge_choque_pg2_tecba import metricas  # noqa: E402
+from jorge_choque_pg2_tecba.core import Persona, PersonaBuilder  # noqa: E402
+from jorge_choque_pg2_tecba.esquema import (  # noqa: E402
+    ESQUEMA_PERSONA,
+    validar_persona,
+)
+from jorge_choque_pg2_tecba.validators import (  # noqa: E402
+    ValidadorBase,
+    ValidadorDatosPersonales,
+    ValidadorDatosContacto,
+)
+from datos_sinteticos import GeneradorPersonas  # noqa: E402
+
+# Cada caso recibe las columnas sintéticas y devuelve (función, entradas)
+Preparador = Callable[[Dict[str, List]], Tuple[Callable, List]]
+CASOS: Dict[str, Preparador] = {}
+
+
+def caso(nombre: str) -> Callable[[Preparador], Preparador]:
+    """Registra un preparador de caso con el nombre indicado."""
+    def registrar(preparador: Preparador) -> Preparador:
+        CASOS[nombre] = preparador
+        return preparador
+    return registrar
+
+
+def _columna_valida(columnas: Dict[str, List], campo: str) -> List:
+    """Columna con solo las filas completamente válidas."""
+    return [valor for valor, valida in zip(columnas[campo], columnas["_valida"])
+            if valida]
+
+
+def _edad_entrada(edad: str):
+    """Edad tal como la recibiría establecer_edad desde un formulario."""
+    return int(edad) if edad.isdigit() else edad
+
+
+_PERSONALES = ValidadorDatosPersonales()
+_CONTACTO = ValidadorDatosContacto()
+
+for _objeto, _nombre, _campo in [
+    (ValidadorBase, "validar_solo_numeros", "documento_identidad"),
+    (ValidadorBase, "validar_solo_letras", "nombre"),
+    (ValidadorBase, "validar_alfanumerico", "direccion"),
+    (_PERSONALES, "validar_edad", "edad"),
+    (_PERSONALES, "validar_nombre", "nombre"),
+    (_PERSONALES, "validar_documento_identidad", "documento_identidad"),
+    (_CONTACTO, "validar_email", "email"),
+    (_CONTACTO, "validar_celular", "celular"),
+    (_CONTACTO, "validar_direccion", "direccion"),
+]:
+    # El método se resuelve al preparar el caso, para medir la versión instrumentada
+    # cuando se usa --metricas
+    caso(_nombre)(lambda columnas, o=_objeto, n=_nombre, c=_campo:
+                  (getattr(o, n), columnas[c]))
+
+
+def construir_persona(fila: Tuple) -> object:
+    """Cadena completa del builder; devuelve la excepción si la fila es inválida."""
+    nombre, edad, documento, email, celular, direccion = fila
+    try:
+        return (Persona()
+                .establecer_nombre(nombre)
+                .establecer_edad(edad)
+                .establecer_documento_identidad(documento)
+                .establecer_email(email)
+                .establecer_celular(celular)
+                .establecer_direccion(direccion)
+                .construir())
+    except ValueError as error:
+        return error
+
+
+@caso("persona_builder")
+def _caso_builder(columnas):
+    filas = list(zip(columnas["nombre"], map(_edad_entrada, columnas["edad"]),
+                     columnas["documento_identidad"], columnas["email"],
+                     columnas["celular"], columnas["direccion"]))
+    return construir_persona, filas
+
+
+def _filas_dict(columnas) -> List[Dict]:
+    return [dict(zip(("nombre", "edad", "documento_identidad", "email", "celular",
+                      "direccion"), fila))
+            for fila in zip(columnas["nombre"], map(_edad_entrada, columnas["edad"]),
+                            columnas["documento_identidad"], columnas["email"],
+                            columnas["celular"], columnas["direccion"])]
+
+
+@caso("desde_dict_acumular")
+def _caso_desde_dict(columnas):
+    return (lambda fila: Persona.desde_dict(fila, modo="acumular"),
+            _filas_dict(columnas))
+
+
+@caso("esquema_compilado")
+def _caso_esquema(columnas):
+    _, filas = _caso_builder(columnas)
+    validar = ESQUEMA_PERSONA.validar
+    return (lambda fila: validar(*fila)), filas
+
+
+@caso("esquema_validar_persona")
+def _caso_esquema_persona(columnas):
+    return validar_persona, _filas_dict(columnas)
+
+
+def _personas_validas(columnas) -> List[Persona]:
+    filas = zip(*(_columna_valida(columnas, campo) for campo in
+                  ("nombre", "edad", "documento_identidad", "email", "celular",
+                   "direccion")))
+    return [construir_persona((n, int(e), d, m, c, r)) for n, e, d, m, c, r in filas]
+
+
+@caso("copia_desde")
+def _caso_copia(columnas):
+    return PersonaBuilder.copia_desde, _personas_validas(columnas)
+
+
+@caso("copia_desde_confiable")
+def _caso_copia_confiable(columnas):
+    return (lambda persona: PersonaBuilder.copia_desde(persona, confiar=True),
+            _personas_validas(columnas))
+
+
+@caso("reemplazar_un_campo")
+def _caso_reemplazar(columnas):
+    return (lambda persona: persona.reemplazar(edad=persona.edad),
+            _personas_validas(columnas))
+
+
+@caso("obtener_todos_los_datos")
+def _caso_datos(columnas):
+    return Persona.obtener_todos_los_datos, _personas_validas(columnas)
+
+
+def generar_columnas(filas: int, semilla: int, proporcion_invalidos: float) -> Dict:
+    """Genera las columnas sintéticas y marca qué filas son completamente válidas."""
+    columnas = GeneradorPersonas(semilla, proporcion_invalidos).columnas(filas)
+    validas = []
+    for fila in zip(*(columnas[c] for c in ("nombre", "edad", "documento_identidad",
+                                            "email", "celular", "direccion"))):
+        nombre, edad, documento, email, celular, direccion = fila
+        validas.append(not isinstance(
+            construir_persona((nombre, _edad_entrada(edad), documento, email,
+                               celular, direccion)), ValueError))
+    columnas["_valida"] = validas
+    return columnas
+
+
+def _sobrecosto_reloj() -> int:
+    """Mediana del costo de dos lecturas consecutivas de perf_counter_ns."""
+    reloj = time.perf_counter_ns
+    muestras = []
+    for _ in range(10_000):
+        inicio = reloj()
+        muestras.append(reloj() - inicio)
+    muestras.sort()
+    return muestras[len(muestras) // 2]
+
+
+def medir(funcion: Callable, entradas: List, repeticiones: int,
+          sobrecosto: int) -> Dict:
+    """
+    Mide el rendimiento de una función sobre todas las entradas.
+    
+    El throughput es el de la mejor repetición del bucle completo; las
+    latencias se toman llamada a llamada y se les descuenta el costo del reloj.
+    
+    Returns:
+        dict: ops_por_segundo, media_ns, p50_ns y p99_ns
+    """
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        for entrada in entradas:
+            funcion(entrada)
+        mejor = min(mejor, time.perf_counter() - inicio)
+
+    reloj = time.perf_counter_ns
+    latencias = []
+    agregar = latencias.append
+    for entrada in entradas:
+        inicio = reloj()
+        funcion(entrada)
+        agregar(reloj() - inicio - sobrecosto)
+    latencias.sort()
+    total = len(latencias)
+    return {
+        "ops_por_segundo": total / mejor,
+        "media_ns": mejor / total * 1e9,
+        "p50_ns": max(latencias[total // 2], 0),
+        "p99_ns": max(latencias[min(total - 1, int(total * 0.99))], 0),
+    }
+
+
+def ejecutar(nombres: List[str], filas: int, repeticiones: int, semilla: int,
+             proporcion_invalidos: float) -> Dict:
+    """Ejecuta los casos indicados y devuelve los resultados con sus metadatos."""
+    columnas = generar_columnas(filas, semilla, proporcion_invalidos)
+    sobrecosto = _sobrecosto_reloj()
+    resultados = {}
+    for nombre in nombres:
+        funcion, entradas = CASOS[nombre](columnas)
+        resultados[nombre] = medir(funcion, entradas, repeticiones, sobrecosto)
+    return {
+        "metadatos": {
+            "version": jorge_choque_pg2_tecba.__version__,
+            "python": platform.python_version(),
+            "implementacion": platform.python_implementation(),
+            "plataforma": platform.platform(),
+            "fecha": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "filas": filas,
+            "repeticiones": repeticiones,
+            "semilla": semilla,
+            "proporcion_invalidos": proporcion_invalidos,
+            "metricas": metricas.activo(),
+        },
+        "resultados": resultados,
+    }
+
+
+def imprimir(informe: Dict, base: Dict = None) -> None:
+    """Imprime la tabla de resultados y, si hay base, la relación contra ella."""
+    encabezado = f"{'caso':<30} {'ops/s':>12} {'p50 (ns)':>10} {'p99 (ns)':>10}"
+    if base:
+        encabezado += f" {'vs base':>9}"
+    print(encabezado)
+    resultados_base = (base or {}).get("resultados", {})
+    for nombre, r in informe["resultados"].items():
+        fila = (f"{nombre:<30} {r['ops_por_segundo']:>12,.0f} {r['p50_ns']:>10,.0f} "
+                f"{r['p99_ns']:>10,.0f}")
+        if nombre in resultados_base:
+            relacion = r["ops_por_segundo"] / resultados_base[nombre]["ops_por_segundo"]
+            fila += f" {relacion:>8.2f}x"
+        print(fila)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks de jorge_choque_pg2_tecba")
+    parser.add_argument("--casos", nargs="*", default=None,
+                        help="Casos a ejecutar (por defecto todos): "
+                             f"{', '.join(CASOS)}")
+    parser.add_argument("--filas", type=int, default=20_000)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--invalidos", type=float, default=0.2,
+                        help="Proporción de filas con un campo inválido")
+    parser.add_argument("--salida", help="Archivo JSON donde guardar los resultados")
+    parser.add_argument("--comparar", help="Archivo JSON de una ejecución anterior")
+    parser.add_argument("--metricas", action="store_true",
+                        help="Medir con la instrumentación de metricas activada")
+    args = parser.parse_args(argv)
+
+    nombres = args.casos or list(CASOS)
+    desconocidos = [n for n in nombres if n not in CASOS]
+    if desconocidos:
+        parser.error(f"casos desconocidos: {', '.join(desconocidos)}")
+
+    if args.metricas:
+        metricas.activar()
+    informe = ejecutar(nombres, args.filas, args.repeticiones, args.semilla,
+                       args.invalidos)
+    base = None
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+    imprimir(informe, base)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(informe, archivo, indent=2, ensure_ascii=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -56,6 +56,13 @@ setup(
             "mypy",
         ],
     },
+    entry_points={
+        "console_scripts": [
+            "jorge-choque-ingest=jorge_choque_pg2_tecba.ingest:main",
+            "jorge-choque-duplicados=jorge_choque_pg2_tecba.duplicados:main",
+            "jorge-choque-servidor=jorge_choque_pg2_tecba.servidor:main",
+        ],
+    },
     include_package_data=True,
     zip_safe=False,
     keywords="validators, validation, personal data, contact data",
@@ -4,8 +4,31 @@ Jorge Ch PG2 TECBA - Librería de Validadores
 Una librería básica de validadores para datos personales y de contacto.
 
 Módulos:
-    - validators: Clases de validación (ValidadorBase, ValidadorDatosPersonales, ValidadorDatosContacto)
-    - core: Clase Persona con patrón Builder
+    - validators: Clases de validación (ValidadorBase, ValidadorDatosPersonales,
+      ValidadorDatosContacto, ValidadorLote)
+    - dominios: Listas de dominios de email permitidos o bloqueados, con comodines
+    - telefonos: Plan de numeración móvil en un trie para normalizar celulares a E.164
+    - core: Clase Persona con patrón Builder y almacén columnar PersonaTabla
+    - flujo: Validación en flujo con un builder reutilizable, pool de personas y
+      buffers preasignados
+    - esquema: Esquemas declarativos compilados a funciones de validación generadas
+    - planificador: Orden adaptativo de las comprobaciones para rechazar
+      registros antes
+    - registro: Registro en memoria con índices por documento, email, celular y edad
+    - duplicados: Detección de duplicados en memoria o particionada en disco y
+      filtro de Bloom
+    - nombres: Índice de búsqueda aproximada de nombres para enlazar registros
+    - archivo: Archivo binario compacto de personas con acceso aleatorio por mmap
+    - repositorio: Persistencia de personas en SQLite con escrituras por lotes y
+      lectores concurrentes
+    - cache: Memoización acotada y segura entre hilos de los validadores
+    - incremental: Resultados de validación guardados en SQLite para la ingesta
+      incremental
+    - dataframe: Accesor df.validacion de pandas con las reglas aplicadas por columna
+    - concurrente: Validación de lotes en un pool de hilos y garantías de concurrencia
+    - metricas: Contadores, motivos de rechazo y latencias opcionales (Prometheus/JSON)
+    - servidor: Servidor HTTP/JSON local con micro-lotes para validar desde otros
+      servicios
 
 Ejemplo de uso:
     >>> from jorge_ch_pg2_tecba.core import Persona
@@ -29,16 +52,36 @@ __email__ = "jorgechoque.sis24ch@tecba.edu.bo"
 from .validators import (
     ValidadorBase,
     ValidadorDatosPersonales,
-    ValidadorDatosContacto
+    ValidadorDatosContacto,
+    ValidadorLote
 )
-from .core import Persona, PersonaBuilder
+from .core import (
+    Persona,
+    PersonaBuilder,
+    PersonaInmutable,
+    PersonaTabla,
+    ResultadoValidacion
+)
+from .esquema import Campo, Esquema
+from .registro import ErrorDuplicado, PersonaRegistro
+from .cache import CacheResultados, ValidadorConCache
 
 __all__ = [
     "ValidadorBase",
     "ValidadorDatosPersonales", 
     "ValidadorDatosContacto",
+    "ValidadorLote",
     "Persona",
     "PersonaBuilder",
+    "PersonaInmutable",
+    "PersonaTabla",
+    "ResultadoValidacion",
+    "Campo",
+    "Esquema",
+    "PersonaRegistro",
+    "ErrorDuplicado",
+    "CacheResultados",
+    "ValidadorConCache",
     "__version__",
     "__author__",
     "__email__"
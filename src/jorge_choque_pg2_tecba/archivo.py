@@ -0,0 +1,395 @@
+"""
+Módulo de archivos binarios compactos de personas ya validadas.
+
+Guarda lotes de Persona en un formato binario propio y los lee con mmap:
+cualquier fila se obtiene en O(1) por su índice, los campos se decodifican
+solo al accederlos y al cargar el archivo no se vuelve a validar nada ni
+se interpreta JSON.
+
+Formato (little-endian):
+    Cabecera     b'JCPA', versión (uint16), reservado (uint16),
+                 cantidad de filas (uint64), posición del índice (uint64)
+    Registros    Por fila: mapa de presencia (uint8, con los bits CAMPO_*
+                 de core), la edad (int16) si está presente y, por cada
+                 campo de texto presente, su longitud (uint16) y sus bytes
+                 UTF-8
+    Índice       Posición de inicio de cada registro (uint64 por fila)
+
+Ejemplo:
+    >>> from jorge_choque_pg2_tecba.archivo import LectorArchivo, guardar_personas
+    >>> guardar_personas("personas.jcpa", personas)
+    >>> with LectorArchivo("personas.jcpa") as archivo:
+    ...     archivo[123_456].email          # solo decodifica el email
+    ...     persona = archivo.persona(42)   # Persona sin revalidar
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Union
+
+from .core import (
+    CAMPO_CELULAR,
+    CAMPO_DIRECCION,
+    CAMPO_DOCUMENTO_IDENTIDAD,
+    CAMPO_EDAD,
+    CAMPO_EMAIL,
+    CAMPO_NOMBRE,
+    Persona,
+    PersonaInmutable,
+)
+
+
+MAGIA = b'JCPA'
+VERSION = 1
+
+_CABECERA = struct.Struct('<4sHHQQ')
+_EDAD = struct.Struct('<h')
+_LONGITUD = struct.Struct('<H')
+_LONGITUD_MAXIMA_CAMPO = 0xFFFF
+
+# Bits de los campos de texto, en el orden en que se guardan
+_BITS_TEXTO = (CAMPO_NOMBRE, CAMPO_DOCUMENTO_IDENTIDAD, CAMPO_EMAIL, CAMPO_CELULAR,
+               CAMPO_DIRECCION)
+
+
+def _codificar(nombre: Optional[str], edad: Optional[int], documento: Optional[str],
+               email: Optional[str], celular: Optional[str],
+               direccion: Optional[str]) -> bytes:
+    """Codifica los valores de una persona como un registro."""
+    presentes = 0
+    partes = [b'']
+    if edad is not None:
+        # establecer_edad también guarda edades en texto, como '30'
+        try:
+            partes.append(_EDAD.pack(int(edad)))
+        except (TypeError, ValueError, struct.error):
+            raise ValueError(f"Edad inválida para el archivo: {edad!r}.") from None
+        presentes |= CAMPO_EDAD
+    for bit, valor in zip(_BITS_TEXTO, (nombre, documento, email, celular, direccion)):
+        if valor is not None:
+            codificado = valor.encode('utf-8')
+            if len(codificado) > _LONGITUD_MAXIMA_CAMPO:
+                raise ValueError(
+                    f"Campo demasiado largo para el archivo: {len(codificado)} bytes.")
+            presentes |= bit
+            partes.append(_LONGITUD.pack(len(codificado)))
+            partes.append(codificado)
+    partes[0] = bytes((presentes,))
+    return b''.join(partes)
+
+
+class EscritorArchivo:
+    """
+    Escribe personas ya validadas en un archivo binario.
+    
+    Los registros se escriben a medida que llegan; el índice de posiciones
+    y la cantidad de filas se escriben al cerrar. Un archivo que no se
+    cerró, o cuyo bloque with terminó con una excepción, no puede abrirse
+    con LectorArchivo.
+    
+    Ejemplo:
+        >>> with EscritorArchivo("personas.jcpa") as escritor:
+        ...     escritor.agregar_personas(personas)
+    """
+
+    def __init__(self, ruta: str) -> None:
+        """
+        Crea (o reemplaza) el archivo.
+        
+        Args:
+            ruta (str): Ruta del archivo a escribir
+        """
+        self.ruta = ruta
+        self._archivo: Optional[BinaryIO] = open(ruta, 'wb')
+        self._archivo.write(_CABECERA.pack(MAGIA, VERSION, 0, 0, 0))
+        self._posiciones: List[int] = []
+        self._posicion = _CABECERA.size
+
+    def __len__(self) -> int:
+        """Cantidad de personas escritas."""
+        return len(self._posiciones)
+
+    def agregar(self, persona: Union[Persona, PersonaInmutable]) -> None:
+        """
+        Escribe una persona. Sus datos se guardan tal cual, sin validarlos.
+        
+        Args:
+            persona (Union[Persona, PersonaInmutable]): Persona ya validada
+            
+        Raises:
+            ValueError: Si algún campo supera los 65535 bytes en UTF-8 o la
+                edad no es un entero de 16 bits
+        """
+        self.agregar_personas((persona,))
+
+    def agregar_personas(self,
+                         personas: Iterable[Union[Persona, PersonaInmutable]]) -> None:
+        """
+        Escribe varias personas en una sola escritura.
+        
+        Si alguna persona no puede codificarse no se escribe ninguna del lote.
+        
+        Raises:
+            ValueError: Si algún campo supera los 65535 bytes en UTF-8 o la
+                edad no es un entero de 16 bits
+            RuntimeError: Si el escritor ya está cerrado
+        """
+        archivo = self._archivo
+        if archivo is None:
+            raise RuntimeError("El escritor de archivo está cerrado.")
+        # Se codifica el lote completo antes de escribir: si una fila falla,
+        # no queda nada del lote ni en el archivo ni en el índice
+        registros = []
+        posiciones = []
+        posicion = self._posicion
+        for persona in personas:
+            if isinstance(persona, PersonaInmutable):
+                registro = _codificar(*persona)
+            else:
+                registro = _codificar(persona._nombre, persona._edad,
+                                      persona._documento_identidad, persona._email,
+                                      persona._celular, persona._direccion)
+            posiciones.append(posicion)
+            posicion += len(registro)
+            registros.append(registro)
+        archivo.write(b''.join(registros))
+        self._posiciones.extend(posiciones)
+        self._posicion = posicion
+
+    def cerrar(self) -> None:
+        """Escribe el índice y la cabecera definitiva y cierra el archivo."""
+        if self._archivo is None:
+            return
+        archivo = self._archivo
+        cantidad = len(self._posiciones)
+        archivo.write(struct.pack(f'<{cantidad}Q', *self._posiciones))
+        archivo.seek(0)
+        archivo.write(_CABECERA.pack(MAGIA, VERSION, 0, cantidad, self._posicion))
+        archivo.close()
+        self._archivo = None
+
+    def __enter__(self) -> 'EscritorArchivo':
+        return self
+
+    def __exit__(self, tipo: object, *excepcion: object) -> None:
+        if tipo is None:
+            self.cerrar()
+        elif self._archivo is not None:
+            # Sin índice ni cabecera definitiva el archivo no puede abrirse
+            self._archivo.close()
+            self._archivo = None
+
+
+def guardar_personas(ruta: str,
+                     personas: Iterable[Union[Persona, PersonaInmutable]]) -> int:
+    """
+    Guarda personas ya validadas en un archivo binario.
+    
+    Args:
+        ruta (str): Ruta del archivo a escribir
+        personas (Iterable[Union[Persona, PersonaInmutable]]): Personas a guardar
+        
+    Returns:
+        int: Cantidad de personas guardadas
+    """
+    with EscritorArchivo(ruta) as escritor:
+        escritor.agregar_personas(personas)
+        return len(escritor)
+
+
+class RegistroArchivo:
+    """
+    Vista de una fila de un LectorArchivo.
+    
+    No copia datos: cada propiedad decodifica su campo directamente del
+    archivo mapeado al accederla.
+    """
+
+    __slots__ = ('_lector', '_inicio')
+
+    def __init__(self, lector: 'LectorArchivo', inicio: int) -> None:
+        self._lector = lector
+        self._inicio = inicio
+
+    @property
+    def nombre(self) -> Optional[str]:
+        """Obtiene el nombre de la persona."""
+        return self._lector._texto(self._inicio, CAMPO_NOMBRE)
+
+    @property
+    def edad(self) -> Optional[int]:
+        """Obtiene la edad de la persona."""
+        return self._lector._edad(self._inicio)
+
+    @property
+    def documento_identidad(self) -> Optional[str]:
+        """Obtiene el documento de identidad."""
+        return self._lector._texto(self._inicio, CAMPO_DOCUMENTO_IDENTIDAD)
+
+    @property
+    def email(self) -> Optional[str]:
+        """Obtiene el email."""
+        return self._lector._texto(self._inicio, CAMPO_EMAIL)
+
+    @property
+    def celular(self) -> Optional[str]:
+        """Obtiene el número de celular."""
+        return self._lector._texto(self._inicio, CAMPO_CELULAR)
+
+    @property
+    def direccion(self) -> Optional[str]:
+        """Obtiene la dirección."""
+        return self._lector._texto(self._inicio, CAMPO_DIRECCION)
+
+    def persona(self) -> Persona:
+        """Decodifica la fila completa como una Persona, sin validarla."""
+        return self._lector._persona(self._inicio)
+
+    def __repr__(self) -> str:
+        """Representación técnica del registro."""
+        return f"RegistroArchivo({self.persona()!r})"
+
+
+class LectorArchivo:
+    """
+    Lee un archivo de EscritorArchivo mapeado en memoria.
+    
+    Abrirlo solo lee la cabecera: las filas se obtienen por índice en O(1)
+    y sus campos se decodifican al accederlos. Las personas se crean sin
+    volver a validarlas, así que solo deben abrirse archivos confiables.
+    """
+
+    def __init__(self, ruta: str) -> None:
+        """
+        Abre y mapea el archivo.
+        
+        Args:
+            ruta (str): Ruta del archivo a leer
+            
+        Raises:
+            ValueError: Si el archivo no tiene el formato o la versión esperados
+        """
+        self.ruta = ruta
+        with open(ruta, 'rb') as archivo:
+            if os.fstat(archivo.fileno()).st_size < _CABECERA.size:
+                raise ValueError(f"'{ruta}' no es un archivo de personas.")
+            self._datos = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magia, version, _, cantidad, indice = _CABECERA.unpack_from(self._datos)
+            if magia != MAGIA:
+                raise ValueError(f"'{ruta}' no es un archivo de personas.")
+            if version != VERSION:
+                raise ValueError(f"Versión de archivo no soportada: {version}.")
+            if indice < _CABECERA.size or indice + 8 * cantidad > len(self._datos):
+                raise ValueError(f"'{ruta}' está incompleto o dañado.")
+            posiciones = memoryview(self._datos)[indice:indice + 8 * cantidad]
+            self._posiciones: Union[memoryview, 'array[int]']
+            if sys.byteorder == 'little':
+                self._posiciones = posiciones.cast('Q')
+            else:
+                copia = array('Q', posiciones.tobytes())
+                copia.byteswap()
+                posiciones.release()
+                self._posiciones = copia
+        except BaseException:
+            self._datos.close()
+            raise
+        self._cantidad: int = cantidad
+
+    def __len__(self) -> int:
+        """Cantidad de personas del archivo."""
+        return self._cantidad
+
+    def _posicion(self, indice: int) -> int:
+        """Obtiene la posición del registro de una fila."""
+        if indice < 0:
+            indice += self._cantidad
+        if not 0 <= indice < self._cantidad:
+            raise IndexError("Índice fuera del rango del archivo.")
+        posicion: int = self._posiciones[indice]
+        return posicion
+
+    def __getitem__(self, indice: int) -> RegistroArchivo:
+        """Obtiene la vista de una fila sin decodificar sus campos."""
+        return RegistroArchivo(self, self._posicion(indice))
+
+    def persona(self, indice: int) -> Persona:
+        """
+        Decodifica una fila completa como una Persona, sin validarla.
+        
+        Raises:
+            IndexError: Si el índice está fuera de rango
+        """
+        return self._persona(self._posicion(indice))
+
+    def __iter__(self) -> Iterator[Persona]:
+        """Recorre todas las personas del archivo en orden."""
+        persona = self._persona
+        for posicion in self._posiciones:
+            yield persona(posicion)
+
+    def _edad(self, posicion: int) -> Optional[int]:
+        """Decodifica la edad de un registro."""
+        if not self._datos[posicion] & CAMPO_EDAD:
+            return None
+        edad: int = _EDAD.unpack_from(self._datos, posicion + 1)[0]
+        return edad
+
+    def _texto(self, posicion: int, bit: int) -> Optional[str]:
+        """Decodifica un solo campo de texto de un registro."""
+        datos = self._datos
+        presentes = datos[posicion]
+        if not presentes & bit:
+            return None
+        posicion += 1
+        if presentes & CAMPO_EDAD:
+            posicion += 2
+        for bit_campo in _BITS_TEXTO:
+            if presentes & bit_campo:
+                longitud = _LONGITUD.unpack_from(datos, posicion)[0]
+                posicion += 2
+                if bit_campo == bit:
+                    return datos[posicion:posicion + longitud].decode('utf-8')
+                posicion += longitud
+        return None
+
+    def _persona(self, posicion: int) -> Persona:
+        """Decodifica un registro completo."""
+        datos = self._datos
+        presentes = datos[posicion]
+        posicion += 1
+        persona = Persona.__new__(Persona)
+        if presentes & CAMPO_EDAD:
+            persona._edad = _EDAD.unpack_from(datos, posicion)[0]
+            posicion += 2
+        else:
+            persona._edad = None
+        valores: List[Optional[str]] = [None, None, None, None, None]
+        for i, bit in enumerate(_BITS_TEXTO):
+            if presentes & bit:
+                fin = posicion + 2 + (datos[posicion] | datos[posicion + 1] << 8)
+                valores[i] = datos[posicion + 2:fin].decode('utf-8')
+                posicion = fin
+        (persona._nombre, persona._documento_identidad, persona._email,
+         persona._celular, persona._direccion) = valores
+        return persona
+
+    def cerrar(self) -> None:
+        """Libera el mapeo del archivo."""
+        if not self._datos.closed:
+            if isinstance(self._posiciones, memoryview):
+                self._posiciones.release()
+            self._datos.close()
+
+    def __enter__(self) -> 'LectorArchivo':
+        return self
+
+    def __exit__(self, *excepcion: object) -> None:
+        self.cerrar()
+
+    def __repr__(self) -> str:
+        """Representación técnica del lector."""
+        return f"LectorArchivo(ruta={self.ruta!r}, filas={self._cantidad})"
@@ -0,0 +1,225 @@
+"""
+Módulo de memoización acotada para los resultados de los validadores.
+
+Este módulo contiene:
+- CacheResultados: Caché acotada y segura entre hilos con política LRU o FIFO
+- ValidadorConCache: Envoltura que memoiza los métodos validar_* de un validador
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional, Sequence
+
+from .validators import LONGITUD_MAXIMA_ENTRADA, ValidadorBase
+
+
+POLITICAS = ('lru', 'fifo')
+
+_AUSENTE = object()
+
+
+class EstadisticasCache(NamedTuple):
+    """Estadísticas de uso de una caché."""
+    
+    aciertos: int
+    fallos: int
+    desalojos: int
+    tamano: int
+    tamano_maximo: int
+    
+    @property
+    def consultas(self) -> int:
+        """Cantidad total de consultas."""
+        return self.aciertos + self.fallos
+    
+    @property
+    def tasa_aciertos(self) -> float:
+        """Proporción de consultas resueltas desde la caché (0.0 a 1.0)."""
+        return self.aciertos / self.consultas if self.consultas else 0.0
+
+
+class CacheResultados:
+    """
+    Caché de resultados acotada y segura para usar desde varios hilos.
+    
+    Con la política 'lru' se desaloja la entrada usada hace más tiempo; con
+    'fifo', la insertada hace más tiempo (las consultas no reordenan, por
+    lo que cada acierto es más barato).
+    """
+    
+    def __init__(self, tamano_maximo: int = 10_000, politica: str = 'lru') -> None:
+        """
+        Inicializa la caché.
+        
+        Args:
+            tamano_maximo (int): Cantidad máxima de entradas
+            politica (str): 'lru' o 'fifo'
+            
+        Raises:
+            ValueError: Si el tamaño no es positivo o la política no existe
+        """
+        if tamano_maximo < 1:
+            raise ValueError("El tamaño máximo de la caché debe ser al menos 1.")
+        if politica not in POLITICAS:
+            raise ValueError(
+                f"Política inválida: '{politica}'. Debe ser una de {POLITICAS}.")
+        self._datos: 'OrderedDict[Hashable, object]' = OrderedDict()
+        self._tamano_maximo = tamano_maximo
+        self._lru = politica == 'lru'
+        self._candado = Lock()
+        self._aciertos = 0
+        self._fallos = 0
+        self._desalojos = 0
+    
+    def obtener_o_calcular(self, clave: Hashable,
+                           funcion: Callable[[Hashable], Any]) -> Any:
+        """
+        Obtiene el resultado guardado para la clave o lo calcula y lo guarda.
+        
+        La función se ejecuta fuera del candado; si dos hilos calculan la
+        misma clave a la vez ambos obtienen el mismo resultado, porque los
+        validadores son funciones puras.
+        
+        Args:
+            clave (Hashable): El valor validado
+            funcion (Callable): Función que calcula el resultado a partir de
+                la clave
+            
+        Returns:
+            El resultado de funcion(clave)
+        """
+        with self._candado:
+            resultado = self._datos.get(clave, _AUSENTE)
+            if resultado is not _AUSENTE:
+                self._aciertos += 1
+                if self._lru:
+                    self._datos.move_to_end(clave)
+                return resultado
+            self._fallos += 1
+        
+        resultado = funcion(clave)
+        
+        with self._candado:
+            self._datos[clave] = resultado
+            if len(self._datos) > self._tamano_maximo:
+                self._datos.popitem(last=False)
+                self._desalojos += 1
+        return resultado
+    
+    def estadisticas(self) -> EstadisticasCache:
+        """Obtiene una copia consistente de las estadísticas actuales."""
+        with self._candado:
+            return EstadisticasCache(self._aciertos, self._fallos, self._desalojos,
+                                     len(self._datos), self._tamano_maximo)
+    
+    def limpiar(self) -> None:
+        """Elimina todas las entradas y reinicia las estadísticas."""
+        with self._candado:
+            self._datos.clear()
+            self._aciertos = self._fallos = self._desalojos = 0
+    
+    def __len__(self) -> int:
+        """Cantidad de entradas guardadas."""
+        return len(self._datos)
+
+
+class ValidadorConCache:
+    """
+    Envoltura opcional que memoiza los métodos validar_* de un validador.
+    
+    Cada método tiene su propia CacheResultados, de modo que los nombres,
+    emails y direcciones no compiten por el mismo espacio. Los métodos no
+    memoizados y los demás atributos se delegan al validador original.
+    
+    Ejemplo:
+        >>> contacto = ValidadorConCache(ValidadorDatosContacto(),
+        ...                              tamano_maximo=50_000)
+        >>> contacto.validar_email("ana@correo.bo")
+        True
+        >>> contacto.estadisticas()['validar_email'].tasa_aciertos
+        0.0
+    """
+    
+    def __init__(self, validador: ValidadorBase, tamano_maximo: int = 10_000,
+                 politica: str = 'lru',
+                 metodos: Optional[Sequence[str]] = None) -> None:
+        """
+        Inicializa la envoltura.
+        
+        Args:
+            validador (ValidadorBase): El validador a envolver
+            tamano_maximo (int): Entradas máximas por cada método
+            politica (str): 'lru' o 'fifo'
+            metodos (Optional[Sequence[str]]): Métodos a memoizar; por
+                defecto todos los que empiezan con 'validar_'
+                
+        Raises:
+            ValueError: Si un método no existe en el validador
+        """
+        if metodos is None:
+            metodos = [nombre for nombre in dir(validador)
+                       if nombre.startswith('validar_')]
+        self._validador = validador
+        self._caches: Dict[str, CacheResultados] = {}
+        for nombre in metodos:
+            metodo = getattr(validador, nombre, None)
+            if not callable(metodo):
+                raise ValueError(f"El validador no tiene el método '{nombre}'.")
+            cache = CacheResultados(tamano_maximo, politica)
+            self._caches[nombre] = cache
+            setattr(self, nombre, self._memoizar(metodo, cache))
+    
+    @staticmethod
+    def _memoizar(metodo: Callable, cache: CacheResultados) -> Callable:
+        """
+        Crea la versión memoizada de un método de validación.
+        
+        Los valores no hashables y los textos de más de
+        LONGITUD_MAXIMA_ENTRADA caracteres, que los validadores rechazan
+        de inmediato, se validan sin pasar por la caché.
+        """
+        obtener_o_calcular = cache.obtener_o_calcular
+        
+        def validar(valor: Any) -> bool:
+            if isinstance(valor, str) and len(valor) > LONGITUD_MAXIMA_ENTRADA:
+                # No se guardan entradas enormes que ocuparían la caché
+                resultado: bool = metodo(valor)
+                return resultado
+            try:
+                hash(valor)
+            except TypeError:
+                # Valores no hashables: se validan sin caché
+                resultado = metodo(valor)
+                return resultado
+            resultado = obtener_o_calcular(valor, metodo)
+            return resultado
+        
+        validar.__name__ = metodo.__name__
+        validar.__doc__ = metodo.__doc__
+        return validar
+    
+    def __getattr__(self, nombre: str) -> Any:
+        """Delega en el validador los atributos no memoizados."""
+        if nombre.startswith('_'):
+            raise AttributeError(nombre)
+        return getattr(self._validador, nombre)
+    
+    def estadisticas(self) -> Dict[str, EstadisticasCache]:
+        """
+        Obtiene las estadísticas de cada método memoizado.
+        
+        Returns:
+            Dict[str, EstadisticasCache]: Estadísticas por nombre de método
+        """
+        return {nombre: cache.estadisticas() for nombre, cache in self._caches.items()}
+    
+    def estadisticas_totales(self) -> EstadisticasCache:
+        """Suma las estadísticas de todos los métodos memoizados."""
+        por_metodo = self.estadisticas().values()
+        sumas = [sum(valores) for valores in zip(*por_metodo)]
+        return EstadisticasCache(*(sumas or [0] * len(EstadisticasCache._fields)))
+    
+    def limpiar(self) -> None:
+        """Vacía todas las cachés y reinicia sus estadísticas."""
+        for cache in self._caches.values():
+            cache.limpiar()
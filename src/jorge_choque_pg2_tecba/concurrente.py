@@ -0,0 +1,167 @@
+"""
+Módulo de validación concurrente con un pool de hilos.
+
+Garantías de concurrencia de la librería:
+    - Los validadores (ValidadorBase, ValidadorDatosPersonales,
+      ValidadorDatosContacto, ValidadorLote) no modifican su estado
+      después de crearse: una misma instancia puede usarse desde varios
+      hilos a la vez.
+    - Los esquemas compilados (esquema.Esquema) tampoco tienen estado.
+    - CacheResultados, ValidadorConCache y las métricas protegen su
+      estado con un Lock.
+    - Persona es mutable y sus métodos establecer_* no están protegidos:
+      cada hilo debe construir sus propias personas. Para compartir una
+      persona ya construida use PersonaInmutable (Persona.congelar()).
+    - PersonaRegistro no está protegido: las modificaciones deben hacerse
+      desde un solo hilo o con un Lock externo.
+
+ValidadorConcurrente reparte las filas en bloques entre los hilos; cada
+fila se valida con esquema.validar_persona, que crea su propia Persona,
+así que los hilos no comparten estado mutable. En CPython con GIL los
+hilos no validan en paralelo (para eso está ingest, con procesos); en
+las compilaciones sin GIL (3.13t y posteriores) sí, y sin el costo de
+serializar las filas hacia otros procesos.
+
+Ejemplo:
+    >>> from jorge_choque_pg2_tecba.concurrente import ValidadorConcurrente
+    >>> with ValidadorConcurrente(hilos=8) as validador:
+    ...     resultados = validador.validar(filas)
+    >>> sum(resultado.valido for resultado in resultados)
+"""
+
+import os
+import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
+
+from .core import ResultadoValidacion
+from .esquema import ESQUEMA_PERSONA, Esquema, validar_persona
+
+
+def gil_habilitado() -> bool:
+    """
+    Indica si el intérprete actual ejecuta con GIL.
+    
+    Returns:
+        bool: El valor de sys._is_gil_enabled() en Python 3.13 o
+        posterior; True en versiones anteriores, que siempre tienen GIL
+    """
+    consultar = getattr(sys, '_is_gil_enabled', None)
+    return True if consultar is None else consultar()
+
+
+def _validar_bloque(bloque: List[Dict], esquema: Esquema) -> List[ResultadoValidacion]:
+    """Valida un bloque de filas dentro de un hilo del pool."""
+    return [validar_persona(fila, esquema) for fila in bloque]
+
+
+class ValidadorConcurrente:
+    """
+    Valida lotes de filas en un ThreadPoolExecutor.
+    
+    Es seguro llamar a validar() y validar_iter() desde varios hilos a la
+    vez: comparten el pool y no guardan estado entre llamadas.
+    """
+
+    def __init__(self, hilos: Optional[int] = None, tamano_bloque: int = 1_000,
+                 esquema: Esquema = ESQUEMA_PERSONA):
+        """
+        Crea el pool de hilos.
+        
+        Args:
+            hilos (Optional[int]): Cantidad de hilos; por defecto os.cpu_count()
+            tamano_bloque (int): Filas que valida cada tarea del pool
+            esquema (Esquema): Esquema con los seis campos de Persona, en orden
+            
+        Raises:
+            ValueError: Si hilos o tamano_bloque no son positivos
+        """
+        if hilos is not None and hilos < 1:
+            raise ValueError("La cantidad de hilos debe ser al menos 1.")
+        if tamano_bloque < 1:
+            raise ValueError("El tamaño de bloque debe ser al menos 1.")
+        self.hilos = hilos or os.cpu_count() or 1
+        self.tamano_bloque = tamano_bloque
+        self.esquema = esquema
+        self._pool = ThreadPoolExecutor(max_workers=self.hilos,
+                                        thread_name_prefix='validacion')
+
+    def validar(self, filas: Iterable[Dict]) -> List[ResultadoValidacion]:
+        """
+        Valida todas las filas.
+        
+        Args:
+            filas (Iterable[Dict]): Diccionarios con los campos de Persona
+            
+        Returns:
+            List[ResultadoValidacion]: Un resultado por fila, en el orden
+            de entrada (como Persona.desde_dict en modo 'acumular')
+        """
+        return list(self.validar_iter(filas))
+
+    def validar_iter(self, filas: Iterable[Dict]) -> Iterator[ResultadoValidacion]:
+        """
+        Valida las filas a medida que se leen, con memoria acotada.
+        
+        Como máximo hay 2 bloques pendientes por hilo; los resultados se
+        entregan en el orden de entrada.
+        
+        Args:
+            filas (Iterable[Dict]): Diccionarios con los campos de Persona
+            
+        Returns:
+            Iterator[ResultadoValidacion]: Un resultado por fila
+        """
+        iterador = iter(filas)
+        pendientes: Deque['Future[List[ResultadoValidacion]]'] = deque()
+        max_pendientes = 2 * self.hilos
+        while True:
+            bloque = list(islice(iterador, self.tamano_bloque))
+            if bloque:
+                pendientes.append(
+                    self._pool.submit(_validar_bloque, bloque, self.esquema))
+            if pendientes and (not bloque or len(pendientes) >= max_pendientes):
+                yield from pendientes.popleft().result()
+            if not bloque and not pendientes:
+                return
+
+    def cerrar(self) -> None:
+        """Espera las tareas pendientes y libera los hilos."""
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> 'ValidadorConcurrente':
+        return self
+
+    def __exit__(self, *excepcion: object) -> None:
+        self.cerrar()
+
+    def __repr__(self) -> str:
+        """Representación técnica del validador."""
+        return (f"ValidadorConcurrente(hilos={self.hilos}, "
+                f"tamano_bloque={self.tamano_bloque}, gil={gil_habilitado()})")
+
+
+def validar_concurrente(filas: Iterable[Dict], hilos: Optional[int] = None,
+                        tamano_bloque: int = 1_000) -> List[ResultadoValidacion]:
+    """
+    Valida filas con un pool de hilos temporal.
+    
+    Args:
+        filas (Iterable[Dict]): Diccionarios con los campos de Persona
+        hilos (Optional[int]): Cantidad de hilos; por defecto os.cpu_count()
+        tamano_bloque (int): Filas que valida cada tarea del pool
+        
+    Returns:
+        List[ResultadoValidacion]: Un resultado por fila, en el orden de entrada
+    """
+    with ValidadorConcurrente(hilos, tamano_bloque) as validador:
+        return validador.validar(filas)
@@ -2,11 +2,174 @@
 Módulo core con la clase Persona implementando el patrón Builder.
 
 Este módulo contiene la clase Persona que utiliza el patrón de diseño
-Builder para construir objetos de manera fluida y validada.
+Builder para construir objetos de manera fluida y validada, y la clase
+PersonaTabla para guardar muchas personas en formato columnar.
 """
 
-from typing import Optional
-from .validators import ValidadorDatosPersonales, ValidadorDatosContacto
+from array import array
+from itertools import accumulate, compress
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
+from .validators import ValidadorDatosPersonales, ValidadorDatosContacto, _entero
+
+
+# Bits de cada campo en las máscaras de ResultadoValidacion
+CAMPO_NOMBRE = 1 << 0
+CAMPO_EDAD = 1 << 1
+CAMPO_DOCUMENTO_IDENTIDAD = 1 << 2
+CAMPO_EMAIL = 1 << 3
+CAMPO_CELULAR = 1 << 4
+CAMPO_DIRECCION = 1 << 5
+
+# Orden de validación de los campos: (nombre del campo, bit)
+_CAMPOS = (
+    ('nombre', CAMPO_NOMBRE),
+    ('edad', CAMPO_EDAD),
+    ('documento_identidad', CAMPO_DOCUMENTO_IDENTIDAD),
+    ('email', CAMPO_EMAIL),
+    ('celular', CAMPO_CELULAR),
+    ('direccion', CAMPO_DIRECCION),
+)
+
+# Plantillas de los mensajes de error; se formatean con el valor recibido
+_MENSAJES_ERROR = {
+    'nombre': ("Nombre inválido: '{}'. Debe contener solo letras y tener "
+               "entre 2-50 caracteres."),
+    'edad': "Edad inválida: {}. Debe ser un número entre 0 y 150.",
+    'documento_identidad': ("Documento inválido: '{}'. Debe contener solo números "
+                            "y tener entre 7-12 dígitos."),
+    'email': "Email inválido: '{}'. Debe tener un formato válido de email.",
+    'celular': "Celular inválido: '{}'. Debe tener entre 8-15 dígitos.",
+    'direccion': ("Dirección inválida: '{}'. Debe tener entre 5-200 caracteres "
+                  "y formato válido."),
+}
+_MENSAJE_NOMBRE_OBLIGATORIO = "El nombre es obligatorio para construir una persona."
+
+# Los valores más largos se recortan en los mensajes de error, para no copiar
+# entradas enormes en cada excepción
+_LONGITUD_MAXIMA_EN_MENSAJE = 100
+
+
+def _mensaje_error(campo: str, valor: Any) -> str:
+    """Construye el mensaje de error de un campo con el valor recibido."""
+    if isinstance(valor, str) and len(valor) > _LONGITUD_MAXIMA_EN_MENSAJE:
+        valor = f"{valor[:_LONGITUD_MAXIMA_EN_MENSAJE]}... ({len(valor)} caracteres)"
+    return _MENSAJES_ERROR[campo].format(valor)
+
+
+MODOS_VALIDACION = ('estricto', 'acumular')
+
+# Los validadores no guardan estado: una sola instancia de cada uno basta
+_VALIDADOR_PERSONALES = ValidadorDatosPersonales()
+_VALIDADOR_CONTACTO = ValidadorDatosContacto()
+
+
+def _texto(valor: Any) -> Optional[str]:
+    """Convierte a cadena los valores escalares que no son texto."""
+    if valor is None or isinstance(valor, str):
+        return valor
+    return str(valor)
+
+
+def _edad(valor: Any) -> Any:
+    """
+    Convierte a entero la edad recibida como texto de dígitos.
+    
+    Los textos que int() no acepta (como '²') se devuelven sin cambios
+    para que la validación de la edad los rechace.
+    """
+    if isinstance(valor, str) and valor.isdigit():
+        entero = _entero(valor)
+        return valor if entero is None else entero
+    return valor
+
+
+class ResultadoValidacion:
+    """
+    Resultado de validar un registro completo sin lanzar excepciones.
+    
+    Guarda las máscaras de bits de los campos con error y una referencia a
+    los datos originales. Los códigos y mensajes de error se construyen
+    solo cuando se consultan.
+    """
+    
+    __slots__ = ('persona', 'errores', 'faltantes', '_datos')
+    
+    def __init__(self, persona: Optional['Persona'], errores: int,
+                 faltantes: int, datos: Dict):
+        """
+        Inicializa el resultado.
+        
+        Args:
+            persona (Optional[Persona]): La persona construida, o None si
+                hubo errores
+            errores (int): Máscara de los campos presentes pero inválidos
+            faltantes (int): Máscara de los campos obligatorios ausentes
+            datos (Dict): Los datos originales validados
+        """
+        self.persona = persona
+        self.errores = errores
+        self.faltantes = faltantes
+        self._datos = datos
+    
+    @property
+    def valido(self) -> bool:
+        """Indica si el registro no tiene errores."""
+        return not (self.errores or self.faltantes)
+    
+    @property
+    def mascara(self) -> int:
+        """Máscara de validez: un bit encendido por cada campo sin error."""
+        return ~(self.errores | self.faltantes) & 0b111111
+    
+    @property
+    def codigos(self) -> Tuple[str, ...]:
+        """
+        Códigos de error en orden de campo; los campos obligatorios
+        ausentes van al final, igual que en construir().
+        
+        Returns:
+            Tuple[str, ...]: Códigos de la forma '<campo>_invalido' o
+            '<campo>_faltante'
+        """
+        codigos = [f"{campo}_invalido" for campo, bit in _CAMPOS
+                   if self.errores & bit]
+        codigos.extend(f"{campo}_faltante" for campo, bit in _CAMPOS
+                       if self.faltantes & bit)
+        return tuple(codigos)
+    
+    @property
+    def mensajes(self) -> Tuple[str, ...]:
+        """
+        Mensajes de error legibles, iguales a los de los métodos establecer_*.
+        
+        Returns:
+            Tuple[str, ...]: Un mensaje por cada campo con error
+        """
+        mensajes = [_mensaje_error(campo, self._datos.get(campo))
+                    for campo, bit in _CAMPOS if self.errores & bit]
+        if self.faltantes & CAMPO_NOMBRE:
+            mensajes.append(_MENSAJE_NOMBRE_OBLIGATORIO)
+        return tuple(mensajes)
+    
+    def __bool__(self) -> bool:
+        """Permite usar el resultado directamente en condiciones."""
+        return self.valido
+    
+    def __repr__(self) -> str:
+        """Representación técnica del resultado."""
+        return f"ResultadoValidacion(valido={self.valido}, codigos={self.codigos})"
 
 
 class Persona:
@@ -15,9 +178,30 @@ class Persona:
     
     Permite construir una persona estableciendo por partes los datos
     personales y de contacto, utilizando validadores especializados.
+    
+    Los datos se guardan en __slots__ (sin __dict__ por instancia) y los
+    validadores, que no tienen estado, se comparten entre todas las
+    instancias.
+    
+    Una Persona no debe modificarse desde varios hilos a la vez: cada hilo
+    construye las suyas, y para compartir una persona terminada se usa
+    congelar().
     """
     
-    def __init__(self):
+    __slots__ = (
+        '_nombre',
+        '_edad',
+        '_documento_identidad',
+        '_email',
+        '_celular',
+        '_direccion',
+    )
+    
+    # Validadores compartidos por todas las instancias
+    _validador_personales = _VALIDADOR_PERSONALES
+    _validador_contacto = _VALIDADOR_CONTACTO
+    
+    def __init__(self) -> None:
         """Inicializa una instancia vacía de Persona."""
         # Datos personales
         self._nombre: Optional[str] = None
@@ -28,10 +212,6 @@ class Persona:
         self._email: Optional[str] = None
         self._celular: Optional[str] = None
         self._direccion: Optional[str] = None
-        
-        # Validadores
-        self._validador_personales = ValidadorDatosPersonales()
-        self._validador_contacto = ValidadorDatosContacto()
     
     def establecer_nombre(self, nombre: str) -> 'Persona':
         """
@@ -47,7 +227,7 @@ class Persona:
             ValueError: Si el nombre no es válido
         """
         if not self._validador_personales.validar_nombre(nombre):
-            raise ValueError(f"Nombre inválido: '{nombre}'. Debe contener solo letras y tener entre 2-50 caracteres.")
+            raise ValueError(_mensaje_error('nombre', nombre))
         
         self._nombre = nombre.strip()
         return self
@@ -67,7 +247,7 @@ class Persona:
         """
         edad_str = str(edad)
         if not self._validador_personales.validar_edad(edad_str):
-            raise ValueError(f"Edad inválida: {edad}. Debe ser un número entre 0 y 150.")
+            raise ValueError(_mensaje_error('edad', edad))
         
         self._edad = edad
         return self
@@ -86,7 +266,7 @@ class Persona:
             ValueError: Si el documento no es válido
         """
         if not self._validador_personales.validar_documento_identidad(documento):
-            raise ValueError(f"Documento inválido: '{documento}'. Debe contener solo números y tener entre 7-12 dígitos.")
+            raise ValueError(_mensaje_error('documento_identidad', documento))
         
         self._documento_identidad = documento
         return self
@@ -105,7 +285,7 @@ class Persona:
             ValueError: Si el email no es válido
         """
         if not self._validador_contacto.validar_email(email):
-            raise ValueError(f"Email inválido: '{email}'. Debe tener un formato válido de email.")
+            raise ValueError(_mensaje_error('email', email))
         
         self._email = email.lower().strip()
         return self
@@ -124,7 +304,7 @@ class Persona:
             ValueError: Si el celular no es válido
         """
         if not self._validador_contacto.validar_celular(celular):
-            raise ValueError(f"Celular inválido: '{celular}'. Debe tener entre 8-15 dígitos.")
+            raise ValueError(_mensaje_error('celular', celular))
         
         self._celular = celular
         return self
@@ -143,11 +323,26 @@ class Persona:
             ValueError: Si la dirección no es válida
         """
         if not self._validador_contacto.validar_direccion(direccion):
-            raise ValueError(f"Dirección inválida: '{direccion}'. Debe tener entre 5-200 caracteres y formato válido.")
+            raise ValueError(_mensaje_error('direccion', direccion))
         
         self._direccion = direccion.strip()
         return self
     
+    def reiniciar(self) -> 'Persona':
+        """
+        Borra todos los datos para reutilizar la instancia con otra persona.
+        
+        Returns:
+            Persona: La instancia actual, vacía, para encadenamiento fluido
+        """
+        self._nombre = None
+        self._edad = None
+        self._documento_identidad = None
+        self._email = None
+        self._celular = None
+        self._direccion = None
+        return self
+    
     def construir(self) -> 'Persona':
         """
         Finaliza la construcción de la persona.
@@ -160,10 +355,195 @@ class Persona:
         """
         # Validar que se hayan establecido al menos los datos básicos
         if not self._nombre:
-            raise ValueError("El nombre es obligatorio para construir una persona.")
+            raise ValueError(_MENSAJE_NOMBRE_OBLIGATORIO)
         
         return self
     
+    @overload
+    @classmethod
+    def desde_dict(cls, datos: Dict, modo: Literal['estricto'] = ...) -> 'Persona': ...
+    
+    @overload
+    @classmethod
+    def desde_dict(cls, datos: Dict,
+                   modo: Literal['acumular']) -> ResultadoValidacion: ...
+    
+    @overload
+    @classmethod
+    def desde_dict(cls, datos: Dict,
+                   modo: str) -> Union['Persona', ResultadoValidacion]: ...
+    
+    @classmethod
+    def desde_dict(cls, datos: Dict,
+                   modo: str = 'estricto') -> Union['Persona', ResultadoValidacion]:
+        """
+        Construye una persona a partir de un diccionario.
+        
+        Los campos ausentes, None o vacíos se omiten. La edad en texto se
+        convierte a entero y los demás valores que no son texto se
+        convierten con str().
+        
+        En modo 'estricto' se usan los métodos establecer_* y se lanza la
+        excepción del primer campo inválido. En modo 'acumular' se validan
+        los seis campos en una sola pasada sin lanzar excepciones y se
+        devuelve un ResultadoValidacion con todos los errores.
+        
+        Args:
+            datos (Dict): Diccionario con los campos de la persona
+            modo (str): 'estricto' o 'acumular'
+            
+        Returns:
+            Persona | ResultadoValidacion: La persona construida (modo
+            'estricto') o el resultado de la validación (modo 'acumular')
+            
+        Raises:
+            ValueError: Si el modo no existe, o en modo 'estricto' si algún
+                campo no es válido o falta el nombre
+        """
+        if modo == 'acumular':
+            return cls._validar_acumulando(datos)
+        if modo != 'estricto':
+            raise ValueError(
+                f"Modo inválido: '{modo}'. Debe ser uno de {MODOS_VALIDACION}.")
+        
+        persona = cls()
+        nombre = _texto(datos.get('nombre'))
+        if nombre:
+            persona.establecer_nombre(nombre)
+        edad = datos.get('edad')
+        if edad is not None and edad != '':
+            persona.establecer_edad(_edad(edad))
+        documento = _texto(datos.get('documento_identidad'))
+        if documento:
+            persona.establecer_documento_identidad(documento)
+        email = _texto(datos.get('email'))
+        if email:
+            persona.establecer_email(email)
+        celular = _texto(datos.get('celular'))
+        if celular:
+            persona.establecer_celular(celular)
+        direccion = _texto(datos.get('direccion'))
+        if direccion:
+            persona.establecer_direccion(direccion)
+        return persona.construir()
+    
+    @classmethod
+    def _validar_acumulando(cls, datos: Dict) -> ResultadoValidacion:
+        """Valida todos los campos de un diccionario sin lanzar excepciones."""
+        persona = cls()
+        errores, faltantes = persona._cargar_acumulando(datos)
+        if errores or faltantes:
+            return ResultadoValidacion(None, errores, faltantes, datos)
+        return ResultadoValidacion(persona, 0, 0, datos)
+    
+    def _cargar_acumulando(self, datos: Dict) -> Tuple[int, int]:
+        """
+        Valida los campos de un diccionario y guarda los válidos en esta instancia.
+        
+        Los campos ausentes o inválidos no se modifican.
+        
+        Returns:
+            Tuple[int, int]: Máscaras de los campos inválidos y de los
+            obligatorios que faltan
+        """
+        persona = self
+        personales = self._validador_personales
+        contacto = self._validador_contacto
+        errores = 0
+        faltantes = 0
+        
+        nombre = _texto(datos.get('nombre'))
+        if not nombre:
+            faltantes |= CAMPO_NOMBRE
+        elif personales.validar_nombre(nombre):
+            persona._nombre = nombre.strip()
+        else:
+            errores |= CAMPO_NOMBRE
+        
+        edad = datos.get('edad')
+        if edad is not None and edad != '':
+            edad = _edad(edad)
+            if personales.validar_edad(str(edad)):
+                persona._edad = edad
+            else:
+                errores |= CAMPO_EDAD
+        
+        documento = _texto(datos.get('documento_identidad'))
+        if documento:
+            if personales.validar_documento_identidad(documento):
+                persona._documento_identidad = documento
+            else:
+                errores |= CAMPO_DOCUMENTO_IDENTIDAD
+        
+        email = _texto(datos.get('email'))
+        if email:
+            if contacto.validar_email(email):
+                persona._email = email.lower().strip()
+            else:
+                errores |= CAMPO_EMAIL
+        
+        celular = _texto(datos.get('celular'))
+        if celular:
+            if contacto.validar_celular(celular):
+                persona._celular = celular
+            else:
+                errores |= CAMPO_CELULAR
+        
+        direccion = _texto(datos.get('direccion'))
+        if direccion:
+            if contacto.validar_direccion(direccion):
+                persona._direccion = direccion.strip()
+            else:
+                errores |= CAMPO_DIRECCION
+        
+        return errores, faltantes
+    
+    def reemplazar(self, **campos: Any) -> 'Persona':
+        """
+        Crea una copia de la persona cambiando solo los campos indicados.
+        
+        Los datos ya validados se copian directamente; solo los campos
+        recibidos pasan por su método establecer_*. Un valor None borra
+        el campo.
+        
+        Args:
+            **campos: Nuevos valores, por nombre de campo (nombre, edad,
+                documento_identidad, email, celular, direccion)
+            
+        Returns:
+            Persona: Nueva persona del mismo tipo con los cambios aplicados
+            
+        Raises:
+            TypeError: Si algún campo no existe
+            ValueError: Si algún valor nuevo no es válido
+        """
+        tipo = type(self)
+        nueva = tipo.__new__(tipo)
+        nueva._nombre = self._nombre
+        nueva._edad = self._edad
+        nueva._documento_identidad = self._documento_identidad
+        nueva._email = self._email
+        nueva._celular = self._celular
+        nueva._direccion = self._direccion
+        for campo, valor in campos.items():
+            if campo not in _SETTERS:
+                raise TypeError(f"Campo desconocido: '{campo}'.")
+            if valor is None:
+                setattr(nueva, '_' + campo, None)
+            else:
+                getattr(nueva, _SETTERS[campo])(valor)
+        return nueva
+    
+    def congelar(self) -> 'PersonaInmutable':
+        """
+        Obtiene una versión inmutable de la persona sin volver a validarla.
+        
+        Returns:
+            PersonaInmutable: Registro inmutable con los mismos datos
+        """
+        return PersonaInmutable(self._nombre, self._edad, self._documento_identidad,
+                                self._email, self._celular, self._direccion)
+    
     # Propiedades para acceso a los datos
     @property
     def nombre(self) -> Optional[str]:
@@ -255,6 +635,73 @@ class Persona:
         return self.__str__()
 
 
+# Método establecer_* de cada campo
+_SETTERS = {campo: 'establecer_' + campo for campo, _ in _CAMPOS}
+
+
+class PersonaInmutable(NamedTuple):
+    """
+    Registro inmutable de una persona ya validada.
+    
+    Es una tupla: copiarla o compartirla no cuesta nada y reemplazar
+    campos crea una sola tupla nueva que comparte los valores que no
+    cambian. Se obtiene con Persona.congelar().
+    """
+    
+    nombre: Optional[str] = None
+    edad: Optional[int] = None
+    documento_identidad: Optional[str] = None
+    email: Optional[str] = None
+    celular: Optional[str] = None
+    direccion: Optional[str] = None
+    
+    def reemplazar(self, **campos: Any) -> 'PersonaInmutable':
+        """
+        Crea un registro nuevo validando solo los campos que cambian.
+        
+        Args:
+            **campos: Nuevos valores, por nombre de campo; None borra el campo
+            
+        Returns:
+            PersonaInmutable: Nuevo registro con los cambios aplicados
+            
+        Raises:
+            TypeError: Si algún campo no existe
+            ValueError: Si algún valor nuevo no es válido
+        """
+        temporal = Persona()
+        valores = {}
+        for campo, valor in campos.items():
+            if campo not in _SETTERS:
+                raise TypeError(f"Campo desconocido: '{campo}'.")
+            if valor is not None:
+                getattr(temporal, _SETTERS[campo])(valor)
+                valor = getattr(temporal, '_' + campo)
+            valores[campo] = valor
+        return self._replace(**valores)
+    
+    def descongelar(self) -> Persona:
+        """
+        Obtiene una Persona editable con los mismos datos, sin volver a validarlos.
+        
+        Returns:
+            Persona: Nueva persona con los datos del registro
+        """
+        persona = Persona.__new__(Persona)
+        (persona._nombre, persona._edad, persona._documento_identidad,
+         persona._email, persona._celular, persona._direccion) = self
+        return persona
+    
+    def obtener_todos_los_datos(self) -> dict:
+        """
+        Obtiene todos los datos del registro.
+        
+        Returns:
+            dict: Diccionario con todos los datos
+        """
+        return dict(zip(self._fields, self))
+
+
 class PersonaBuilder:
     """
     Builder alternativo para construcción más explícita de Persona.
@@ -288,16 +735,24 @@ class PersonaBuilder:
         return Persona().establecer_nombre(nombre).establecer_edad(edad)
     
     @staticmethod
-    def copia_desde(otra_persona: Persona) -> Persona:
+    def copia_desde(otra_persona: Persona, confiar: bool = False) -> Persona:
         """
         Crea una nueva persona copiando los datos de otra.
         
         Args:
             otra_persona (Persona): Persona a copiar
+            confiar (bool): Si es True y otra_persona es una Persona (o una
+                PersonaInmutable), sus datos ya validados se copian sin
+                volver a validarlos
             
         Returns:
             Persona: Nueva persona con los datos copiados
         """
+        if confiar and isinstance(otra_persona, Persona):
+            return otra_persona.reemplazar()
+        if confiar and isinstance(otra_persona, PersonaInmutable):
+            return otra_persona.descongelar()
+        
         nueva = Persona()
         
         if otra_persona.nombre:
@@ -313,4 +768,398 @@ class PersonaBuilder:
         if otra_persona.direccion:
             nueva.establecer_direccion(otra_persona.direccion)
         
-        return nueva
\ No newline at end of file
+        return nueva
+
+
+# Valor centinela de la columna de edades para las filas sin edad
+EDAD_AUSENTE = -1
+
+
+def _importar_opcional(modulo: str) -> Any:
+    """
+    Importa una dependencia opcional.
+    
+    Raises:
+        ImportError: Si la dependencia no está instalada
+    """
+    try:
+        return __import__(modulo)
+    except ImportError as error:
+        raise ImportError(
+            f"Esta operación requiere '{modulo}'. Instálelo con: pip install {modulo}"
+        ) from error
+
+
+class _ColumnaTexto:
+    """Columna de cadenas en un buffer UTF-8 con desplazamientos (estilo Arrow)."""
+    
+    __slots__ = ('datos', 'desplazamientos', 'validos')
+    
+    def __init__(self) -> None:
+        self.datos = bytearray()
+        self.desplazamientos = array('q', [0])
+        self.validos = bytearray()
+    
+    def __len__(self) -> int:
+        return len(self.validos)
+    
+    def extender(self, valores: List[Optional[str]]) -> None:
+        """Agrega varios valores codificándolos en una sola pasada."""
+        codificados = [b'' if v is None else v.encode('utf-8') for v in valores]
+        inicio = self.desplazamientos[-1]
+        self.desplazamientos.extend(
+            inicio + fin for fin in accumulate(map(len, codificados))
+        )
+        self.datos += b''.join(codificados)
+        self.validos += bytes(v is not None for v in valores)
+    
+    def valor(self, indice: int) -> Optional[str]:
+        """Decodifica el valor de una fila."""
+        if not self.validos[indice]:
+            return None
+        inicio, fin = self.desplazamientos[indice], self.desplazamientos[indice + 1]
+        return self.datos[inicio:fin].decode('utf-8')
+    
+    def seleccionar(self, indices: List[int]) -> '_ColumnaTexto':
+        """Crea una columna nueva con las filas indicadas."""
+        nueva = _ColumnaTexto()
+        datos = self.datos
+        desplazamientos = self.desplazamientos
+        partes = [datos[desplazamientos[i]:desplazamientos[i + 1]] for i in indices]
+        nueva.desplazamientos.extend(accumulate(map(len, partes)))
+        nueva.datos = bytearray(b''.join(partes))
+        validos = self.validos
+        nueva.validos = bytearray(validos[i] for i in indices)
+        return nueva
+
+
+class _ColumnaEdad:
+    """Columna de edades en un arreglo de enteros de 16 bits."""
+    
+    __slots__ = ('valores',)
+    
+    def __init__(self) -> None:
+        self.valores = array('h')
+    
+    def __len__(self) -> int:
+        return len(self.valores)
+    
+    def extender(self, valores: List[Optional[int]]) -> None:
+        """
+        Agrega varias edades; None se guarda como EDAD_AUSENTE.
+        
+        Las edades se convierten con int(), porque establecer_edad también
+        guarda edades en texto como '30'; si alguna falla no se agrega
+        ninguna.
+        """
+        self.valores.extend([EDAD_AUSENTE if v is None else int(v) for v in valores])
+    
+    def valor(self, indice: int) -> Optional[int]:
+        """Devuelve la edad de una fila, o None si no tiene."""
+        edad = self.valores[indice]
+        return None if edad == EDAD_AUSENTE else edad
+    
+    def seleccionar(self, indices: List[int]) -> '_ColumnaEdad':
+        """Crea una columna nueva con las filas indicadas."""
+        nueva = _ColumnaEdad()
+        valores = self.valores
+        nueva.valores = array('h', [valores[i] for i in indices])
+        return nueva
+
+
+class VistaColumna:
+    """
+    Vista de un rango de filas de una columna de PersonaTabla.
+    
+    No copia datos: guarda una referencia a la columna y los límites del
+    rango. Los valores se decodifican solo al accederlos.
+    """
+    
+    __slots__ = ('_columna', '_inicio', '_fin')
+    
+    def __init__(self, columna: Union[_ColumnaTexto, _ColumnaEdad], inicio: int,
+                 fin: int) -> None:
+        """
+        Inicializa la vista.
+        
+        Args:
+            columna: La columna interna de PersonaTabla
+            inicio (int): Primera fila de la vista
+            fin (int): Fila siguiente a la última de la vista
+        """
+        self._columna = columna
+        self._inicio = inicio
+        self._fin = fin
+    
+    def __len__(self) -> int:
+        """Cantidad de filas de la vista."""
+        return self._fin - self._inicio
+    
+    def __getitem__(self, indice: int) -> Union[str, int, None]:
+        """Obtiene el valor de una fila relativa al inicio de la vista."""
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice fuera del rango de la vista.")
+        return self._columna.valor(self._inicio + indice)
+    
+    def __iter__(self) -> Iterator:
+        """Recorre los valores de la vista."""
+        valor = self._columna.valor
+        for indice in range(self._inicio, self._fin):
+            yield valor(indice)
+    
+    def buffers(self) -> Tuple[memoryview, ...]:
+        """
+        Obtiene los buffers de la vista sin copiarlos.
+        
+        Mientras existan estos memoryview la tabla no puede crecer; libérelos
+        (por ejemplo con memoryview.release()) antes de agregar filas.
+        
+        Returns:
+            Tuple[memoryview, ...]: (valores,) para la edad o
+            (desplazamientos, datos, validos) para las columnas de texto;
+            los desplazamientos son absolutos respecto de datos
+        """
+        columna = self._columna
+        if isinstance(columna, _ColumnaEdad):
+            return (memoryview(columna.valores)[self._inicio:self._fin],)
+        return (
+            memoryview(columna.desplazamientos)[self._inicio:self._fin + 1],
+            memoryview(columna.datos),
+            memoryview(columna.validos)[self._inicio:self._fin],
+        )
+
+
+class PersonaTabla:
+    """
+    Almacén columnar de personas (estructura de arreglos).
+    
+    Cada campo de Persona se guarda en su propia columna: la edad en un
+    arreglo de enteros y los demás campos en buffers UTF-8 con
+    desplazamientos, al estilo de Apache Arrow. Así se evita crear un
+    objeto Persona y un diccionario por fila.
+    """
+    
+    COLUMNAS = (
+        'nombre',
+        'edad',
+        'documento_identidad',
+        'email',
+        'celular',
+        'direccion',
+    )
+    
+    def __init__(self) -> None:
+        """Inicializa una tabla vacía."""
+        self._columnas: Dict[str, Union[_ColumnaTexto, _ColumnaEdad]] = {
+            campo: _ColumnaEdad() if campo == 'edad' else _ColumnaTexto()
+            for campo in self.COLUMNAS
+        }
+    
+    @classmethod
+    def desde_personas(cls, personas: Iterable[Persona]) -> 'PersonaTabla':
+        """
+        Crea una tabla a partir de objetos Persona ya construidos.
+        
+        Args:
+            personas (Iterable[Persona]): Las personas a agregar
+            
+        Returns:
+            PersonaTabla: Nueva tabla con una fila por persona
+        """
+        tabla = cls()
+        tabla.agregar_personas(personas)
+        return tabla
+    
+    def __len__(self) -> int:
+        """Cantidad de filas de la tabla."""
+        return len(self._columnas['edad'])
+    
+    def agregar_filas(self, filas: Iterable[Dict]) -> None:
+        """
+        Agrega en bloque filas ya validadas.
+        
+        Las filas no se vuelven a validar: deben provenir de
+        Persona.obtener_todos_los_datos() o de una fuente equivalente. Los
+        campos ausentes se guardan como None.
+        
+        Args:
+            filas (Iterable[Dict]): Diccionarios con los campos de Persona
+        """
+        filas = list(filas)
+        self._extender({campo: [fila.get(campo) for fila in filas]
+                        for campo in self.COLUMNAS})
+    
+    def agregar_personas(self, personas: Iterable[Persona]) -> None:
+        """
+        Agrega en bloque objetos Persona ya construidos.
+        
+        Args:
+            personas (Iterable[Persona]): Las personas a agregar
+        """
+        personas = list(personas)
+        self._extender({campo: [getattr(p, '_' + campo) for p in personas]
+                        for campo in self.COLUMNAS})
+    
+    def _extender(self, valores: Dict[str, List[Any]]) -> None:
+        """
+        Agrega los valores de cada columna.
+        
+        La edad, la única columna cuyos valores pueden rechazarse, se
+        agrega primero: si falla, ninguna columna cambia de largo.
+        """
+        self._columnas['edad'].extender(valores['edad'])
+        for campo, columna in self._columnas.items():
+            if campo != 'edad':
+                columna.extender(valores[campo])
+    
+    def columna(self, campo: str, inicio: int = 0,
+                fin: Optional[int] = None) -> VistaColumna:
+        """
+        Obtiene un rango de una columna sin copiar los datos.
+        
+        Args:
+            campo (str): Nombre de la columna
+            inicio (int): Primera fila del rango
+            fin (Optional[int]): Fila siguiente a la última; por defecto, el final
+            
+        Returns:
+            VistaColumna: Vista del rango de la columna
+            
+        Raises:
+            KeyError: Si la columna no existe
+        """
+        inicio, fin, _ = slice(inicio, fin).indices(len(self))
+        return VistaColumna(self._columnas[campo], inicio, max(inicio, fin))
+    
+    def fila(self, indice: int) -> Dict:
+        """
+        Obtiene una fila como diccionario (igual que obtener_todos_los_datos).
+        
+        Args:
+            indice (int): Número de fila
+            
+        Returns:
+            dict: Diccionario con todos los datos de la fila
+        """
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice de fila fuera de rango.")
+        return {campo: columna.valor(indice)
+                for campo, columna in self._columnas.items()}
+    
+    def filtrar(self, mascara: Iterable) -> 'PersonaTabla':
+        """
+        Crea una tabla nueva con las filas cuya posición en la máscara es verdadera.
+        
+        Acepta las máscaras de ValidadorLote (bytearray o arreglo de NumPy).
+        
+        Args:
+            mascara (Iterable): Un valor verdadero por cada fila a conservar
+            
+        Returns:
+            PersonaTabla: Nueva tabla con las filas seleccionadas
+        """
+        indices = list(compress(range(len(self)), mascara))
+        nueva = PersonaTabla()
+        nueva._columnas = {campo: columna.seleccionar(indices)
+                           for campo, columna in self._columnas.items()}
+        return nueva
+    
+    def a_numpy(self) -> Dict:
+        """
+        Exporta las columnas a arreglos de NumPy sin crear objetos por fila.
+        
+        Returns:
+            dict: 'edad' como arreglo int16 (EDAD_AUSENTE en las filas sin
+            edad) y cada columna de texto como una tupla
+            (desplazamientos int64, datos uint8, validos bool)
+            
+        Raises:
+            ImportError: Si NumPy no está instalado
+        """
+        np = _importar_opcional('numpy')
+        resultado = {}
+        for campo, columna in self._columnas.items():
+            if isinstance(columna, _ColumnaEdad):
+                resultado[campo] = np.frombuffer(columna.valores, dtype=np.int16).copy()
+            else:
+                resultado[campo] = (
+                    np.frombuffer(columna.desplazamientos, dtype=np.int64).copy(),
+                    np.frombuffer(columna.datos, dtype=np.uint8).copy(),
+                    np.frombuffer(columna.validos, dtype=np.bool_).copy(),
+                )
+        return resultado
+    
+    def a_arrow(self) -> Any:
+        """
+        Exporta la tabla a una pyarrow.Table sin crear objetos por fila.
+        
+        Los buffers de texto se copian una sola vez, en bloque: la tabla de
+        Arrow no los comparte, así que la PersonaTabla puede seguir creciendo
+        mientras la tabla exportada exista.
+        
+        Returns:
+            pyarrow.Table: Tabla con columnas large_string e int16
+            
+        Raises:
+            ImportError: Si pyarrow o NumPy no están instalados
+        """
+        pa = _importar_opcional('pyarrow')
+        np = _importar_opcional('numpy')
+        arreglos = {}
+        for campo, columna in self._columnas.items():
+            if isinstance(columna, _ColumnaEdad):
+                valores = np.frombuffer(columna.valores, dtype=np.int16).copy()
+                arreglos[campo] = pa.array(valores, mask=valores == EDAD_AUSENTE)
+                continue
+            validos = np.frombuffer(columna.validos, dtype=np.bool_)
+            mapa_bits = None
+            if not validos.all():
+                mapa_bits = pa.py_buffer(np.packbits(validos, bitorder='little'))
+            arreglos[campo] = pa.Array.from_buffers(
+                pa.large_string(),
+                len(columna),
+                [mapa_bits,
+                 pa.py_buffer(bytes(columna.desplazamientos)),
+                 pa.py_buffer(bytes(columna.datos))],
+            )
+        return pa.table(arreglos)
+    
+    def a_pandas(self) -> Any:
+        """
+        Exporta la tabla a un pandas.DataFrame.
+        
+        Si pyarrow está instalado, las columnas de texto usan tipos de Arrow
+        y no se crea ningún objeto str por fila; si no, se decodifican a
+        columnas de tipo object.
+        
+        Returns:
+            pandas.DataFrame: Un registro por fila
+            
+        Raises:
+            ImportError: Si pandas no está instalado
+        """
+        pd = _importar_opcional('pandas')
+        try:
+            tabla = self.a_arrow()
+        except ImportError:
+            tabla = None
+        if tabla is not None:
+            return tabla.to_pandas(types_mapper=pd.ArrowDtype)
+        
+        np = _importar_opcional('numpy')
+        datos = {}
+        for campo, columna in self._columnas.items():
+            if isinstance(columna, _ColumnaEdad):
+                valores = np.frombuffer(columna.valores, dtype=np.int16).copy()
+                datos[campo] = pd.arrays.IntegerArray(valores, valores == EDAD_AUSENTE)
+            else:
+                datos[campo] = [columna.valor(i) for i in range(len(columna))]
+        return pd.DataFrame(datos, columns=list(self.COLUMNAS))
+    
+    def __repr__(self) -> str:
+        """Representación técnica de la tabla."""
+        return f"PersonaTabla(filas={len(self)})"
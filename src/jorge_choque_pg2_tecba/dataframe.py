@@ -0,0 +1,306 @@
+"""
+Módulo de integración con pandas: validación vectorizada por columnas.
+
+Importar este módulo registra el accesor `validacion` en DataFrame y en
+Series. Las reglas de validators.py se traducen a operaciones de cadenas
+de pandas (str.fullmatch, str.len, str.replace, str.isdigit), que con
+pyarrow instalado corren en los kernels de Arrow en lugar de llamar a un
+validador por fila.
+
+Cada resultado coincide con el del validador escalar sobre str(valor):
+ValidadorDatosPersonales.validar_nombre, validar_edad y
+validar_documento_identidad, y ValidadorDatosContacto.validar_email,
+validar_celular y validar_direccion. Como en Persona.desde_dict, una
+edad decimal no es válida aunque no tenga parte fraccionaria (str(30.0)
+es '30.0'): una columna de edades con nulos, que pandas guarda como
+float64, debe convertirse antes con astype('Int64').
+
+Ejemplo:
+    >>> import jorge_choque_pg2_tecba.dataframe  # registra el accesor
+    >>> df.validacion.mascaras()       # un bool por campo y fila
+    >>> df.validacion.codigos()        # VALIDO, AUSENTE o INVALIDO por campo
+    >>> df[df.validacion.validos()]    # filas que Persona.desde_dict acepta
+    >>> df["email"].validacion.mascara("email")
+"""
+
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from .core import _importar_opcional
+from .validators import (
+    _CARACTERES_DIRECCION,
+    _CARACTERES_LETRAS,
+    _ESPACIOS,
+    _PATRON_EMAIL,
+    LONGITUD_MAXIMA_EMAIL,
+    LONGITUD_MAXIMA_ENTRADA,
+)
+
+pd = _importar_opcional('pandas')
+
+# pandas no trae anotaciones de tipos: sus objetos se anotan con estos alias
+_Serie = Any
+_Tabla = Any
+
+
+CAMPOS = (
+    'nombre',
+    'edad',
+    'documento_identidad',
+    'email',
+    'celular',
+    'direccion',
+)
+
+# Códigos por campo de DataFrame.validacion.codigos()
+VALIDO = 0
+AUSENTE = 1
+INVALIDO = 2
+
+
+def _clase(caracteres: Iterable[str]) -> str:
+    """
+    Escribe un conjunto de caracteres como clase de expresión regular.
+    
+    Los caracteres van literales (solo se escapan los especiales de una
+    clase) para que la clase signifique lo mismo en re y en RE2 (pyarrow).
+    """
+    especiales = set('\\]^-[')
+    return '[' + ''.join('\\' + c if c in especiales else c
+                         for c in sorted(caracteres)) + ']'
+
+
+_ESPACIO = _clase(_ESPACIOS)
+_LETRAS = _clase(_CARACTERES_LETRAS) + '+'
+_DIRECCION = _clase(_CARACTERES_DIRECCION) + '+'
+
+# _PATRON_EMAIL con re.match: '^...$', donde '$' también coincide antes de
+# un salto de línea final. Con fullmatch y '\n?' al final es igual en RE2.
+_EMAIL = _PATRON_EMAIL.pattern[1:-1] + '\n?'
+
+
+def _tipo_texto() -> Any:
+    """Tipo de cadena de pandas: el de pyarrow si está instalado."""
+    try:
+        return pd.StringDtype('pyarrow')
+    except ImportError:
+        return pd.StringDtype('python')
+
+
+def _como_texto(serie: _Serie) -> Tuple[_Serie, _Serie]:
+    """Convierte una Series a cadenas, manteniendo los valores ausentes."""
+    presentes = serie.notna()
+    if isinstance(serie.dtype, pd.StringDtype):
+        return serie, presentes
+    texto = serie.where(presentes).map(str, na_action='ignore')
+    return texto.astype(_tipo_texto()), presentes
+
+
+def _final(condicion: _Serie, presentes: _Serie) -> _Serie:
+    """Convierte un resultado con valores ausentes en una máscara bool."""
+    return condicion.fillna(False).astype(bool) & presentes
+
+
+def _largo_colapsado(texto: _Serie) -> _Serie:
+    """Longitud de ' '.join(texto.split()) para cada valor."""
+    return (texto.str.replace(_ESPACIO + '+', ' ', regex=True)
+            .str.strip(' ').str.len())
+
+
+def _sin_caracteres(texto: _Serie, caracteres: str) -> _Serie:
+    """Elimina los caracteres indicados de cada valor."""
+    for caracter in caracteres:
+        texto = texto.str.replace(caracter, '', regex=False)
+    return texto
+
+
+def mascara_nombre(serie: _Serie) -> _Serie:
+    """Equivale a ValidadorDatosPersonales().validar_nombre por valor."""
+    texto, presentes = _como_texto(serie)
+    largo = texto.str.len()
+    colapsado = _largo_colapsado(texto)
+    return _final((largo <= LONGITUD_MAXIMA_ENTRADA) & texto.str.fullmatch(_LETRAS)
+                  & colapsado.between(2, 50), presentes)
+
+
+def mascara_edad(serie: _Serie) -> _Serie:
+    """
+    Equivale a ValidadorDatosPersonales().validar_edad por valor.
+    
+    En las columnas de enteros son válidos los valores entre 0 y 150. Las
+    columnas decimales se validan por su texto, como en Persona.desde_dict,
+    así que 30.0 no es válido.
+    """
+    if pd.api.types.is_integer_dtype(serie.dtype):
+        return _final(serie.between(0, 150), serie.notna())
+    texto, presentes = _como_texto(serie)
+    digitos = (texto.str.len() <= LONGITUD_MAXIMA_ENTRADA) & texto.str.isdigit()
+    digitos = digitos.fillna(False).astype(bool)
+    numeros = pd.to_numeric(texto.where(digitos), errors='coerce')
+    # Dígitos que no son ASCII (p. ej. '٣'): se convierten como lo hace int()
+    otros = digitos & numeros.isna()
+    if otros.any():
+        numeros = numeros.astype('float64')
+        numeros[otros] = [_entero(valor) for valor in texto[otros]]
+    return _final(digitos & numeros.between(0, 150), presentes)
+
+
+def _entero(valor: str) -> float:
+    """int(valor) como float, o NaN si int() no lo acepta."""
+    try:
+        return float(int(valor))
+    except ValueError:
+        return float('nan')
+
+
+def mascara_documento(serie: _Serie) -> _Serie:
+    """
+    Equivale a ValidadorDatosPersonales().validar_documento_identidad por
+    valor.
+    """
+    texto, presentes = _como_texto(serie)
+    limpio = _sin_caracteres(texto, ' -')
+    return _final((texto.str.len() <= LONGITUD_MAXIMA_ENTRADA) & limpio.str.isdigit()
+                  & limpio.str.len().between(7, 12), presentes)
+
+
+def mascara_email(serie: _Serie) -> _Serie:
+    """Equivale a ValidadorDatosContacto().validar_email por valor."""
+    texto, presentes = _como_texto(serie)
+    return _final((texto.str.len() <= LONGITUD_MAXIMA_EMAIL)
+                  & texto.str.fullmatch(_EMAIL), presentes)
+
+
+def mascara_celular(serie: _Serie) -> _Serie:
+    """Equivale a ValidadorDatosContacto().validar_celular por valor."""
+    texto, presentes = _como_texto(serie)
+    limpio = _sin_caracteres(texto, ' -()+')
+    return _final((texto.str.len() <= LONGITUD_MAXIMA_ENTRADA) & limpio.str.isdigit()
+                  & limpio.str.len().between(8, 15), presentes)
+
+
+def mascara_direccion(serie: _Serie) -> _Serie:
+    """Equivale a ValidadorDatosContacto().validar_direccion por valor."""
+    texto, presentes = _como_texto(serie)
+    largo = texto.str.len()
+    colapsado = _largo_colapsado(texto)
+    return _final((largo <= LONGITUD_MAXIMA_ENTRADA) & texto.str.fullmatch(_DIRECCION)
+                  & colapsado.between(5, 200), presentes)
+
+
+MASCARAS: Dict[str, Callable[[_Serie], _Serie]] = {
+    'nombre': mascara_nombre,
+    'edad': mascara_edad,
+    'documento_identidad': mascara_documento,
+    'email': mascara_email,
+    'celular': mascara_celular,
+    'direccion': mascara_direccion,
+}
+
+
+def _mascara(serie: _Serie, campo: str) -> _Serie:
+    """Aplica la regla de un campo a una Series."""
+    if campo not in MASCARAS:
+        raise ValueError(f"Campo inválido: '{campo}'. Debe ser uno de {CAMPOS}.")
+    return MASCARAS[campo](serie).rename(serie.name)
+
+
+def _ausentes(serie: _Serie) -> _Serie:
+    """Valores que Persona.desde_dict toma como ausentes: nulos o ''."""
+    return serie.isna() | (serie.astype(object) == '')
+
+
+@pd.api.extensions.register_series_accessor('validacion')
+class AccesorSerie:
+    """Accesor Series.validacion: aplica la regla de un campo a la columna."""
+
+    def __init__(self, serie: _Serie) -> None:
+        self._serie = serie
+
+    def mascara(self, campo: str) -> _Serie:
+        """
+        Valida cada valor con la regla de un campo.
+        
+        Args:
+            campo (str): Uno de CAMPOS
+            
+        Returns:
+            pandas.Series: bool por fila
+            
+        Raises:
+            ValueError: Si el campo no existe
+        """
+        return _mascara(self._serie, campo)
+
+
+@pd.api.extensions.register_dataframe_accessor('validacion')
+class AccesorDataFrame:
+    """
+    Accesor DataFrame.validacion: valida las columnas de Persona presentes.
+    
+    Por defecto cada campo se busca en la columna del mismo nombre;
+    columnas={'email': 'correo'} usa otros nombres.
+    """
+
+    def __init__(self, df: _Tabla) -> None:
+        self._df = df
+
+    def _columnas(self, columnas: Optional[Dict[str, str]]) -> Dict[str, str]:
+        """Campo -> columna, solo para las columnas existentes."""
+        nombres = dict(zip(CAMPOS, CAMPOS))
+        nombres.update(columnas or {})
+        return {campo: columna for campo, columna in nombres.items()
+                if columna in self._df.columns}
+
+    def mascaras(self, columnas: Optional[Dict[str, str]] = None) -> _Tabla:
+        """
+        Valida cada columna de Persona con su validador.
+        
+        Args:
+            columnas (Optional[Dict[str, str]]): Nombre de columna por campo
+            
+        Returns:
+            pandas.DataFrame: Una columna bool por campo presente
+        """
+        return pd.DataFrame({campo: _mascara(self._df[columna], campo)
+                             for campo, columna in self._columnas(columnas).items()},
+                            index=self._df.index)
+
+    def codigos(self, columnas: Optional[Dict[str, str]] = None) -> _Tabla:
+        """
+        Obtiene un código por campo y fila: VALIDO, AUSENTE o INVALIDO.
+        
+        Como en Persona.desde_dict, un valor nulo o '' es AUSENTE.
+        
+        Args:
+            columnas (Optional[Dict[str, str]]): Nombre de columna por campo
+            
+        Returns:
+            pandas.DataFrame: Una columna int8 por campo presente
+        """
+        resultado = {}
+        for campo, columna in self._columnas(columnas).items():
+            serie = self._df[columna]
+            codigo = pd.Series(INVALIDO, index=serie.index, dtype='int8')
+            codigo[_mascara(serie, campo)] = VALIDO
+            codigo[_ausentes(serie)] = AUSENTE
+            resultado[campo] = codigo
+        return pd.DataFrame(resultado, index=self._df.index)
+
+    def validos(self, columnas: Optional[Dict[str, str]] = None) -> _Serie:
+        """
+        Indica qué filas acepta Persona.desde_dict.
+        
+        Una fila es válida si ningún campo presente es inválido y tiene
+        nombre.
+        
+        Args:
+            columnas (Optional[Dict[str, str]]): Nombre de columna por campo
+            
+        Returns:
+            pandas.Series: bool por fila
+        """
+        codigos = self.codigos(columnas)
+        validos = (codigos != INVALIDO).all(axis=1)
+        if 'nombre' in codigos:
+            return validos & (codigos['nombre'] == VALIDO)
+        return validos & False
@@ -0,0 +1,226 @@
+"""
+Módulo de listas de dominios de email para permitir o bloquear correos.
+
+Este módulo contiene:
+- ListaDominios: Conjunto de dominios con comodines de subdominio
+- ValidadorContactoConDominios: ValidadorDatosContacto cuyo validar_email
+  además rechaza los dominios bloqueados o no permitidos
+
+Cada entrada es un dominio exacto ('mailinator.com') o un comodín que
+abarca todos sus subdominios ('*.mailinator.com', que no incluye al
+propio mailinator.com). Las entradas se guardan en dos conjuntos hash
+con las cadenas internadas, así que comprobar un dominio cuesta una
+búsqueda por cada etiqueta (a.b.mailinator.com: el dominio completo y
+los sufijos b.mailinator.com, mailinator.com y com), sin recorrer la lista.
+
+Ejemplo:
+    >>> from jorge_choque_pg2_tecba.dominios import (
+    ...     ListaDominios, ValidadorContactoConDominios)
+    >>> desechables = ListaDominios.desde_archivo("desechables.txt")
+    >>> validador = ValidadorContactoConDominios(bloqueados=desechables)
+    >>> validador.validar_email("ana@correo.bo")
+    True
+    >>> validador.validar_email("ana@x.mailinator.com")
+    False
+"""
+
+import sys
+from typing import (
+    Iterable,
+    Optional,
+    Set,
+)
+
+from .validators import ValidadorDatosContacto, LONGITUD_MAXIMA_EMAIL
+
+
+_COMODIN = '*.'
+
+
+def dominio_de(email: str) -> str:
+    """
+    Obtiene el dominio de un email, en minúsculas e internado.
+    
+    Los emails repetidos de un mismo dominio comparten así una sola
+    cadena. Se ignora el salto de línea final que acepta validar_email.
+    
+    Args:
+        email (str): Email con formato válido
+        
+    Returns:
+        str: El texto después de la última '@'
+    """
+    dominio = email[email.rfind('@') + 1:]
+    if dominio[-1:] == '\n':
+        dominio = dominio[:-1]
+    return sys.intern(dominio.lower())
+
+
+class ListaDominios:
+    """
+    Conjunto de dominios exactos y comodines de subdominio.
+    
+    Los dominios se comparan sin distinguir mayúsculas. Consultar la
+    lista es seguro desde varios hilos; agregar entradas no está protegido.
+    """
+
+    def __init__(self, dominios: Iterable[str] = ()) -> None:
+        """
+        Crea la lista con sus entradas iniciales.
+        
+        Args:
+            dominios (Iterable[str]): Entradas, como en agregar()
+        """
+        self._exactos: Set[str] = set()
+        self._comodines: Set[str] = set()
+        self.agregar(dominios)
+
+    @classmethod
+    def desde_archivo(cls, ruta: str, encoding: str = 'utf-8') -> 'ListaDominios':
+        """
+        Carga una lista con una entrada por línea.
+        
+        Se ignoran las líneas vacías y las que empiezan con '#'.
+        
+        Args:
+            ruta (str): Ruta del archivo de texto
+            encoding (str): Codificación del archivo
+            
+        Returns:
+            ListaDominios: La lista cargada
+        """
+        with open(ruta, encoding=encoding) as archivo:
+            return cls(archivo.read().splitlines())
+
+    def agregar(self, dominios: Iterable[str]) -> None:
+        """
+        Agrega entradas a la lista.
+        
+        Una entrada que empieza con '*.' abarca todos los subdominios del
+        resto. Se ignoran los espacios en los extremos, las entradas vacías
+        y las que empiezan con '#'.
+        
+        Args:
+            dominios (Iterable[str]): Dominios o comodines
+        """
+        intern = sys.intern
+        exactos, comodines = self._exactos, self._comodines
+        for entrada in dominios:
+            entrada = entrada.strip().lower()
+            if not entrada or entrada[0] == '#':
+                continue
+            if entrada.startswith(_COMODIN):
+                comodines.add(intern(entrada[2:]))
+            else:
+                exactos.add(intern(entrada))
+
+    def contiene(self, dominio: str) -> bool:
+        """
+        Indica si un dominio está en la lista, directamente o por un comodín.
+        
+        Args:
+            dominio (str): Dominio a buscar (sin '@')
+            
+        Returns:
+            bool: True si coincide con alguna entrada
+        """
+        dominio = dominio.lower()
+        if dominio in self._exactos:
+            return True
+        comodines = self._comodines
+        if not comodines:
+            return False
+        punto = dominio.find('.')
+        while punto >= 0:
+            if dominio[punto + 1:] in comodines:
+                return True
+            punto = dominio.find('.', punto + 1)
+        return False
+
+    __contains__ = contiene
+
+    def contiene_email(self, email: str) -> bool:
+        """
+        Indica si el dominio de un email está en la lista.
+        
+        Args:
+            email (str): Email con formato válido
+            
+        Returns:
+            bool: True si su dominio coincide con alguna entrada
+        """
+        return self.contiene(dominio_de(email))
+
+    def __len__(self) -> int:
+        """Cantidad de entradas (dominios exactos más comodines)."""
+        return len(self._exactos) + len(self._comodines)
+
+    def __repr__(self) -> str:
+        """Representación técnica de la lista."""
+        return (f"ListaDominios(exactos={len(self._exactos)}, "
+                f"comodines={len(self._comodines)})")
+
+
+class ValidadorContactoConDominios(ValidadorDatosContacto):
+    """
+    Validador de contacto que además filtra los emails por dominio.
+    
+    validar_email acepta un email si tiene formato válido, su dominio
+    está en la lista de permitidos (cuando la hay) y no está en la de
+    bloqueados. Las demás validaciones no cambian.
+    """
+
+    def __init__(self, bloqueados: Optional[ListaDominios] = None,
+                 permitidos: Optional[ListaDominios] = None,
+                 modo_seguro: bool = False) -> None:
+        """
+        Inicializa el validador.
+        
+        Args:
+            bloqueados (Optional[ListaDominios]): Dominios que se rechazan
+            permitidos (Optional[ListaDominios]): Si se indica, solo se
+                aceptan sus dominios
+            modo_seguro (bool): Como en ValidadorDatosContacto
+        """
+        super().__init__(modo_seguro)
+        self.bloqueados = bloqueados
+        self.permitidos = permitidos
+
+    def validar_email(self, email: str) -> bool:
+        """
+        Valida el formato del email y su dominio.
+        
+        Args:
+            email (str): El email a validar
+            
+        Returns:
+            bool: True si el email es válido y su dominio está aceptado
+        """
+        if not super().validar_email(email):
+            return False
+        return self._dominio_aceptado(dominio_de(email))
+
+    def _dominio_aceptado(self, dominio: str) -> bool:
+        """Aplica las listas de permitidos y bloqueados a un dominio."""
+        if self.permitidos is not None and not self.permitidos.contiene(dominio):
+            return False
+        return self.bloqueados is None or not self.bloqueados.contiene(dominio)
+
+    def validar_emails(self, emails: Iterable[str]) -> bytearray:
+        """
+        Valida una columna de emails (ver ValidadorLote.validar_emails).
+        
+        Args:
+            emails (Iterable[str]): Los emails a validar
+            
+        Returns:
+            bytearray: Máscara con 1 en las filas válidas
+        """
+        formato = super().validar_email
+        aceptado = self._dominio_aceptado
+        maximo = LONGITUD_MAXIMA_EMAIL
+        return bytearray(
+            1 if (e and len(e) <= maximo and formato(e)
+                  and aceptado(dominio_de(e))) else 0
+            for e in emails
+        )
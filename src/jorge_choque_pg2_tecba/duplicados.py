@@ -0,0 +1,459 @@
+"""
+Módulo de detección de personas duplicadas en volúmenes grandes.
+
+Las claves son las mismas que usa PersonaRegistro: el documento y el
+celular normalizados como en sus validadores y el email en minúsculas,
+como lo guarda establecer_email. Este módulo contiene:
+- buscar_duplicados: Búsqueda en memoria que, con un presupuesto de
+  memoria, pasa a particionar las claves en disco cuando no caben
+- FiltroBloom / PrefiltroDuplicados: Filtro probabilístico "probablemente
+  visto" para descartar rápido las claves nuevas durante una ingesta
+
+Uso desde la línea de comandos:
+    python -m jorge_choque_pg2_tecba.duplicados a.csv b.jsonl \\
+        --salida duplicados.csv --presupuesto-mb 512
+"""
+
+import argparse
+import csv
+import math
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from bisect import bisect_right
+from hashlib import blake2b as _blake2b
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .core import Persona, _texto
+from .ingest import detectar_formato, leer_filas
+from .registro import (
+    CAMPOS_UNICOS,
+    normalizar_celular,
+    normalizar_documento,
+    normalizar_email,
+)
+
+
+_NORMALIZADORES = {
+    'documento_identidad': normalizar_documento,
+    'email': normalizar_email,
+    'celular': normalizar_celular,
+}
+
+# Costo aproximado en memoria de cada clave guardada (cadena, entrada del
+# diccionario y posición), además de su longitud
+_BYTES_POR_CLAVE = 120
+
+# Registro de las particiones en disco: campo, posición y longitud de la clave
+_REGISTRO = struct.Struct('<BQI')
+
+# En memoria cada clave ocupa unas 4 veces lo que ocupa su registro en disco
+_FACTOR_MEMORIA_PARTICION = 4
+
+# Cantidad máxima de funciones de hash del filtro de Bloom
+_HASHES_MAXIMOS = 16
+
+# Profundidad máxima al volver a dividir una partición que no cabe en memoria
+_PROFUNDIDAD_MAXIMA = 4
+
+
+class Duplicado(NamedTuple):
+    """Una fila cuya clave ya apareció en una fila anterior."""
+
+    campo: str
+    clave: str
+    fila: int
+    original: int
+
+
+def claves(fila: Union[Dict, Persona],
+           campos: Sequence[str] = CAMPOS_UNICOS) -> Tuple[Optional[str], ...]:
+    """
+    Obtiene las claves normalizadas de una fila.
+    
+    Args:
+        fila (Union[Dict, Persona]): Diccionario con los campos o Persona
+        campos (Sequence[str]): Campos únicos a considerar
+        
+    Returns:
+        Tuple[Optional[str], ...]: Una clave por campo (None si falta)
+    """
+    if isinstance(fila, Persona):
+        return tuple(_NORMALIZADORES[campo](getattr(fila, campo))
+                     for campo in campos)
+    return tuple(_NORMALIZADORES[campo](_texto(fila.get(campo)))
+                 for campo in campos)
+
+
+def _validar_campos(campos: Sequence[str]) -> None:
+    for campo in campos:
+        if campo not in _NORMALIZADORES:
+            raise ValueError(
+                f"Campo inválido: '{campo}'. Debe ser uno de {CAMPOS_UNICOS}.")
+
+
+def buscar_duplicados(filas: Iterable, campos: Sequence[str] = CAMPOS_UNICOS,
+                      presupuesto_memoria: Optional[int] = None,
+                      directorio: Optional[str] = None,
+                      particiones: int = 64) -> Iterator[Duplicado]:
+    """
+    Busca las filas cuyas claves ya aparecieron en una fila anterior.
+    
+    Mientras las claves caben en el presupuesto se usa un diccionario por
+    campo y los duplicados se entregan a medida que se leen, en orden.
+    Si el presupuesto se supera, las claves ya vistas y las filas
+    restantes se reparten por hash en archivos temporales y cada
+    partición se procesa por separado al final; esos duplicados salen
+    agrupados por partición y no en orden de fila.
+    
+    Args:
+        filas (Iterable): Diccionarios o Personas, en orden
+        campos (Sequence[str]): Campos únicos a considerar
+        presupuesto_memoria (Optional[int]): Bytes aproximados para las
+            claves en memoria; None no tiene límite
+        directorio (Optional[str]): Directorio para los archivos
+            temporales; por defecto el del sistema
+        particiones (int): Cantidad de archivos en los que se reparten
+            las claves al pasar a disco
+            
+    Returns:
+        Iterator[Duplicado]: Un elemento por cada fila y campo repetido;
+        'original' es la primera fila con esa clave
+    """
+    _validar_campos(campos)
+    if particiones < 1:
+        raise ValueError("La cantidad de particiones debe ser al menos 1.")
+    vistos: List[Dict[str, int]] = [{} for _ in campos]
+    consumo = 0
+    iterador = enumerate(filas)
+    for posicion, fila in iterador:
+        for i, clave in enumerate(claves(fila, campos)):
+            if clave is None:
+                continue
+            indice = vistos[i]
+            original = indice.setdefault(clave, posicion)
+            if original != posicion:
+                yield Duplicado(campos[i], clave, posicion, original)
+            else:
+                consumo += _BYTES_POR_CLAVE + len(clave)
+        if presupuesto_memoria is not None and consumo > presupuesto_memoria:
+            break
+    else:
+        return
+
+    # Las claves no caben: se pasa a particiones en disco
+    temporal = tempfile.mkdtemp(prefix='duplicados-', dir=directorio)
+    try:
+        rutas = [os.path.join(temporal, f"p{n}") for n in range(particiones)]
+        archivos = [open(ruta, 'wb') for ruta in rutas]
+        try:
+            for i, indice in enumerate(vistos):
+                for clave, original in indice.items():
+                    _escribir(archivos, i, clave.encode('utf-8'), original, 0)
+                indice.clear()
+            for posicion, fila in iterador:
+                for i, clave in enumerate(claves(fila, campos)):
+                    if clave is not None:
+                        _escribir(archivos, i, clave.encode('utf-8'), posicion, 0)
+        finally:
+            for archivo in archivos:
+                archivo.close()
+        for ruta in rutas:
+            yield from _procesar_particion(ruta, campos, presupuesto_memoria, 1)
+    finally:
+        shutil.rmtree(temporal, ignore_errors=True)
+
+
+def _escribir(archivos: List, campo: int, datos: bytes, posicion: int,
+              profundidad: int) -> None:
+    """
+    Agrega una clave a la partición que le corresponde por su hash.
+    
+    Cada profundidad usa blake2b con otra sal, así que el reparto de una
+    subdivisión no depende del de la partición que la contiene.
+    """
+    resumen = _blake2b(datos, digest_size=8, salt=bytes([profundidad])).digest()
+    archivo = archivos[int.from_bytes(resumen, 'little') % len(archivos)]
+    archivo.write(_REGISTRO.pack(campo, posicion, len(datos)))
+    archivo.write(datos)
+
+
+def _leer(ruta: str) -> Iterator[Tuple[int, int, bytes]]:
+    """Lee los registros (campo, posición, clave) de una partición."""
+    tamano_registro = _REGISTRO.size
+    desempaquetar = _REGISTRO.unpack
+    with open(ruta, 'rb') as archivo:
+        while True:
+            cabecera = archivo.read(tamano_registro)
+            if not cabecera:
+                return
+            campo, posicion, longitud = desempaquetar(cabecera)
+            yield campo, posicion, archivo.read(longitud)
+
+
+def _procesar_particion(ruta: str, campos: Sequence[str],
+                        presupuesto_memoria: int,
+                        profundidad: int) -> Iterator[Duplicado]:
+    """
+    Busca los duplicados de una partición.
+    
+    Dentro de una partición las posiciones de cada clave aparecen en
+    orden creciente, por lo que la primera aparición es la original. Si
+    la partición es demasiado grande se vuelve a dividir con otra sal.
+    """
+    tamano = os.path.getsize(ruta)
+    if (tamano * _FACTOR_MEMORIA_PARTICION > presupuesto_memoria
+            and profundidad <= _PROFUNDIDAD_MAXIMA):
+        rutas = [f"{ruta}.{n}" for n in range(4)]
+        archivos = [open(sub, 'wb') for sub in rutas]
+        try:
+            for campo, posicion, datos in _leer(ruta):
+                _escribir(archivos, campo, datos, posicion, profundidad)
+        finally:
+            for archivo in archivos:
+                archivo.close()
+        os.remove(ruta)
+        for sub in rutas:
+            if os.path.getsize(sub) < tamano:
+                yield from _procesar_particion(sub, campos, presupuesto_memoria,
+                                               profundidad + 1)
+            else:
+                # Todas las claves fueron a la misma subpartición (una sola
+                # clave muy repetida): dividirla otra vez no la achica
+                yield from _buscar_en_particion(sub, campos)
+        return
+
+    yield from _buscar_en_particion(ruta, campos)
+
+
+def _buscar_en_particion(ruta: str, campos: Sequence[str]) -> Iterator[Duplicado]:
+    """Busca en memoria los duplicados de una partición y la elimina."""
+    vistos: List[Dict[bytes, int]] = [{} for _ in campos]
+    for campo, posicion, datos in _leer(ruta):
+        original = vistos[campo].setdefault(datos, posicion)
+        if original != posicion:
+            yield Duplicado(campos[campo], datos.decode('utf-8'), posicion, original)
+    os.remove(ruta)
+
+
+class FiltroBloom:
+    """
+    Filtro de Bloom sobre cadenas.
+    
+    Responde "seguro que no" o "probablemente sí": nunca da falsos
+    negativos y la proporción de falsos positivos se mantiene cerca de la
+    indicada mientras no se agreguen más claves que la capacidad. Las
+    posiciones de los bits salen de un resumen blake2b, por lo que el
+    resultado es el mismo en todos los procesos.
+    """
+
+    def __init__(self, capacidad: int, tasa_falsos_positivos: float = 0.01):
+        """
+        Inicializa un filtro vacío dimensionado para la capacidad indicada.
+        
+        Args:
+            capacidad (int): Cantidad de claves esperadas
+            tasa_falsos_positivos (float): Proporción de falsos positivos
+                aceptada (entre 0 y 1)
+                
+        Raises:
+            ValueError: Si la capacidad o la tasa están fuera de rango
+        """
+        if capacidad < 1:
+            raise ValueError("La capacidad del filtro debe ser al menos 1.")
+        if not 0.0 < tasa_falsos_positivos < 1.0:
+            raise ValueError("La tasa de falsos positivos debe estar entre 0 y 1.")
+        bits = math.ceil(
+            -capacidad * math.log(tasa_falsos_positivos) / math.log(2) ** 2)
+        self.bits = max(bits, 8)
+        self.hashes = min(max(1, round(self.bits / capacidad * math.log(2))),
+                          _HASHES_MAXIMOS)
+        # Cada posición sale de 4 u 8 bytes del resumen (blake2b da hasta 64)
+        ancho = 'I' if self.bits <= 2 ** 32 else 'Q'
+        if ancho == 'Q':
+            self.hashes = min(self.hashes, 8)
+        self._formato = struct.Struct(f'<{self.hashes}{ancho}')
+        self._datos = bytearray((self.bits + 7) // 8)
+        self.cantidad = 0
+
+    def _posiciones(self, clave: str) -> List[int]:
+        """Posiciones de los bits de una clave, tomadas de un solo resumen blake2b."""
+        resumen = _blake2b(clave.encode('utf-8'),
+                           digest_size=self._formato.size).digest()
+        bits = self.bits
+        return [valor % bits for valor in self._formato.unpack(resumen)]
+
+    def __contains__(self, clave: str) -> bool:
+        """Indica si la clave probablemente fue agregada."""
+        datos = self._datos
+        for posicion in self._posiciones(clave):
+            if not datos[posicion >> 3] & (1 << (posicion & 7)):
+                return False
+        return True
+
+    def agregar(self, clave: str) -> bool:
+        """
+        Agrega una clave al filtro.
+        
+        Returns:
+            bool: True si la clave probablemente ya estaba
+        """
+        datos = self._datos
+        presente = True
+        for posicion in self._posiciones(clave):
+            byte = posicion >> 3
+            mascara = 1 << (posicion & 7)
+            if not datos[byte] & mascara:
+                presente = False
+                datos[byte] |= mascara
+        if not presente:
+            self.cantidad += 1
+        return presente
+
+    def __len__(self) -> int:
+        """Cantidad aproximada de claves distintas agregadas."""
+        return self.cantidad
+
+    def __repr__(self) -> str:
+        """Representación técnica del filtro."""
+        return (f"FiltroBloom(bits={self.bits}, hashes={self.hashes}, "
+                f"claves={self.cantidad})")
+
+
+class PrefiltroDuplicados:
+    """
+    Prefiltro de duplicados para ingestas en streaming.
+    
+    Mantiene un FiltroBloom por campo único. Las filas sin ningún campo
+    "probablemente visto" son seguramente nuevas y no necesitan consultar
+    el almacén exacto (por ejemplo un PersonaRegistro o una base de datos).
+    
+    Ejemplo:
+        >>> prefiltro = PrefiltroDuplicados(capacidad=10_000_000)
+        >>> for fila in filas:
+        ...     if prefiltro.probablemente_vistos(fila):
+        ...         confirmar_en_el_registro(fila)
+    """
+
+    def __init__(self, capacidad: int, tasa_falsos_positivos: float = 0.01,
+                 campos: Sequence[str] = CAMPOS_UNICOS):
+        """
+        Inicializa el prefiltro.
+        
+        Args:
+            capacidad (int): Cantidad de filas esperadas
+            tasa_falsos_positivos (float): Proporción de falsos positivos por campo
+            campos (Sequence[str]): Campos únicos a considerar
+        """
+        _validar_campos(campos)
+        self.campos = tuple(campos)
+        self._filtros = [FiltroBloom(capacidad, tasa_falsos_positivos) for _ in campos]
+
+    def probablemente_vistos(self, fila: Union[Dict, Persona]) -> Tuple[str, ...]:
+        """
+        Agrega las claves de la fila y devuelve las que probablemente ya estaban.
+        
+        Args:
+            fila (Union[Dict, Persona]): Diccionario con los campos o Persona
+            
+        Returns:
+            Tuple[str, ...]: Campos cuya clave probablemente ya se vio;
+            vacía si la fila es seguramente nueva
+        """
+        return tuple(campo for campo, filtro, clave
+                     in zip(self.campos, self._filtros, claves(fila, self.campos))
+                     if clave is not None and filtro.agregar(clave))
+
+
+def _filas_de_archivos(rutas: Sequence[str], formato: Optional[str],
+                       inicios: List[int]) -> Iterator[Dict]:
+    """Lee las filas de varios archivos seguidos, anotando dónde empieza cada uno."""
+    total = 0
+    for ruta in rutas:
+        inicios.append(total)
+        with open(ruta, 'r', encoding='utf-8', newline='') as archivo:
+            for fila in leer_filas(archivo, formato or detectar_formato(ruta)):
+                total += 1
+                yield fila
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    """Crea el parser de argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(
+        prog='python -m jorge_choque_pg2_tecba.duplicados',
+        description='Busca personas duplicadas por documento, email y celular.',
+    )
+    parser.add_argument('entradas', nargs='+', help='Archivos CSV o JSONL de entrada')
+    parser.add_argument('--salida', required=True, help='Archivo CSV de salida')
+    parser.add_argument('--formato', choices=('csv', 'jsonl'),
+                        help='Formato de las entradas '
+                             '(por defecto se deduce de la extensión)')
+    parser.add_argument('--campos', nargs='+', choices=CAMPOS_UNICOS,
+                        default=CAMPOS_UNICOS,
+                        help='Campos únicos a comparar (por defecto todos)')
+    parser.add_argument('--presupuesto-mb', type=int, default=None,
+                        help='Memoria para las claves antes de usar el disco '
+                             '(por defecto sin límite)')
+    parser.add_argument('--temporal', default=None,
+                        help='Directorio para las particiones en disco')
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada de la línea de comandos.
+    
+    La salida tiene una fila por duplicado con el campo, la clave y la
+    ubicación (archivo y número de fila desde 1) de la fila repetida y de
+    la original.
+    
+    Args:
+        argv (Optional[List[str]]): Argumentos; por defecto sys.argv[1:]
+        
+    Returns:
+        int: Código de salida del proceso
+    """
+    args = crear_parser().parse_args(argv)
+    presupuesto = args.presupuesto_mb * 1024 * 1024 if args.presupuesto_mb else None
+    inicios: List[int] = []
+
+    def ubicar(posicion: int) -> Tuple[str, int]:
+        indice = bisect_right(inicios, posicion) - 1
+        return args.entradas[indice], posicion - inicios[indice] + 1
+
+    total = 0
+    try:
+        filas = _filas_de_archivos(args.entradas, args.formato, inicios)
+        with open(args.salida, 'w', encoding='utf-8', newline='') as salida:
+            escritor = csv.writer(salida)
+            escritor.writerow(['campo', 'clave', 'archivo', 'fila',
+                               'archivo_original', 'fila_original'])
+            duplicados = buscar_duplicados(filas, args.campos, presupuesto,
+                                           args.temporal)
+            for duplicado in duplicados:
+                escritor.writerow([duplicado.campo, duplicado.clave,
+                                   *ubicar(duplicado.fila),
+                                   *ubicar(duplicado.original)])
+                total += 1
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+
+    print(f"Duplicados encontrados: {total}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
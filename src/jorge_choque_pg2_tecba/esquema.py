@@ -0,0 +1,350 @@
+"""
+Módulo de esquemas declarativos compilados a funciones de validación.
+
+Un Esquema describe los campos de un registro una sola vez (limpieza,
+caracteres permitidos, longitudes, rango numérico y formato) y se compila
+a una única función de Python generada para ese esquema: sin llamadas a
+métodos por campo y con cada limpieza hecha una sola vez.
+
+ESQUEMA_PERSONA contiene las mismas reglas que ValidadorDatosPersonales y
+ValidadorDatosContacto.
+
+Ejemplo:
+    >>> from jorge_choque_pg2_tecba.esquema import ESQUEMA_PERSONA, validar_persona
+    >>> valores, errores, faltantes = ESQUEMA_PERSONA.validar("Ana Pérez", 30)
+    >>> errores
+    0
+    >>> validar_persona({"nombre": "Ana Pérez", "email": "ANA@correo.bo"}).persona.email
+    'ana@correo.bo'
+"""
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
+
+from .core import Persona, ResultadoValidacion
+from .validators import (
+    _CARACTERES_DIRECCION,
+    _CARACTERES_LETRAS,
+    _PATRON_EMAIL,
+    LONGITUD_MAXIMA_EMAIL,
+    LONGITUD_MAXIMA_ENTRADA,
+)
+
+
+TIPOS = ('texto', 'entero')
+SALIDAS = ('original', 'recortado', 'minusculas')
+
+# Firmas de las funciones generadas: devuelven (valores, errores, faltantes)
+_Validacion = Tuple[Tuple[Any, ...], int, int]
+_Validar = Callable[..., _Validacion]
+_ValidarDict = Callable[[Dict], _Validacion]
+
+
+class Campo(NamedTuple):
+    """
+    Regla declarativa de un campo.
+    
+    Los pasos se aplican en este orden: se rechaza la entrada de más de
+    longitud_maxima_entrada caracteres, se eliminan los caracteres de
+    quitar, se colapsan los espacios y sobre el valor limpio se comprueban
+    la longitud, los caracteres, el formato y el rango.
+    
+    Attributes:
+        nombre (str): Nombre del campo
+        tipo (str): 'texto' o 'entero' (el valor se guarda como int)
+        obligatorio (bool): Si su ausencia marca el campo como faltante
+        quitar (str): Caracteres que se eliminan antes de validar
+        colapsar_espacios (bool): Si se aplica ' '.join(valor.split())
+        caracteres (Optional[FrozenSet[str]]): Caracteres permitidos
+        solo_digitos (bool): Si el valor limpio debe cumplir str.isdigit()
+        longitud_minima (int): Longitud mínima del valor limpio
+        longitud_maxima (Optional[int]): Longitud máxima del valor limpio
+        rango (Optional[Tuple[int, int]]): Valores permitidos (inclusive)
+            para los campos enteros
+        formato (Optional[Callable[[str], object]]): Predicado adicional
+            sobre el valor limpio, por ejemplo patron.match
+        longitud_maxima_entrada (int): Longitud máxima de la entrada sin limpiar
+        salida (str): Valor guardado: 'original', 'recortado' (strip) o
+            'minusculas' (lower y strip)
+    """
+
+    nombre: str
+    tipo: str = 'texto'
+    obligatorio: bool = False
+    quitar: str = ''
+    colapsar_espacios: bool = False
+    caracteres: Optional[FrozenSet[str]] = None
+    solo_digitos: bool = False
+    longitud_minima: int = 0
+    longitud_maxima: Optional[int] = None
+    rango: Optional[Tuple[int, int]] = None
+    formato: Optional[Callable[[str], object]] = None
+    longitud_maxima_entrada: int = LONGITUD_MAXIMA_ENTRADA
+    salida: str = 'original'
+
+
+def _generar_campo(i: int, campo: Campo, constantes: Dict[str, object],
+                   al_fallar: Optional[str] = None) -> List[str]:
+    """
+    Genera las líneas que validan el campo i (valor de entrada en v<i>).
+    
+    Con al_fallar, un campo inválido o faltante ejecuta esa línea en lugar
+    de marcar su bit en errores o faltantes.
+    """
+    v, r, bit = f"v{i}", f"r{i}", 1 << i
+    error = al_fallar or f"errores |= {bit}"
+    lineas = [
+        f"if {v} is None or {v} == '':",
+        f"    {r} = None",
+    ]
+    if campo.obligatorio:
+        lineas.append(f"    {al_fallar or f'faltantes |= {bit}'}")
+    lineas += [
+        "else:",
+        f"    if {v}.__class__ is not str:",
+        f"        {v} = str({v})",
+        f"    if len({v}) > {campo.longitud_maxima_entrada}:",
+        f"        {r} = None",
+        f"        {error}",
+        "    else:",
+    ]
+
+    limpio = v
+    if campo.quitar:
+        limpio = v + ''.join(f".replace({c!r}, '')" for c in campo.quitar)
+    if campo.colapsar_espacios:
+        limpio = f"' '.join({limpio}.split())"
+    if limpio != v:
+        lineas.append(f"        l = {limpio}")
+        limpio = "l"
+
+    condiciones = []
+    if campo.longitud_minima or campo.longitud_maxima is not None:
+        minimo = f"{campo.longitud_minima} <= " if campo.longitud_minima else ""
+        maximo = (f" <= {campo.longitud_maxima}"
+                  if campo.longitud_maxima is not None else "")
+        condiciones.append(f"{minimo}len({limpio}){maximo}")
+    if campo.solo_digitos or campo.tipo == 'entero':
+        condiciones.append(f"{limpio}.isdigit()")
+    if campo.caracteres is not None:
+        constantes[f"c{i}"] = campo.caracteres.issuperset
+        condiciones.append(f"c{i}({limpio})")
+    if campo.formato is not None:
+        constantes[f"f{i}"] = campo.formato
+        condiciones.append(f"f{i}({limpio})")
+    condicion = " and ".join(condiciones) or "True"
+
+    if campo.tipo == 'entero':
+        lineas += [
+            f"        {r} = None",
+            f"        if {condicion}:",
+            "            try:",
+            f"                n = int({limpio})",
+            "            except ValueError:",
+            "                pass",
+            "            else:",
+        ]
+        if campo.rango is not None:
+            lineas += [
+                f"                if {campo.rango[0]} <= n <= {campo.rango[1]}:",
+                f"                    {r} = n",
+            ]
+        else:
+            lineas.append(f"                {r} = n")
+        lineas += [
+            f"        if {r} is None:",
+            f"            {error}",
+        ]
+        return lineas
+
+    guardado = {'original': v, 'recortado': f"{v}.strip()",
+                'minusculas': f"{v}.lower().strip()"}[campo.salida]
+    lineas += [
+        f"        if {condicion}:",
+        f"            {r} = {guardado}",
+        "        else:",
+        f"            {r} = None",
+        f"            {error}",
+    ]
+    return lineas
+
+
+def _generar(campos: Sequence[Campo]) -> Tuple[str, Dict[str, object]]:
+    """Genera el código fuente de las funciones de un esquema."""
+    constantes: Dict[str, object] = {}
+    cuerpo = ["errores = 0", "faltantes = 0"]
+    for i, campo in enumerate(campos):
+        cuerpo += _generar_campo(i, campo, constantes)
+    resultados = ", ".join(f"r{i}" for i in range(len(campos)))
+    cuerpo.append(f"return ({resultados},), errores, faltantes")
+
+    parametros = ", ".join(f"v{i}=None" for i in range(len(campos)))
+    lecturas = [f"v{i} = obtener({campo.nombre!r})" for i, campo in enumerate(campos)]
+    interno = ["    " + linea for linea in cuerpo]
+    fuente = "\n".join(
+        [f"def _crear({', '.join(constantes)}):",
+         f"  def validar({parametros}):"]
+        + interno
+        + ["  def validar_dict(datos):",
+           "    obtener = datos.get"]
+        + ["    " + linea for linea in lecturas]
+        + interno
+        + ["  return validar, validar_dict", ""]
+    )
+    return fuente, constantes
+
+
+class Esquema:
+    """
+    Esquema de un registro compilado a funciones generadas.
+    
+    La compilación se hace una sola vez al crear el esquema. validar()
+    recibe los valores en el orden de los campos y validar_dict() un
+    diccionario; ambas devuelven (valores, errores, faltantes), donde
+    valores es una tupla con el valor guardado de cada campo (None si
+    está ausente o es inválido) y las máscaras usan el bit 1 << i para el
+    campo i. Como en Persona.desde_dict, un valor None o '' es ausente y
+    los valores que no son texto se convierten con str().
+    """
+
+    def __init__(self, campos: Sequence[Campo]):
+        """
+        Compila el esquema.
+        
+        Args:
+            campos (Sequence[Campo]): Reglas de los campos, en orden
+            
+        Raises:
+            ValueError: Si algún campo está repetido o tiene un tipo o una
+                salida inválidos
+        """
+        nombres = [campo.nombre for campo in campos]
+        if len(set(nombres)) != len(nombres):
+            raise ValueError(
+                "Los nombres de los campos del esquema deben ser únicos.")
+        for campo in campos:
+            if campo.tipo not in TIPOS:
+                raise ValueError(
+                    f"Tipo inválido: '{campo.tipo}'. Debe ser uno de {TIPOS}.")
+            if campo.salida not in SALIDAS:
+                raise ValueError(
+                    f"Salida inválida: '{campo.salida}'. Debe ser una de {SALIDAS}.")
+        self.campos: Tuple[Campo, ...] = tuple(campos)
+        self.codigo, constantes = _generar(self.campos)
+        espacio: Dict[str, object] = {}
+        exec(compile(self.codigo, f"<esquema {', '.join(nombres)}>", "exec"),
+             espacio)
+        crear = cast(Callable[..., Tuple[_Validar, _ValidarDict]], espacio['_crear'])
+        self.validar: _Validar
+        self.validar_dict: _ValidarDict
+        self.validar, self.validar_dict = crear(**constantes)
+
+    def compilar_veredicto(
+        self, orden: Optional[Sequence[str]] = None
+    ) -> Callable[[Dict], bool]:
+        """
+        Compila una función que solo indica si un diccionario es válido.
+        
+        Los campos se comprueban en el orden indicado y la función devuelve
+        False en el primer campo inválido o faltante, sin revisar el resto
+        ni construir los valores guardados.
+        
+        Args:
+            orden (Optional[Sequence[str]]): Nombres de los campos a
+                comprobar, en orden; por defecto todos, en el orden del esquema
+                
+        Returns:
+            Callable[[Dict], bool]: Función veredicto(datos)
+            
+        Raises:
+            ValueError: Si algún campo no existe en el esquema
+        """
+        if orden is None:
+            orden = [campo.nombre for campo in self.campos]
+        constantes: Dict[str, object] = {}
+        cuerpo = ["obtener = datos.get"]
+        for nombre in orden:
+            i = self.bit(nombre).bit_length() - 1
+            cuerpo.append(f"v{i} = obtener({nombre!r})")
+            cuerpo += _generar_campo(i, self.campos[i], constantes,
+                                     al_fallar="return False")
+        cuerpo.append("return True")
+        fuente = "\n".join(
+            [f"def _crear({', '.join(constantes)}):",
+             "  def veredicto(datos):"]
+            + ["    " + linea for linea in cuerpo]
+            + ["  return veredicto", ""]
+        )
+        espacio: Dict[str, object] = {}
+        exec(compile(fuente, f"<veredicto {', '.join(orden)}>", "exec"), espacio)
+        crear = cast(Callable[..., Callable[[Dict], bool]], espacio['_crear'])
+        return crear(**constantes)
+
+    def bit(self, nombre: str) -> int:
+        """
+        Obtiene el bit de un campo en las máscaras de errores y faltantes.
+        
+        Raises:
+            ValueError: Si el campo no existe en el esquema
+        """
+        for i, campo in enumerate(self.campos):
+            if campo.nombre == nombre:
+                return 1 << i
+        raise ValueError(f"Campo inexistente en el esquema: '{nombre}'.")
+
+    def __repr__(self) -> str:
+        """Representación técnica del esquema."""
+        return f"Esquema(campos={[campo.nombre for campo in self.campos]})"
+
+
+# Las reglas de ValidadorDatosPersonales y ValidadorDatosContacto, en el
+# orden y con los bits de los campos de Persona
+ESQUEMA_PERSONA = Esquema([
+    Campo('nombre', obligatorio=True, colapsar_espacios=True,
+          caracteres=_CARACTERES_LETRAS, longitud_minima=2, longitud_maxima=50,
+          salida='recortado'),
+    Campo('edad', tipo='entero', rango=(0, 150)),
+    Campo('documento_identidad', quitar=' -', solo_digitos=True,
+          longitud_minima=7, longitud_maxima=12),
+    Campo('email', formato=_PATRON_EMAIL.match,
+          longitud_maxima_entrada=LONGITUD_MAXIMA_EMAIL, salida='minusculas'),
+    Campo('celular', quitar=' -()+', solo_digitos=True,
+          longitud_minima=8, longitud_maxima=15),
+    Campo('direccion', colapsar_espacios=True, caracteres=_CARACTERES_DIRECCION,
+          longitud_minima=5, longitud_maxima=200, salida='recortado'),
+])
+
+
+def validar_persona(
+    datos: Dict, esquema: Esquema = ESQUEMA_PERSONA
+) -> ResultadoValidacion:
+    """
+    Valida un diccionario con un esquema de Persona compilado.
+    
+    Equivale a Persona.desde_dict(datos, modo='acumular') con una sola
+    llamada a la función generada.
+    
+    Args:
+        datos (Dict): Diccionario con los campos de la persona
+        esquema (Esquema): Esquema con los seis campos de Persona, en orden
+        
+    Returns:
+        ResultadoValidacion: La persona construida o los errores encontrados
+    """
+    valores, errores, faltantes = esquema.validar_dict(datos)
+    if errores or faltantes:
+        return ResultadoValidacion(None, errores, faltantes, datos)
+    persona = Persona.__new__(Persona)
+    (persona._nombre, persona._edad, persona._documento_identidad,
+     persona._email, persona._celular, persona._direccion) = valores
+    return ResultadoValidacion(persona, 0, 0, datos)
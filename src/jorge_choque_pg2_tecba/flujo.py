@@ -0,0 +1,346 @@
+"""
+Módulo de validación en flujo sin crear objetos por fila.
+
+En un ciclo de ingesta largo, construir una Persona por fila para
+validarla y entregarla a un destino crea un objeto que el recolector de
+basura debe seguir y liberar. Este módulo contiene:
+- ConstructorReutilizable: valida cada fila en una misma Persona interna
+- BufferPersonas: columnas preasignadas donde se copian las filas válidas
+- PoolPersonas: personas reutilizables para cuando el destino necesita
+  objetos Persona
+- validar_en_buffer: ciclo de ingesta que llena un buffer y lo entrega
+  al destino cada vez que se llena
+
+Ejemplo:
+    >>> from jorge_choque_pg2_tecba.flujo import BufferPersonas, validar_en_buffer
+    >>> buffer = BufferPersonas(10_000)
+    >>> validas, rechazadas = validar_en_buffer(
+    ...     filas, buffer, lambda b: guardar(b.a_tabla()))
+"""
+
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .core import Persona, PersonaInmutable, PersonaTabla
+
+
+CAMPOS = PersonaTabla.COLUMNAS
+
+
+class BufferPersonas:
+    """
+    Buffer de capacidad fija con una lista preasignada por campo.
+    
+    Agregar una fila solo guarda referencias en posiciones ya existentes
+    de las listas: no crea objetos. vaciar() reinicia el buffer sin
+    liberar sus listas.
+    """
+
+    def __init__(self, capacidad: int):
+        """
+        Preasigna las columnas del buffer.
+        
+        Args:
+            capacidad (int): Cantidad máxima de filas
+            
+        Raises:
+            ValueError: Si la capacidad no es positiva
+        """
+        if capacidad < 1:
+            raise ValueError("La capacidad del buffer debe ser al menos 1.")
+        self.capacidad = capacidad
+        self._columnas: Tuple[List, ...] = tuple([None] * capacidad for _ in CAMPOS)
+        self._cantidad = 0
+
+    def __len__(self) -> int:
+        """Cantidad de filas en el buffer."""
+        return self._cantidad
+
+    @property
+    def lleno(self) -> bool:
+        """Indica si el buffer alcanzó su capacidad."""
+        return self._cantidad == self.capacidad
+
+    def agregar(self, persona: Persona) -> int:
+        """
+        Copia los datos de una persona en la siguiente fila libre.
+        
+        Args:
+            persona (Persona): Persona ya construida
+            
+        Returns:
+            int: Índice de la fila escrita
+            
+        Raises:
+            ValueError: Si el buffer está lleno
+        """
+        indice = self._cantidad
+        if indice == self.capacidad:
+            raise ValueError(
+                "El buffer está lleno: vacíelo antes de agregar más filas.")
+        nombres, edades, documentos, emails, celulares, direcciones = self._columnas
+        nombres[indice] = persona._nombre
+        edades[indice] = persona._edad
+        documentos[indice] = persona._documento_identidad
+        emails[indice] = persona._email
+        celulares[indice] = persona._celular
+        direcciones[indice] = persona._direccion
+        self._cantidad = indice + 1
+        return indice
+
+    def fila(self, indice: int) -> PersonaInmutable:
+        """
+        Obtiene una fila del buffer.
+        
+        Raises:
+            IndexError: Si el índice está fuera de rango
+        """
+        if not 0 <= indice < self._cantidad:
+            raise IndexError(f"Fila fuera de rango: {indice}.")
+        return PersonaInmutable(*(columna[indice] for columna in self._columnas))
+
+    def __iter__(self) -> Iterator[PersonaInmutable]:
+        """Recorre las filas del buffer como PersonaInmutable."""
+        n = self._cantidad
+        return map(PersonaInmutable._make,
+                   zip(*(columna[:n] for columna in self._columnas)))
+
+    def columna(self, campo: str) -> List:
+        """
+        Obtiene una copia de los valores de un campo.
+        
+        Raises:
+            ValueError: Si el campo no existe
+        """
+        if campo not in CAMPOS:
+            raise ValueError(f"Campo inválido: '{campo}'. Debe ser uno de {CAMPOS}.")
+        return self._columnas[CAMPOS.index(campo)][:self._cantidad]
+
+    def a_tabla(self) -> PersonaTabla:
+        """
+        Copia las filas del buffer en una PersonaTabla.
+        
+        Returns:
+            PersonaTabla: Tabla columnar con las filas actuales
+        """
+        tabla = PersonaTabla()
+        for campo, columna in zip(CAMPOS, self._columnas):
+            tabla._columnas[campo].extender(columna[:self._cantidad])
+        return tabla
+
+    def vaciar(self) -> None:
+        """
+        Deja el buffer sin filas, conservando sus listas.
+        
+        Los valores anteriores se sobrescriben a medida que se agregan
+        filas nuevas.
+        """
+        self._cantidad = 0
+
+    def __repr__(self) -> str:
+        """Representación técnica del buffer."""
+        return f"BufferPersonas({self._cantidad}/{self.capacidad})"
+
+
+class PoolPersonas:
+    """
+    Pool de objetos Persona reutilizables.
+    
+    No es seguro compartirlo entre hilos: cada hilo debe usar su propio pool.
+    
+    Attributes:
+        creadas (int): Personas creadas porque el pool estaba vacío
+        reutilizadas (int): Personas entregadas desde el pool
+    """
+
+    def __init__(self, tamano_maximo: int = 1_024):
+        """
+        Crea el pool vacío.
+        
+        Args:
+            tamano_maximo (int): Personas libres que se conservan como máximo
+            
+        Raises:
+            ValueError: Si el tamaño no es positivo
+        """
+        if tamano_maximo < 1:
+            raise ValueError("El tamaño máximo del pool debe ser al menos 1.")
+        self.tamano_maximo = tamano_maximo
+        self._libres: List[Persona] = []
+        self.creadas = 0
+        self.reutilizadas = 0
+
+    def __len__(self) -> int:
+        """Cantidad de personas libres en el pool."""
+        return len(self._libres)
+
+    def tomar(self) -> Persona:
+        """
+        Obtiene una persona vacía, reutilizada si hay alguna libre.
+        
+        Returns:
+            Persona: Persona sin datos
+        """
+        if self._libres:
+            self.reutilizadas += 1
+            return self._libres.pop()
+        self.creadas += 1
+        return Persona()
+
+    def devolver(self, persona: Persona) -> None:
+        """
+        Devuelve una persona al pool; no debe usarse después.
+        
+        Args:
+            persona (Persona): Persona obtenida con tomar()
+        """
+        if len(self._libres) < self.tamano_maximo:
+            self._libres.append(persona.reiniciar())
+
+    def __repr__(self) -> str:
+        """Representación técnica del pool."""
+        return (f"PoolPersonas(libres={len(self._libres)}, creadas={self.creadas}, "
+                f"reutilizadas={self.reutilizadas})")
+
+
+class ConstructorReutilizable:
+    """
+    Valida filas una por una en una sola Persona interna.
+    
+    Cada llamada a cargar() reinicia la persona interna y la llena con
+    la fila, con las mismas reglas que Persona.desde_dict en modo
+    'acumular'. El resultado se copia a donde se necesite: a un
+    BufferPersonas, a una tupla o a una Persona de un pool. La persona
+    interna cambia en la siguiente carga.
+    
+    Attributes:
+        errores (int): Máscara de los campos inválidos de la última fila
+        faltantes (int): Máscara de los campos obligatorios que faltaban
+    """
+
+    def __init__(self) -> None:
+        """Crea el constructor con su persona interna."""
+        self._persona = Persona()
+        self.errores = 0
+        self.faltantes = 0
+
+    def reiniciar(self) -> 'ConstructorReutilizable':
+        """
+        Borra los datos de la persona interna y el resultado anterior.
+        
+        Returns:
+            ConstructorReutilizable: La instancia actual
+        """
+        self._persona.reiniciar()
+        self.errores = 0
+        self.faltantes = 0
+        return self
+
+    def cargar(self, datos: Dict) -> bool:
+        """
+        Valida una fila y la deja en la persona interna.
+        
+        Args:
+            datos (Dict): Diccionario con los campos de la persona
+            
+        Returns:
+            bool: True si todos los campos son válidos y está el nombre
+        """
+        persona = self._persona.reiniciar()
+        self.errores, self.faltantes = persona._cargar_acumulando(datos)
+        return not (self.errores or self.faltantes)
+
+    @property
+    def valido(self) -> bool:
+        """Indica si la última fila cargada es válida."""
+        return not (self.errores or self.faltantes)
+
+    @property
+    def persona(self) -> Persona:
+        """
+        Persona interna con la última fila; se modifica en la siguiente carga.
+        
+        Para conservarla use como_tupla() o copiar_en().
+        """
+        return self._persona
+
+    def como_tupla(self) -> PersonaInmutable:
+        """Copia la última fila en una PersonaInmutable (una sola tupla)."""
+        return self._persona.congelar()
+
+    def escribir_en(self, buffer: BufferPersonas) -> int:
+        """
+        Copia la última fila en un buffer.
+        
+        Returns:
+            int: Índice de la fila en el buffer
+            
+        Raises:
+            ValueError: Si el buffer está lleno
+        """
+        return buffer.agregar(self._persona)
+
+    def copiar_en(self, destino: Optional[Persona] = None,
+                  pool: Optional[PoolPersonas] = None) -> Persona:
+        """
+        Copia la última fila en una Persona que el llamador conserva.
+        
+        Args:
+            destino (Optional[Persona]): Persona que se sobrescribe
+            pool (Optional[PoolPersonas]): Pool del que se toma la
+                persona si no se indica destino
+                
+        Returns:
+            Persona: La persona con los datos de la última fila
+        """
+        if destino is None:
+            destino = pool.tomar() if pool is not None else Persona()
+        origen = self._persona
+        destino._nombre = origen._nombre
+        destino._edad = origen._edad
+        destino._documento_identidad = origen._documento_identidad
+        destino._email = origen._email
+        destino._celular = origen._celular
+        destino._direccion = origen._direccion
+        return destino
+
+    def __repr__(self) -> str:
+        """Representación técnica del constructor."""
+        return (f"ConstructorReutilizable(persona={self._persona!r}, "
+                f"valido={self.valido})")
+
+
+def validar_en_buffer(filas: Iterable[Dict], buffer: BufferPersonas,
+                      al_llenarse: Callable[[BufferPersonas], None]) -> Tuple[int, int]:
+    """
+    Valida filas copiando las válidas en un buffer que se entrega al llenarse.
+    
+    al_llenarse recibe el buffer lleno (y al final el resto de las filas)
+    y debe consumirlo antes de volver: después el buffer se vacía y se
+    reutiliza.
+    
+    Args:
+        filas (Iterable[Dict]): Diccionarios con los campos de Persona
+        buffer (BufferPersonas): Buffer donde se acumulan las filas válidas
+        al_llenarse (Callable[[BufferPersonas], None]): Destino de cada
+            buffer lleno
+            
+    Returns:
+        Tuple[int, int]: Cantidad de filas válidas y de filas rechazadas
+    """
+    constructor = ConstructorReutilizable()
+    cargar = constructor.cargar
+    escribir = constructor.escribir_en
+    validas = rechazadas = 0
+    for fila in filas:
+        if not cargar(fila):
+            rechazadas += 1
+            continue
+        if buffer.lleno:
+            al_llenarse(buffer)
+            buffer.vaciar()
+        escribir(buffer)
+        validas += 1
+    if len(buffer):
+        al_llenarse(buffer)
+        buffer.vaciar()
+    return validas, rechazadas
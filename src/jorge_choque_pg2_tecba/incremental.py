@@ -0,0 +1,248 @@
+"""
+Módulo de validación incremental con resultados guardados en disco.
+
+Guarda en una base SQLite local la huella de cada fila validada y su
+resultado (la persona normalizada o el motivo del rechazo). En la
+siguiente ingesta solo se validan las filas nuevas o modificadas; las
+demás se toman de la base.
+
+Los resultados quedan asociados a la versión de las reglas: un hash del
+código de validators.py y core.py. Si las reglas cambian, la base se
+vacía al abrirla y todas las filas se vuelven a validar.
+
+Ejemplo:
+    >>> from jorge_choque_pg2_tecba.incremental import CacheIncremental
+    >>> from jorge_choque_pg2_tecba.ingest import ingerir
+    >>> with CacheIncremental("validacion.sqlite") as cache:
+    ...     ingerir(entrada, validos, rechazados, 'csv', cache=cache)
+"""
+
+import json
+import sqlite3
+from hashlib import blake2b, sha256
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+from . import core, validators
+from .core import _CAMPOS
+
+
+# Campos de Persona que forman parte de la huella de una fila
+_CAMPOS_PERSONA = tuple(campo for campo, _ in _CAMPOS)
+
+# Resultado de una fila, como en ingest.validar_filas:
+# (True, datos normalizados) o (False, motivo)
+Resultado = Tuple[bool, Union[Dict, str]]
+
+# Separador de los valores en la huella y en los datos guardados; ninguna
+# regla de validación acepta este carácter
+_SEPARADOR = '\x00'
+
+# Huellas por consulta al resolver un bloque; por debajo del límite de
+# parámetros de SQLite anterior a 3.32 (999)
+_HUELLAS_POR_CONSULTA = 900
+
+_version_reglas: Optional[str] = None
+
+
+def version_reglas() -> str:
+    """
+    Obtiene el hash de las reglas de validación actuales.
+    
+    Se calcula sobre el código de validators.py y core.py, así que
+    cualquier cambio en esos módulos invalida los resultados guardados.
+    
+    Returns:
+        str: Hash hexadecimal de las reglas
+    """
+    global _version_reglas
+    if _version_reglas is None:
+        resumen = sha256()
+        for modulo in (validators, core):
+            with open(cast(str, modulo.__file__), 'rb') as archivo:
+                resumen.update(archivo.read())
+        _version_reglas = resumen.hexdigest()
+    return _version_reglas
+
+
+def huella(fila: Dict) -> bytes:
+    """
+    Calcula la huella de los campos de Persona de una fila.
+    
+    Como en Persona.desde_dict, None y '' son equivalentes y los valores
+    que no son texto se comparan por su str(). Las columnas que no son de
+    Persona no influyen en la validación y no forman parte de la huella.
+    
+    Args:
+        fila (Dict): Fila con los campos de la persona
+        
+    Returns:
+        bytes: Resumen de 16 bytes de los valores de los campos
+    """
+    obtener = fila.get
+    valores = ['' if valor is None else str(valor)
+               for valor in map(obtener, _CAMPOS_PERSONA)]
+    texto = _SEPARADOR.join(valores)
+    if texto.count(_SEPARADOR) != len(valores) - 1:
+        # Algún valor contiene el separador: se codifica sin ambigüedad
+        texto = json.dumps(valores)
+    return blake2b(texto.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+def _codificar(resultado: Resultado) -> Optional[str]:
+    """Codifica un resultado; None si no puede guardarse."""
+    salida = resultado[1]
+    if isinstance(salida, str):   # (False, motivo)
+        return salida
+    texto = _SEPARADOR.join('' if valor is None else str(valor)
+                            for valor in map(salida.get, _CAMPOS_PERSONA))
+    if texto.count(_SEPARADOR) != len(_CAMPOS_PERSONA) - 1:
+        return None
+    return texto
+
+
+def _decodificar(valido: int, salida: str) -> Resultado:
+    """Reconstruye un resultado guardado con _codificar."""
+    if not valido:
+        return False, salida
+    nombre, edad, documento, email, celular, direccion = salida.split(_SEPARADOR)
+    return True, {
+        'nombre': nombre or None,
+        'edad': int(edad) if edad else None,
+        'documento_identidad': documento or None,
+        'email': email or None,
+        'celular': celular or None,
+        'direccion': direccion or None,
+    }
+
+
+class CacheIncremental:
+    """
+    Resultados de validación por huella de fila, guardados en SQLite.
+    
+    Los resultados no se cargan en memoria: cada bloque se resuelve con
+    unas pocas consultas por clave primaria (hasta _HUELLAS_POR_CONSULTA
+    huellas por consulta), así que la memoria usada no depende del tamaño
+    de la base. Los resultados nuevos se escriben en la base por bloques.
+    
+    Attributes:
+        ruta (str): Ruta de la base de datos
+        aciertos (int): Filas resueltas desde la base
+        fallos (int): Filas que hubo que validar
+        invalidada (bool): Si al abrirla se descartaron resultados de
+            otra versión de las reglas
+    """
+
+    def __init__(self, ruta: str, version: Optional[str] = None):
+        """
+        Abre (o crea) la base de resultados.
+        
+        Args:
+            ruta (str): Ruta del archivo SQLite
+            version (Optional[str]): Versión de las reglas; por defecto
+                version_reglas()
+        """
+        self.ruta = ruta
+        self.version = version or version_reglas()
+        self.aciertos = 0
+        self.fallos = 0
+        self._conexion = sqlite3.connect(ruta)
+        self._conexion.execute('PRAGMA journal_mode=WAL')
+        self._conexion.execute('PRAGMA synchronous=NORMAL')
+        with self._conexion:
+            self._conexion.execute(
+                'CREATE TABLE IF NOT EXISTS meta (clave TEXT PRIMARY KEY, valor TEXT)')
+            self._conexion.execute(
+                'CREATE TABLE IF NOT EXISTS resultados '
+                '(huella BLOB PRIMARY KEY, valido INTEGER NOT NULL,'
+                ' salida TEXT NOT NULL) '
+                'WITHOUT ROWID')
+            fila = self._conexion.execute(
+                "SELECT valor FROM meta WHERE clave = 'version_reglas'").fetchone()
+            self.invalidada = fila is not None and fila[0] != self.version
+            if fila is None or self.invalidada:
+                self._conexion.execute('DELETE FROM resultados')
+                self._conexion.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('version_reglas', ?)",
+                    (self.version,))
+
+    def __len__(self) -> int:
+        """Cantidad de resultados guardados."""
+        cantidad: int = self._conexion.execute(
+            'SELECT count(*) FROM resultados').fetchone()[0]
+        return cantidad
+
+    def _buscar(self, huellas: Sequence[bytes]) -> Dict[bytes, Tuple[int, str]]:
+        """Obtiene de la base los resultados guardados de un grupo de huellas."""
+        distintas = list(dict.fromkeys(huellas))
+        guardados = {}
+        for inicio in range(0, len(distintas), _HUELLAS_POR_CONSULTA):
+            grupo = distintas[inicio:inicio + _HUELLAS_POR_CONSULTA]
+            consulta = ('SELECT huella, valido, salida FROM resultados '
+                        'WHERE huella IN (' + ', '.join('?' * len(grupo)) + ')')
+            for clave, valido, salida in self._conexion.execute(consulta, grupo):
+                guardados[clave] = (valido, salida)
+        return guardados
+
+    def resolver(
+        self, filas: Sequence[Dict]
+    ) -> Tuple[List[Optional[Resultado]], List[bytes]]:
+        """
+        Obtiene los resultados guardados de un bloque de filas.
+        
+        Args:
+            filas (Sequence[Dict]): Las filas del bloque
+            
+        Returns:
+            Tuple[List[Optional[Resultado]], List[bytes]]: El resultado de
+            cada fila (None si hay que validarla) y la huella de cada fila
+        """
+        huellas = [huella(fila) for fila in filas]
+        obtener = self._buscar(huellas).get
+        resultados = []
+        for clave in huellas:
+            guardado = obtener(clave)
+            resultados.append(None if guardado is None else _decodificar(*guardado))
+        faltantes = resultados.count(None)
+        self.fallos += faltantes
+        self.aciertos += len(resultados) - faltantes
+        return resultados, huellas
+
+    def guardar(self, resultados: Iterable[Tuple[bytes, Resultado]]) -> None:
+        """
+        Guarda resultados nuevos en una sola transacción.
+        
+        Args:
+            resultados (Iterable[Tuple[bytes, Resultado]]): Pares (huella, resultado)
+        """
+        nuevos = []
+        for clave, resultado in resultados:
+            salida = _codificar(resultado)
+            if salida is not None:
+                nuevos.append((clave, int(resultado[0]), salida))
+        with self._conexion:
+            self._conexion.executemany(
+                'INSERT OR REPLACE INTO resultados VALUES (?, ?, ?)', nuevos)
+
+    def cerrar(self) -> None:
+        """Cierra la base de datos."""
+        self._conexion.close()
+
+    def __enter__(self) -> 'CacheIncremental':
+        return self
+
+    def __exit__(self, *excepcion: object) -> None:
+        self.cerrar()
+
+    def __repr__(self) -> str:
+        """Representación técnica de la caché."""
+        return (f"CacheIncremental(ruta={self.ruta!r}, aciertos={self.aciertos}, "
+                f"fallos={self.fallos})")
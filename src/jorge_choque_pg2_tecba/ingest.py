@@ -0,0 +1,453 @@
+"""
+Módulo de ingesta masiva de archivos CSV y JSONL.
+
+Este módulo lee archivos grandes por bloques de tamaño acotado, reparte
+los bloques entre un ProcessPoolExecutor y construye cada fila con las
+mismas reglas de validación que Persona. Las filas válidas y las
+rechazadas (con el motivo del rechazo) se escriben en salidas separadas.
+
+Uso desde la línea de comandos:
+    python -m jorge_choque_pg2_tecba.ingest personas.csv \\
+        --validos validos.csv --rechazados rechazados.csv
+"""
+
+import argparse
+import csv
+import json
+import os
+import sqlite3
+import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    cast,
+)
+
+from .core import Persona
+from .incremental import CacheIncremental, Resultado
+
+
+CAMPOS_PERSONA = (
+    'nombre',
+    'edad',
+    'documento_identidad',
+    'email',
+    'celular',
+    'direccion',
+)
+
+CAMPO_MOTIVO = 'motivo'
+
+CAMPO_LINEA = 'linea'
+
+CAMPO_CONTENIDO = 'contenido'
+
+FORMATOS = ('csv', 'jsonl')
+
+# Bloque, resultados guardados (None si falta validarla) y huellas de un
+# bloque de la ingesta incremental
+_Contexto = Tuple[List[Dict], List[Optional[Resultado]], List[Optional[bytes]]]
+
+
+def detectar_formato(ruta: str) -> str:
+    """
+    Deduce el formato de un archivo a partir de su extensión.
+    
+    Args:
+        ruta (str): Ruta del archivo
+        
+    Returns:
+        str: 'csv' o 'jsonl'
+        
+    Raises:
+        ValueError: Si la extensión no corresponde a un formato soportado
+    """
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == '.csv':
+        return 'csv'
+    if extension in ('.jsonl', '.ndjson'):
+        return 'jsonl'
+    raise ValueError(
+        f"No se puede deducir el formato de '{ruta}'. Use --formato csv|jsonl.")
+
+
+class FilaIlegible(dict):
+    """
+    Línea de un JSONL que no contiene un objeto JSON.
+    
+    Guarda el número de línea, el texto original y el motivo; se rechaza
+    sin validarla y la ingesta continúa con la línea siguiente.
+    """
+
+
+def _leer_linea_json(numero: int, linea: str) -> Dict:
+    """Decodifica una línea JSONL; si no es un objeto devuelve una FilaIlegible."""
+    try:
+        datos = json.loads(linea)
+    except (ValueError, RecursionError) as error:
+        motivo = f"JSON inválido: {getattr(error, 'msg', error)}"
+    else:
+        if isinstance(datos, dict):
+            return datos
+        motivo = f"se esperaba un objeto JSON y se encontró {type(datos).__name__}"
+    return FilaIlegible({
+        CAMPO_LINEA: numero,
+        CAMPO_CONTENIDO: linea.rstrip('\r\n'),
+        CAMPO_MOTIVO: f"Línea {numero}: {motivo}",
+    })
+
+
+def leer_filas(archivo: TextIO, formato: str) -> Iterator[Dict]:
+    """
+    Lee las filas de un archivo abierto de forma perezosa.
+    
+    En JSONL, las líneas que no contienen un objeto JSON se entregan como
+    FilaIlegible en lugar de interrumpir la lectura.
+    
+    Args:
+        archivo: Archivo de texto abierto para lectura
+        formato (str): 'csv' o 'jsonl'
+        
+    Returns:
+        Iterator[Dict]: Las filas como diccionarios, una a la vez
+    """
+    if formato == 'csv':
+        yield from csv.DictReader(archivo)
+        return
+
+    for numero, linea in enumerate(archivo, 1):
+        if linea.strip():
+            yield _leer_linea_json(numero, linea)
+
+
+def en_bloques(filas: Iterable[Dict], tamano: int) -> Iterator[List[Dict]]:
+    """
+    Agrupa las filas en bloques de como máximo `tamano` elementos.
+    
+    Args:
+        filas (Iterable[Dict]): Las filas a agrupar
+        tamano (int): Cantidad máxima de filas por bloque
+        
+    Returns:
+        Iterator[List[Dict]]: Los bloques en el orden original
+    """
+    iterador = iter(filas)
+    while True:
+        bloque = list(islice(iterador, tamano))
+        if not bloque:
+            return
+        yield bloque
+
+
+def validar_filas(bloque: List[Dict]) -> List[Resultado]:
+    """
+    Valida un bloque de filas. Se ejecuta dentro de los procesos del pool.
+    
+    Cada fila se valida con Persona.desde_dict en modo 'acumular', de modo
+    que el motivo de rechazo incluye todos los campos inválidos. Las
+    FilaIlegible se rechazan con su propio motivo.
+    
+    Args:
+        bloque (List[Dict]): Las filas a validar
+        
+    Returns:
+        List[Resultado]: Por fila, (True, datos normalizados por Persona)
+        o (False, motivo del rechazo)
+    """
+    resultados: List[Resultado] = []
+    for fila in bloque:
+        if isinstance(fila, FilaIlegible):
+            resultados.append((False, fila[CAMPO_MOTIVO]))
+            continue
+        resultado = Persona.desde_dict(fila, modo='acumular')
+        persona = resultado.persona
+        if persona is not None:
+            resultados.append((True, persona.obtener_todos_los_datos()))
+        else:
+            resultados.append((False, ' | '.join(resultado.mensajes)))
+    return resultados
+
+
+def separar_resultados(bloque: List[Dict], resultados: Sequence[Resultado]
+                       ) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Separa las filas de un bloque según sus resultados de validar_filas.
+    
+    Returns:
+        Tuple[List[Dict], List[Dict]]: Filas válidas (normalizadas por
+        Persona) y filas rechazadas (originales con el campo 'motivo')
+    """
+    validas = []
+    rechazadas = []
+    for fila, (valido, salida) in zip(bloque, resultados):
+        if valido:
+            validas.append(cast(Dict, salida))
+        else:
+            rechazada = dict(fila)
+            rechazada[CAMPO_MOTIVO] = salida
+            rechazadas.append(rechazada)
+    return validas, rechazadas
+
+
+def procesar_bloque(bloque: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Valida un bloque de filas. Se ejecuta dentro de los procesos del pool.
+    
+    Args:
+        bloque (List[Dict]): Las filas a validar
+        
+    Returns:
+        Tuple[List[Dict], List[Dict]]: Filas válidas (normalizadas por
+        Persona) y filas rechazadas (originales con el campo 'motivo')
+    """
+    return separar_resultados(bloque, validar_filas(bloque))
+
+
+def _trabajos_incrementales(bloques: Iterable[List[Dict]],
+                            cache: CacheIncremental
+                            ) -> Iterator[Tuple[_Contexto, List[Dict]]]:
+    """Busca cada bloque en la caché y deja para validar solo las filas nuevas."""
+    for bloque in bloques:
+        legibles = [fila for fila in bloque if not isinstance(fila, FilaIlegible)]
+        resultados: List[Optional[Resultado]]
+        huellas: List[Optional[bytes]]
+        if len(legibles) == len(bloque):
+            guardados, huellas_legibles = cache.resolver(bloque)
+            resultados, huellas = guardados, list(huellas_legibles)
+        else:
+            # Las líneas ilegibles no pasan por la caché: su huella sería
+            # la de una fila vacía
+            guardados, huellas_legibles = cache.resolver(legibles)
+            guardados_restantes = iter(guardados)
+            huellas_restantes = iter(huellas_legibles)
+            resultados, huellas = [], []
+            for fila in bloque:
+                if isinstance(fila, FilaIlegible):
+                    resultados.append((False, fila[CAMPO_MOTIVO]))
+                    huellas.append(None)
+                else:
+                    resultados.append(next(guardados_restantes))
+                    huellas.append(next(huellas_restantes))
+        nuevas = [fila for fila, resultado in zip(bloque, resultados)
+                  if resultado is None]
+        yield (bloque, resultados, huellas), nuevas
+
+
+def _completar_incremental(contexto: _Contexto, nuevos: List[Resultado],
+                           cache: CacheIncremental) -> Tuple[List[Dict], List[Dict]]:
+    """Combina los resultados guardados con los nuevos y guarda los nuevos."""
+    bloque, guardados, huellas = contexto
+    nuevos_restantes = iter(nuevos)
+    resultados: List[Resultado] = []
+    guardar = []
+    for resultado, huella in zip(guardados, huellas):
+        if resultado is None:
+            resultado = next(nuevos_restantes)
+            # Solo las filas ilegibles no tienen huella, y nunca faltan validar
+            guardar.append((cast(bytes, huella), resultado))
+        resultados.append(resultado)
+    cache.guardar(guardar)
+    return separar_resultados(bloque, resultados)
+
+
+class _Escritor:
+    """Escritor de filas en CSV o JSONL con cabecera perezosa."""
+
+    def __init__(self, archivo: TextIO, formato: str,
+                 campos: Optional[List[str]] = None) -> None:
+        self._archivo = archivo
+        self._formato = formato
+        self._campos = campos
+        self._csv: Optional['csv.DictWriter[str]'] = None
+
+    def escribir(self, filas: List[Dict]) -> None:
+        """Escribe un lote de filas en el archivo de salida."""
+        if self._formato == 'jsonl':
+            self._archivo.writelines(
+                json.dumps(fila, ensure_ascii=False) + '\n' for fila in filas
+            )
+            return
+
+        if not filas:
+            return
+        escritor = self._csv
+        if escritor is None:
+            campos = self._campos or list(filas[0])
+            escritor = self._csv = csv.DictWriter(self._archivo, fieldnames=campos,
+                                                  extrasaction='ignore')
+            escritor.writeheader()
+        escritor.writerows(filas)
+
+
+def ingerir(entrada: TextIO, salida_validos: TextIO, salida_rechazados: TextIO,
+            formato: str,
+            tamano_bloque: int = 10_000, procesos: Optional[int] = None,
+            cache: Optional[CacheIncremental] = None) -> Tuple[int, int]:
+    """
+    Valida un archivo completo manteniendo acotada la memoria usada.
+    
+    Como máximo hay 2 bloques pendientes por proceso: el lector no avanza
+    mientras el bloque más antiguo no se haya escrito, por lo que el uso
+    de memoria no depende del tamaño de la entrada. El orden de salida
+    respeta el orden de entrada.
+    
+    Args:
+        entrada: Archivo de texto abierto con los datos de entrada
+        salida_validos: Archivo de texto abierto para las filas válidas
+        salida_rechazados: Archivo de texto abierto para las filas rechazadas
+        formato (str): 'csv' o 'jsonl' (se usa para entrada y salidas)
+        tamano_bloque (int): Cantidad de filas por bloque
+        procesos (Optional[int]): Procesos del pool; 1 procesa en el
+            proceso actual y None usa os.cpu_count()
+        cache (Optional[CacheIncremental]): Resultados de ingestas
+            anteriores; solo se validan las filas
+            que no están en ella y sus resultados se agregan
+            
+    Returns:
+        Tuple[int, int]: Cantidad de filas válidas y rechazadas
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato inválido: '{formato}'. Debe ser uno de {FORMATOS}.")
+    if tamano_bloque < 1:
+        raise ValueError("El tamaño de bloque debe ser al menos 1.")
+
+    campos_rechazados = None
+    filas: Iterable[Dict]
+    if formato == 'csv':
+        lector = csv.DictReader(entrada)
+        campos_rechazados = list(lector.fieldnames or []) + [CAMPO_MOTIVO]
+        filas = lector
+    else:
+        filas = leer_filas(entrada, formato)
+
+    escritor_validos = _Escritor(salida_validos, formato, list(CAMPOS_PERSONA))
+    escritor_rechazados = _Escritor(salida_rechazados, formato, campos_rechazados)
+    total_validos = 0
+    total_rechazados = 0
+
+    def escribir(resultado: Tuple[List[Dict], List[Dict]]) -> None:
+        nonlocal total_validos, total_rechazados
+        validas, rechazadas = resultado
+        escritor_validos.escribir(validas)
+        escritor_rechazados.escribir(rechazadas)
+        total_validos += len(validas)
+        total_rechazados += len(rechazadas)
+
+    bloques = en_bloques(filas, tamano_bloque)
+    procesos = procesos or os.cpu_count() or 1
+
+    # Sin caché se valida y separa cada bloque completo; con caché solo se
+    # validan las filas nuevas y el resto se completa al terminar
+    tarea: Callable[[List[Dict]], Any]
+    trabajos: Iterator[Tuple[Any, List[Dict]]]
+    incremental = cache
+    if incremental is None:
+        tarea = procesar_bloque
+        trabajos = ((None, bloque) for bloque in bloques)
+
+        def terminar(contexto: Any, resultado: Any) -> None:
+            escribir(resultado)
+    else:
+        tarea = validar_filas
+        trabajos = _trabajos_incrementales(bloques, incremental)
+
+        def terminar(contexto: Any, resultado: Any) -> None:
+            escribir(_completar_incremental(contexto, resultado, incremental))
+
+    if procesos == 1:
+        for contexto, trabajo in trabajos:
+            terminar(contexto, tarea(trabajo))
+        return total_validos, total_rechazados
+
+    max_pendientes = 2 * procesos
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        pendientes: Deque[Tuple[Any, Future]] = deque()
+        for contexto, trabajo in trabajos:
+            pendientes.append((contexto, pool.submit(tarea, trabajo)))
+            if len(pendientes) >= max_pendientes:
+                contexto, futuro = pendientes.popleft()
+                terminar(contexto, futuro.result())
+        while pendientes:
+            contexto, futuro = pendientes.popleft()
+            terminar(contexto, futuro.result())
+
+    return total_validos, total_rechazados
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    """Crea el parser de argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(
+        prog='python -m jorge_choque_pg2_tecba.ingest',
+        description='Valida personas desde un archivo CSV o JSONL.',
+    )
+    parser.add_argument('entrada', help='Archivo CSV o JSONL de entrada')
+    parser.add_argument('--validos', required=True,
+                        help='Archivo de salida para las filas válidas')
+    parser.add_argument('--rechazados', required=True,
+                        help='Archivo de salida para las filas rechazadas')
+    parser.add_argument('--formato', choices=FORMATOS,
+                        help='Formato de los archivos '
+                             '(por defecto se deduce de la extensión)')
+    parser.add_argument('--tamano-bloque', type=int, default=10_000,
+                        help='Filas por bloque enviado a cada proceso '
+                             '(por defecto 10000)')
+    parser.add_argument('--procesos', type=int, default=None,
+                        help='Cantidad de procesos (por defecto, uno por CPU)')
+    parser.add_argument('--incremental', metavar='BASE',
+                        help='Base SQLite con los resultados de ingestas anteriores: '
+                             'solo se validan las filas nuevas o modificadas')
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada de la línea de comandos.
+    
+    Args:
+        argv (Optional[List[str]]): Argumentos; por defecto sys.argv[1:]
+        
+    Returns:
+        int: Código de salida del proceso
+    """
+    args = crear_parser().parse_args(argv)
+    cache = None
+    try:
+        formato = args.formato or detectar_formato(args.entrada)
+        if args.incremental:
+            cache = CacheIncremental(args.incremental)
+        with open(args.entrada, 'r', encoding='utf-8', newline='') as entrada, \
+                open(args.validos, 'w', encoding='utf-8', newline='') as validos, \
+                open(args.rechazados, 'w', encoding='utf-8', newline='') as rechazados:
+            total_validos, total_rechazados = ingerir(
+                entrada, validos, rechazados, formato,
+                tamano_bloque=args.tamano_bloque, procesos=args.procesos, cache=cache,
+            )
+    except (OSError, ValueError, csv.Error, sqlite3.Error) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+    finally:
+        if cache is not None:
+            cache.cerrar()
+
+    print(f"Filas válidas: {total_validos}, filas rechazadas: {total_rechazados}")
+    if cache is not None:
+        print(f"Reutilizadas de {args.incremental}: {cache.aciertos}, "
+              f"validadas: {cache.fallos}"
+              + (" (las reglas cambiaron: se validó todo)" if cache.invalidada else ""))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,403 @@
+"""
+Módulo de métricas opcionales para los validadores y los setters de Persona.
+
+Al llamar a activar() se envuelven los métodos validar_* de los
+validadores y los métodos establecer_* de Persona para contar llamadas,
+rechazos por motivo y un histograma de latencias por método. Mientras
+está desactivado los métodos originales quedan intactos, por lo que no
+hay ningún costo.
+
+Solo se registra la llamada más externa de cada hilo: establecer_nombre
+cuenta una vez, aunque por dentro llame a validar_nombre y este a
+validar_solo_letras. Los caminos que aplican las reglas sin llamar a
+estos métodos no se cuentan: ValidadorLote, los esquemas compilados
+(esquema.validar_persona y, por lo tanto, concurrente y servidor) y el
+accesor de pandas.
+
+Ejemplo:
+    >>> from jorge_choque_pg2_tecba import metricas
+    >>> metricas.activar()
+    >>> ...  # validar datos
+    >>> metricas.exportar_prometheus("/var/lib/node_exporter/validacion.prom")
+    >>> metricas.exportar_json("metricas.json")
+    >>> metricas.desactivar()
+"""
+
+import inspect
+import json
+import os
+import tempfile
+import time
+from bisect import bisect_left
+from functools import wraps
+from threading import Lock, local
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .core import Persona
+from .validators import (
+    LONGITUD_MAXIMA_EMAIL,
+    LONGITUD_MAXIMA_ENTRADA,
+    ValidadorBase,
+    ValidadorDatosContacto,
+    ValidadorDatosPersonales,
+)
+
+
+# Motivos de rechazo
+VACIO = 'vacio'
+DEMASIADO_LARGO = 'demasiado_largo'
+DEMASIADO_CORTO = 'demasiado_corto'
+CARACTERES_INVALIDOS = 'caracteres_invalidos'
+FORMATO_INVALIDO = 'formato_invalido'
+FUERA_DE_RANGO = 'fuera_de_rango'
+
+# Límites superiores (en nanosegundos) de los buckets del histograma
+LIMITES_HISTOGRAMA_NS = (250, 500, 1_000, 2_000, 4_000, 8_000, 16_000,
+                         32_000, 64_000, 128_000, 256_000, 1_000_000)
+
+_PREFIJO = 'jorge_choque_validacion'
+
+
+class MetricaMetodo:
+    """Contadores y histograma de latencias de un método instrumentado."""
+
+    __slots__ = ('llamadas', 'rechazos', 'buckets', 'suma_ns', '_candado')
+
+    def __init__(self) -> None:
+        self.llamadas = 0
+        self.rechazos: Dict[str, int] = {}
+        self.buckets = [0] * (len(LIMITES_HISTOGRAMA_NS) + 1)
+        self.suma_ns = 0
+        self._candado = Lock()
+
+    def registrar(self, duracion_ns: int, motivo: Optional[str]) -> None:
+        """Registra una llamada con su duración y, si fue rechazada, su motivo."""
+        bucket = bisect_left(LIMITES_HISTOGRAMA_NS, duracion_ns)
+        with self._candado:
+            self.llamadas += 1
+            self.suma_ns += duracion_ns
+            self.buckets[bucket] += 1
+            if motivo is not None:
+                self.rechazos[motivo] = self.rechazos.get(motivo, 0) + 1
+
+    def instantanea(self) -> Dict:
+        """Copia consistente de los valores actuales."""
+        with self._candado:
+            return {
+                'llamadas': self.llamadas,
+                'rechazos': dict(self.rechazos),
+                'suma_ns': self.suma_ns,
+                'buckets': list(self.buckets),
+            }
+
+
+# Clasificadores de rechazo: reciben el valor rechazado y devuelven el motivo.
+# Solo se ejecutan cuando la validación falla.
+
+def _motivo_caracteres(valor: Any) -> str:
+    return VACIO if not valor else CARACTERES_INVALIDOS
+
+
+def _motivo_edad(edad: Any) -> str:
+    edad = str(edad) if edad is not None and not isinstance(edad, str) else edad
+    if not edad:
+        return VACIO
+    if len(edad) > LONGITUD_MAXIMA_ENTRADA:
+        return DEMASIADO_LARGO
+    if not edad.isdigit():
+        return CARACTERES_INVALIDOS
+    return FUERA_DE_RANGO
+
+
+def _motivo_texto(minimo: int, maximo: int) -> Callable[[Any], str]:
+    def clasificar(valor: Any) -> str:
+        if not valor or not valor.strip():
+            return VACIO
+        if len(valor) > LONGITUD_MAXIMA_ENTRADA:
+            return DEMASIADO_LARGO
+        limpio = ' '.join(valor.split())
+        if len(limpio) < minimo:
+            return DEMASIADO_CORTO
+        if len(limpio) > maximo:
+            return DEMASIADO_LARGO
+        return CARACTERES_INVALIDOS
+    return clasificar
+
+
+def _motivo_digitos(minimo: int, maximo: int,
+                    normalizar: Callable[[str], str]) -> Callable[[Any], str]:
+    def clasificar(valor: Any) -> str:
+        if not valor:
+            return VACIO
+        if len(valor) > LONGITUD_MAXIMA_ENTRADA:
+            return DEMASIADO_LARGO
+        limpio = normalizar(valor)
+        if not limpio.isdigit():
+            return CARACTERES_INVALIDOS
+        return DEMASIADO_CORTO if len(limpio) < minimo else DEMASIADO_LARGO
+    return clasificar
+
+
+def _motivo_email(email: Any) -> str:
+    if not email:
+        return VACIO
+    if len(email) > LONGITUD_MAXIMA_EMAIL:
+        return DEMASIADO_LARGO
+    return FORMATO_INVALIDO
+
+
+_MOTIVO_NOMBRE = _motivo_texto(2, 50)
+_MOTIVO_DOCUMENTO = _motivo_digitos(
+    7, 12, ValidadorDatosPersonales.normalizar_documento)
+_MOTIVO_CELULAR = _motivo_digitos(8, 15, ValidadorDatosContacto.normalizar_celular)
+_MOTIVO_DIRECCION = _motivo_texto(5, 200)
+
+# (clase, método, es estático, clasificador de rechazos)
+_VALIDADORES = (
+    (ValidadorBase, 'validar_solo_numeros', True, _motivo_caracteres),
+    (ValidadorBase, 'validar_solo_letras', True, _motivo_caracteres),
+    (ValidadorBase, 'validar_alfanumerico', True, _motivo_caracteres),
+    (ValidadorDatosPersonales, 'validar_edad', False, _motivo_edad),
+    (ValidadorDatosPersonales, 'validar_nombre', False, _MOTIVO_NOMBRE),
+    (ValidadorDatosPersonales, 'validar_documento_identidad', False, _MOTIVO_DOCUMENTO),
+    (ValidadorDatosContacto, 'validar_email', False, _motivo_email),
+    (ValidadorDatosContacto, 'validar_celular', False, _MOTIVO_CELULAR),
+    (ValidadorDatosContacto, 'validar_direccion', False, _MOTIVO_DIRECCION),
+)
+
+_SETTERS = (
+    ('establecer_nombre', _MOTIVO_NOMBRE),
+    ('establecer_edad', _motivo_edad),
+    ('establecer_documento_identidad', _MOTIVO_DOCUMENTO),
+    ('establecer_email', _motivo_email),
+    ('establecer_celular', _MOTIVO_CELULAR),
+    ('establecer_direccion', _MOTIVO_DIRECCION),
+)
+
+_metricas: Dict[str, MetricaMetodo] = {}
+_originales: List[Tuple[type, str, object]] = []
+_candado = Lock()
+
+
+class _Anidamiento(local):
+    """Indica, por hilo, si hay una llamada instrumentada en curso."""
+
+    en_curso = False
+
+
+_anidamiento = _Anidamiento()
+
+
+def _metrica(nombre: str) -> MetricaMetodo:
+    metrica = _metricas.get(nombre)
+    if metrica is None:
+        metrica = _metricas.setdefault(nombre, MetricaMetodo())
+    return metrica
+
+
+def _extractor_valor(funcion: Callable) -> Callable[[tuple, dict], Any]:
+    """
+    Obtiene el valor validado de los argumentos de una llamada.
+    
+    Es el último parámetro de la función, pasado por posición o por nombre.
+    """
+    parametro = list(inspect.signature(funcion).parameters)[-1]
+
+    def extraer(args: tuple, kwargs: dict) -> Any:
+        return kwargs[parametro] if parametro in kwargs else args[-1]
+
+    return extraer
+
+
+def _instrumentar_validador(funcion: Callable, metrica: MetricaMetodo,
+                            clasificar: Callable[[Any], str]) -> Callable:
+    reloj = time.perf_counter_ns
+    registrar = metrica.registrar
+    extraer = _extractor_valor(funcion)
+    estado = _anidamiento
+
+    @wraps(funcion)
+    def instrumentada(*args: Any, **kwargs: Any) -> Any:
+        if estado.en_curso:
+            return funcion(*args, **kwargs)
+        estado.en_curso = True
+        inicio = reloj()
+        try:
+            resultado = funcion(*args, **kwargs)
+        finally:
+            estado.en_curso = False
+        duracion = reloj() - inicio
+        registrar(duracion, None if resultado else clasificar(extraer(args, kwargs)))
+        return resultado
+
+    return instrumentada
+
+
+def _instrumentar_setter(funcion: Callable, metrica: MetricaMetodo,
+                         clasificar: Callable[[Any], str]) -> Callable:
+    reloj = time.perf_counter_ns
+    registrar = metrica.registrar
+    extraer = _extractor_valor(funcion)
+    estado = _anidamiento
+
+    @wraps(funcion)
+    def instrumentada(*args: Any, **kwargs: Any) -> Any:
+        if estado.en_curso:
+            return funcion(*args, **kwargs)
+        estado.en_curso = True
+        inicio = reloj()
+        try:
+            resultado = funcion(*args, **kwargs)
+        except ValueError:
+            registrar(reloj() - inicio, clasificar(extraer(args, kwargs)))
+            raise
+        finally:
+            estado.en_curso = False
+        registrar(reloj() - inicio, None)
+        return resultado
+
+    return instrumentada
+
+
+def activo() -> bool:
+    """Indica si la instrumentación está activada."""
+    return bool(_originales)
+
+
+def activar() -> None:
+    """
+    Activa la instrumentación de los validadores y de los setters de Persona.
+    
+    Las métricas acumuladas se conservan entre activaciones; use
+    reiniciar() para ponerlas en cero. Llamarla estando activa no hace nada.
+    """
+    with _candado:
+        if _originales:
+            return
+        for clase, nombre, estatico, clasificar in _VALIDADORES:
+            original = clase.__dict__[nombre]
+            funcion = original.__func__ if estatico else original
+            envuelta = _instrumentar_validador(
+                funcion, _metrica(f"{clase.__name__}.{nombre}"), clasificar)
+            setattr(clase, nombre, staticmethod(envuelta) if estatico else envuelta)
+            _originales.append((clase, nombre, original))
+        for nombre, clasificar in _SETTERS:
+            original = Persona.__dict__[nombre]
+            envuelta = _instrumentar_setter(
+                original, _metrica(f"Persona.{nombre}"), clasificar)
+            setattr(Persona, nombre, envuelta)
+            _originales.append((Persona, nombre, original))
+
+
+def desactivar() -> None:
+    """Restaura los métodos originales; las métricas acumuladas se conservan."""
+    with _candado:
+        while _originales:
+            clase, nombre, original = _originales.pop()
+            setattr(clase, nombre, original)
+
+
+def reiniciar() -> None:
+    """Pone en cero todas las métricas."""
+    with _candado:
+        for metrica in _metricas.values():
+            with metrica._candado:
+                metrica.llamadas = 0
+                metrica.rechazos.clear()
+                metrica.buckets = [0] * len(metrica.buckets)
+                metrica.suma_ns = 0
+
+
+def instantanea() -> Dict:
+    """
+    Obtiene los valores actuales de todas las métricas.
+    
+    Returns:
+        dict: Por método: llamadas, rechazos por motivo, suma de
+        latencias en nanosegundos y conteo por bucket (no acumulado) junto
+        con los límites de los buckets
+    """
+    return {
+        'activo': activo(),
+        'limites_histograma_ns': list(LIMITES_HISTOGRAMA_NS),
+        'metodos': {nombre: metrica.instantanea()
+                    for nombre, metrica in sorted(_metricas.items())},
+    }
+
+
+def _escribir_atomicamente(ruta: str, contenido: str) -> None:
+    """Escribe un archivo completo de una vez, para que no se lea a medias."""
+    directorio = os.path.dirname(os.path.abspath(ruta))
+    descriptor, temporal = tempfile.mkstemp(dir=directorio, suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'w', encoding='utf-8') as archivo:
+            archivo.write(contenido)
+        os.replace(temporal, ruta)
+    except BaseException:
+        os.unlink(temporal)
+        raise
+
+
+def exportar_json(ruta: str) -> None:
+    """
+    Guarda la instantánea de las métricas en un archivo JSON.
+    
+    Args:
+        ruta (str): Ruta del archivo de salida
+    """
+    _escribir_atomicamente(
+        ruta, json.dumps(instantanea(), indent=2, ensure_ascii=False))
+
+
+def formato_prometheus() -> str:
+    """
+    Obtiene las métricas en el formato de texto de Prometheus.
+    
+    Returns:
+        str: Contadores de llamadas y rechazos e histograma de latencias en segundos
+    """
+    datos = instantanea()['metodos']
+    lineas = [
+        f"# HELP {_PREFIJO}_llamadas_total Llamadas por método.",
+        f"# TYPE {_PREFIJO}_llamadas_total counter",
+    ]
+    lineas += [f'{_PREFIJO}_llamadas_total{{metodo="{m}"}} {d["llamadas"]}'
+               for m, d in datos.items()]
+    lineas += [
+        f"# HELP {_PREFIJO}_rechazos_total Valores rechazados por método y motivo.",
+        f"# TYPE {_PREFIJO}_rechazos_total counter",
+    ]
+    for metodo, d in datos.items():
+        for motivo, cantidad in sorted(d['rechazos'].items()):
+            lineas.append(f'{_PREFIJO}_rechazos_total'
+                          f'{{metodo="{metodo}",motivo="{motivo}"}} {cantidad}')
+    lineas += [
+        f"# HELP {_PREFIJO}_duracion_segundos Latencia por método.",
+        f"# TYPE {_PREFIJO}_duracion_segundos histogram",
+    ]
+    for metodo, d in datos.items():
+        acumulado = 0
+        for limite, cantidad in zip(LIMITES_HISTOGRAMA_NS, d['buckets']):
+            acumulado += cantidad
+            lineas.append(f'{_PREFIJO}_duracion_segundos_bucket'
+                          f'{{metodo="{metodo}",le="{limite / 1e9:g}"}} {acumulado}')
+        lineas.append(f'{_PREFIJO}_duracion_segundos_bucket'
+                      f'{{metodo="{metodo}",le="+Inf"}} {d["llamadas"]}')
+        lineas.append(f'{_PREFIJO}_duracion_segundos_sum{{metodo="{metodo}"}} '
+                      f'{d["suma_ns"] / 1e9:.9f}')
+        lineas.append(f'{_PREFIJO}_duracion_segundos_count{{metodo="{metodo}"}} '
+                      f'{d["llamadas"]}')
+    return "\n".join(lineas) + "\n"
+
+
+def exportar_prometheus(ruta: str) -> None:
+    """
+    Guarda las métricas en un archivo de texto de Prometheus.
+    
+    El archivo se reemplaza de forma atómica, como espera el textfile
+    collector de node_exporter.
+    
+    Args:
+        ruta (str): Ruta del archivo de salida (normalmente *.prom)
+    """
+    _escribir_atomicamente(ruta, formato_prometheus())
@@ -0,0 +1,353 @@
+"""
+Módulo de búsqueda aproximada de nombres para enlazar registros.
+
+"Juan Carlos Pérez" y "juan carlos perez" son la misma persona, pero
+comparar todos los pares de nombres es O(n²). Este módulo contiene:
+- plegar: Quita acentos y mayúsculas usando el conjunto de letras de
+  validar_solo_letras
+- clave_fonetica: Aproxima la pronunciación en español (z/s, v/b, h muda...)
+- IndiceNombres: Índice invertido de trigramas que solo compara cada
+  consulta con los candidatos de su bloque (filtrado por prefijo exacto o
+  pares de palabras fonéticas) y devuelve los mejores sobre un umbral
+
+Ejemplo:
+    >>> indice = IndiceNombres()
+    >>> indice.agregar("Juan Carlos Pérez", identificador=1)
+    >>> indice.buscar("JUAN CARLOS PEREZ")
+    [Coincidencia(identificador=1, nombre='Juan Carlos Pérez', similitud=1.0)]
+"""
+
+import heapq
+import math
+import re
+import unicodedata
+from array import array
+from collections import Counter
+from itertools import combinations
+from typing import (
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from .validators import _CARACTERES_LETRAS
+
+
+def _tabla_plegado() -> Dict[int, str]:
+    """Tabla de str.translate: cada letra permitida a su base en minúscula."""
+    tabla = {}
+    for caracter in _CARACTERES_LETRAS:
+        if caracter.isspace():
+            tabla[ord(caracter)] = ' '
+        else:
+            tabla[ord(caracter)] = unicodedata.normalize('NFKD', caracter)[0].lower()
+    return tabla
+
+
+_TABLA_PLEGADO = _tabla_plegado()
+
+# Reglas fonéticas del español, en orden, sobre texto ya plegado
+_REGLAS_FONETICAS = tuple((re.compile(patron), reemplazo) for patron, reemplazo in (
+    (r'ch', 'x'),
+    (r'qu(?=[ei])', 'k'),
+    (r'gu(?=[ei])', 'g'),
+    (r'g(?=[ei])', 'j'),
+    (r'c(?=[ei])', 's'),
+    (r'll', 'y'),
+    (r'h', ''),
+    (r'[cq]', 'k'),
+    (r'z', 's'),
+    (r'v', 'b'),
+    (r'w', 'u'),
+    (r'(.)\1+', r'\1'),
+))
+
+
+def plegar(nombre: str) -> str:
+    """
+    Normaliza un nombre para compararlo: sin acentos, en minúsculas y con
+    los espacios colapsados.
+    
+    Args:
+        nombre (str): El nombre a normalizar
+        
+    Returns:
+        str: El nombre plegado ('Ñuflo  Pérez' -> 'nuflo perez')
+    """
+    return ' '.join(nombre.translate(_TABLA_PLEGADO).lower().split())
+
+
+def clave_fonetica(nombre: str) -> str:
+    """
+    Obtiene una aproximación de la pronunciación en español de un nombre.
+    
+    Args:
+        nombre (str): El nombre (se pliega antes de aplicar las reglas)
+        
+    Returns:
+        str: La clave fonética ('González' y 'Gonzales' -> 'gonsales')
+    """
+    texto = plegar(nombre)
+    for patron, reemplazo in _REGLAS_FONETICAS:
+        texto = patron.sub(reemplazo, texto)
+    return texto
+
+
+def trigramas(texto: str) -> List[str]:
+    """
+    Obtiene los trigramas distintos de cada palabra, con un espacio a cada lado.
+    
+    Como se toman por palabra, el orden de las palabras no afecta.
+    
+    Args:
+        texto (str): Texto ya plegado
+        
+    Returns:
+        List[str]: Los trigramas sin repetir
+    """
+    gramas: Set[str] = set()
+    for palabra in texto.split():
+        palabra = f" {palabra} "
+        gramas.update(palabra[i:i + 3] for i in range(len(palabra) - 2))
+    return list(gramas)
+
+
+class Coincidencia(NamedTuple):
+    """Un nombre del índice parecido al buscado."""
+
+    identificador: Hashable
+    nombre: str
+    similitud: float
+
+
+class IndiceNombres:
+    """
+    Índice de nombres para búsqueda aproximada por trigramas.
+    
+    La similitud es el coeficiente de Dice entre los conjuntos de
+    trigramas de los nombres plegados (1.0 para nombres iguales salvo
+    acentos, mayúsculas y espacios). Los candidatos a comparar se generan
+    de una de dos formas:
+    
+    - 'trigramas': filtrado por prefijo. Solo se recorren las listas de
+      los trigramas menos frecuentes que bastan para no perder ningún
+      nombre por encima del umbral; el resultado es exacto.
+    - 'fonetico': bloqueo por pares de palabras. Solo se comparan los
+      nombres que comparten dos palabras con la misma clave_fonetica()
+      (o la única palabra, si el nombre tiene una). Es mucho más rápido
+      con nombres de pila y apellidos muy repetidos, pero no encuentra los
+      nombres que difieren en todas sus palabras salvo una.
+      
+    Las listas de cada trigrama y los trigramas de cada nombre se guardan
+    en arrays de enteros, de modo que un millón de nombres ocupa pocos
+    cientos de MB.
+    """
+
+    BLOQUEOS = ('trigramas', 'fonetico')
+
+    def __init__(self, fonetico: bool = False, bloqueo: str = 'trigramas'):
+        """
+        Inicializa un índice vacío.
+        
+        Args:
+            fonetico (bool): Si es True, los trigramas se toman de
+                clave_fonetica() en lugar del nombre plegado, de modo que
+                'Gonzales' y 'González' coinciden por completo
+            bloqueo (str): 'trigramas' o 'fonetico'
+            
+        Raises:
+            ValueError: Si el bloqueo no existe
+        """
+        if bloqueo not in self.BLOQUEOS:
+            raise ValueError(
+                f"Bloqueo inválido: '{bloqueo}'. Debe ser uno de {self.BLOQUEOS}.")
+        self.fonetico = fonetico
+        self.bloqueo = bloqueo
+        self._identificadores: List[Hashable] = []
+        self._nombres: List[str] = []
+        self._gramas = array('I')
+        self._inicios = array('Q', [0])
+        self._ids_grama: Dict[str, int] = {}
+        self._listas: List[array] = []
+        self._bloques: Dict[str, array] = {}
+
+    def __len__(self) -> int:
+        """Cantidad de nombres indexados."""
+        return len(self._nombres)
+
+    def _clave(self, nombre: str) -> str:
+        return clave_fonetica(nombre) if self.fonetico else plegar(nombre)
+
+    @staticmethod
+    def _claves_bloque(nombre: str) -> List[str]:
+        """Pares de palabras fonéticas del nombre (o su única palabra)."""
+        palabras = sorted(set(clave_fonetica(nombre).split()))
+        if len(palabras) < 2:
+            return palabras
+        return [f"{a} {b}" for a, b in combinations(palabras, 2)]
+
+    def agregar(self, nombre: str, identificador: Optional[Hashable] = None) -> None:
+        """
+        Agrega un nombre al índice.
+        
+        Args:
+            nombre (str): El nombre a indexar
+            identificador (Optional[Hashable]): Identificador devuelto en
+                las coincidencias; por defecto la posición de inserción
+        """
+        posicion = len(self._nombres)
+        self._identificadores.append(
+            posicion if identificador is None else identificador)
+        self._nombres.append(nombre)
+        ids_grama = self._ids_grama
+        listas = self._listas
+        for grama in trigramas(self._clave(nombre)):
+            id_grama = ids_grama.get(grama)
+            if id_grama is None:
+                id_grama = ids_grama[grama] = len(listas)
+                listas.append(array('I'))
+            listas[id_grama].append(posicion)
+            self._gramas.append(id_grama)
+        self._inicios.append(len(self._gramas))
+        if self.bloqueo == 'fonetico':
+            for clave in self._claves_bloque(nombre):
+                bloque = self._bloques.get(clave)
+                if bloque is None:
+                    bloque = self._bloques[clave] = array('I')
+                bloque.append(posicion)
+
+    def agregar_personas(self, personas: Iterable) -> None:
+        """
+        Agrega los nombres de varias personas.
+        
+        Args:
+            personas (Iterable): Personas, o pares (identificador, persona)
+                como los de PersonaRegistro; las personas sin nombre se omiten
+        """
+        for elemento in personas:
+            identificador, persona = (elemento if isinstance(elemento, tuple)
+                                      else (None, elemento))
+            if persona.nombre:
+                self.agregar(persona.nombre, identificador)
+
+    def buscar(self, nombre: str, umbral: float = 0.8, limite: int = 5,
+               excluir: Optional[int] = None) -> List[Coincidencia]:
+        """
+        Busca los nombres más parecidos al indicado.
+        
+        Args:
+            nombre (str): El nombre buscado
+            umbral (float): Similitud mínima (entre 0 y 1, sin incluir 0)
+            limite (int): Cantidad máxima de coincidencias
+            excluir (Optional[int]): Posición del índice que no se devuelve
+                (para buscar un nombre ya indexado sin encontrarse a sí mismo)
+                
+        Returns:
+            List[Coincidencia]: Las coincidencias de mayor a menor similitud
+            
+        Raises:
+            ValueError: Si el umbral está fuera de rango
+        """
+        return [Coincidencia(self._identificadores[p], self._nombres[p], s)
+                for p, s in self._buscar_posiciones(nombre, umbral, limite, excluir)]
+
+    def _buscar_posiciones(self, nombre: str, umbral: float, limite: int,
+                           excluir: Optional[int]) -> List[Tuple[int, float]]:
+        if not 0.0 < umbral <= 1.0:
+            raise ValueError("El umbral debe estar entre 0 (sin incluir) y 1.")
+        gramas = trigramas(self._clave(nombre))
+        tamano = len(gramas)
+        if not tamano:
+            return []
+        ids_grama = self._ids_grama
+        conocidos = [ids_grama[g] for g in gramas if g in ids_grama]
+        candidatos: Iterable[int]
+        if self.bloqueo == 'fonetico':
+            bloque: Set[int] = set()
+            for clave in self._claves_bloque(nombre):
+                bloque.update(self._bloques.get(clave, ()))
+            if excluir is not None:
+                bloque.discard(excluir)
+            candidatos = bloque
+        else:
+            candidatos = self._candidatos_prefijo(conocidos, tamano, umbral, excluir)
+
+        consulta = set(conocidos)
+        inicios = self._inicios
+        todos = self._gramas
+        menor = umbral * tamano / (2 - umbral)
+        mayor = tamano * (2 - umbral) / umbral
+        puntuados = []
+        for posicion in candidatos:
+            inicio, fin = inicios[posicion], inicios[posicion + 1]
+            otro = fin - inicio
+            if otro < menor or otro > mayor:
+                continue
+            comunes = len(consulta.intersection(todos[inicio:fin]))
+            similitud = 2 * comunes / (tamano + otro)
+            if similitud >= umbral:
+                puntuados.append((similitud, -posicion))
+        return [(-p, s) for s, p in heapq.nlargest(limite, puntuados)]
+
+    def _candidatos_prefijo(self, conocidos: List[int], tamano: int, umbral: float,
+                            excluir: Optional[int]) -> List[int]:
+        """Candidatos del filtrado por prefijo sobre las listas de trigramas."""
+        # Un nombre con similitud >= umbral comparte al menos `minimo`
+        # trigramas, y por lo tanto alguno de los tamano - minimo + 1 menos
+        # frecuentes (los trigramas desconocidos no tienen lista)
+        minimo = math.ceil(umbral * tamano / (2 - umbral) - 1e-9)
+        listas = self._listas
+        conocidos = sorted(conocidos, key=lambda id_grama: len(listas[id_grama]))
+        prefijo = len(conocidos) - minimo + 1
+        if prefijo <= 0:
+            return []
+        # Se cuentan también algunas listas más allá del prefijo (hasta
+        # duplicar el volumen recorrido): cada una sube en 1 las apariciones
+        # exigidas y descarta candidatos antes de compararlos
+        volumen = sum(len(listas[id_grama]) for id_grama in conocidos[:prefijo])
+        contadas = prefijo
+        limite_volumen = 2 * volumen
+        while (contadas < len(conocidos)
+               and volumen + len(listas[conocidos[contadas]]) <= limite_volumen):
+            volumen += len(listas[conocidos[contadas]])
+            contadas += 1
+        apariciones: 'Counter[int]' = Counter()
+        for id_grama in conocidos[:contadas]:
+            apariciones.update(listas[id_grama])
+        if excluir is not None:
+            apariciones.pop(excluir, None)
+        exigidas = contadas - prefijo + 1
+        return [posicion for posicion, cantidad in apariciones.items()
+                if cantidad >= exigidas]
+
+    def enlazar(self, umbral: float = 0.85,
+                limite: int = 5) -> Iterator[Tuple[Hashable, Hashable, float]]:
+        """
+        Busca los pares de nombres parecidos dentro del propio índice.
+        
+        Args:
+            umbral (float): Similitud mínima
+            limite (int): Cantidad máxima de pares por nombre
+            
+        Returns:
+            Iterator[Tuple[Hashable, Hashable, float]]: Pares
+            (identificador, identificador parecido, similitud), cada par
+            una sola vez
+        """
+        ids = self._identificadores
+        for posicion, nombre in enumerate(self._nombres):
+            similares = self._buscar_posiciones(nombre, umbral, limite, posicion)
+            for otra, similitud in similares:
+                if otra > posicion:
+                    yield ids[posicion], ids[otra], similitud
+
+    def __repr__(self) -> str:
+        """Representación técnica del índice."""
+        return (f"IndiceNombres(nombres={len(self)}, trigramas={len(self._listas)}, "
+                f"bloqueo='{self.bloqueo}')")
@@ -0,0 +1,218 @@
+"""
+Módulo de planificación adaptativa de la validación de registros completos.
+
+Cuando solo interesa saber si un registro es válido, no hace falta
+comprobar los campos en el orden de los setters: conviene empezar por los
+que más fallan y menos cuestan. PlanificadorValidacion mide, en una
+muestra de los registros, el costo y la tasa de fallos de cada campo y
+reordena las comprobaciones para rechazar los registros inválidos lo
+antes posible.
+
+Los campos se ordenan por costo / probabilidad de fallo de menor a mayor,
+el orden que minimiza el costo esperado de una cadena de comprobaciones
+que se corta en el primer fallo. Cada orden se compila con
+Esquema.compilar_veredicto en una sola función generada.
+
+Ejemplo:
+    >>> from jorge_choque_pg2_tecba.planificador import PlanificadorValidacion
+    >>> planificador = PlanificadorValidacion()
+    >>> validas = [fila for fila in filas if planificador.es_valido(fila)]
+    >>> planificador.plan
+    ('celular', 'email', 'documento_identidad', 'edad', 'direccion', 'nombre')
+"""
+
+import time
+from itertools import count
+from threading import Lock
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+from .esquema import ESQUEMA_PERSONA, Esquema
+
+
+class EstadisticaCampo(NamedTuple):
+    """Costo y fallos medidos de la comprobación de un campo."""
+
+    campo: str
+    evaluaciones: int
+    fallos: int
+    costo_ns: float
+
+    @property
+    def tasa_fallos(self) -> float:
+        """Proporción de evaluaciones que fallaron (0.0 a 1.0)."""
+        return self.fallos / self.evaluaciones if self.evaluaciones else 0.0
+
+    @property
+    def prioridad(self) -> float:
+        """
+        Costo por unidad de probabilidad de fallo; menor se comprueba antes.
+        
+        La probabilidad se suaviza con (fallos + 1) / (evaluaciones + 2)
+        para que un campo sin fallos observados no quede en cero.
+        """
+        return self.costo_ns * (self.evaluaciones + 2) / (self.fallos + 1)
+
+
+def _sobrecosto_reloj() -> int:
+    """Mide lo que cuesta leer el reloj dos veces, para descontarlo."""
+    reloj = time.perf_counter_ns
+    return min(-reloj() + reloj() for _ in range(1_000))
+
+
+class PlanificadorValidacion:
+    """
+    Valida registros completos con el orden de campos más barato.
+    
+    Uno de cada `muestreo` registros se evalúa campo por campo y sin
+    cortar, midiendo el tiempo de cada comprobación; así las tasas de
+    fallo no dependen del plan vigente. Los demás registros usan la
+    función compilada del plan, sin medir nada. Cada `replanificar_cada`
+    muestras se recalcula el orden.
+    
+    Es seguro usarlo desde varios hilos: qué registro se muestrea se
+    decide con itertools.count, sin bloquear; solo las muestras y el
+    recálculo del plan usan un Lock, y el plan se reemplaza en una sola
+    asignación.
+    """
+
+    def __init__(self, esquema: Esquema = ESQUEMA_PERSONA, muestreo: int = 64,
+                 replanificar_cada: int = 256) -> None:
+        """
+        Inicializa el planificador con el orden del esquema.
+        
+        Args:
+            esquema (Esquema): Esquema de los registros
+            muestreo (int): Se mide uno de cada `muestreo` registros
+            replanificar_cada (int): Muestras entre cada recálculo del plan
+            
+        Raises:
+            ValueError: Si muestreo o replanificar_cada no son positivos
+        """
+        if muestreo < 1 or replanificar_cada < 1:
+            raise ValueError(
+                "El muestreo y el intervalo de replanificación deben ser al menos 1.")
+        self.esquema = esquema
+        self.muestreo = muestreo
+        self.replanificar_cada = replanificar_cada
+        nombres = tuple(campo.nombre for campo in esquema.campos)
+        self._comprobaciones = tuple(
+            (nombre, esquema.compilar_veredicto([nombre])) for nombre in nombres)
+        self._candado = Lock()
+        self._sobrecosto = _sobrecosto_reloj()
+        self._llamadas = count(1)
+        self.reiniciar_estadisticas()
+        self._plan: Tuple[str, ...] = nombres
+        self._veredicto = esquema.compilar_veredicto(nombres)
+        self.replanificaciones = 0
+
+    @property
+    def plan(self) -> Tuple[str, ...]:
+        """Orden en que se comprueban los campos actualmente."""
+        return self._plan
+
+    def es_valido(self, datos: Dict) -> bool:
+        """
+        Indica si un registro es válido, cortando en el primer campo inválido.
+        
+        Equivale a validar_persona(datos).valido con el esquema por defecto.
+        
+        Args:
+            datos (Dict): Diccionario con los campos del registro
+            
+        Returns:
+            bool: True si todos los campos son válidos y están los obligatorios
+        """
+        if next(self._llamadas) % self.muestreo == 0:
+            return self._muestrear(datos)
+        return self._veredicto(datos)
+
+    def filtrar(self, filas: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Recorre solo las filas válidas.
+        
+        Args:
+            filas (Iterable[Dict]): Filas a revisar
+            
+        Returns:
+            Iterator[Dict]: Las filas válidas, sin modificar
+        """
+        es_valido = self.es_valido
+        for fila in filas:
+            if es_valido(fila):
+                yield fila
+
+    def _muestrear(self, datos: Dict) -> bool:
+        """Evalúa todos los campos midiendo cada uno y registra la muestra."""
+        reloj = time.perf_counter_ns
+        medidas = []
+        for _, comprobar in self._comprobaciones:
+            inicio = reloj()
+            valido = comprobar(datos)
+            medidas.append((reloj() - inicio, valido))
+        with self._candado:
+            for estadistica, (duracion, valido) in zip(self._acumulados, medidas):
+                estadistica[0] += 1
+                estadistica[1] += not valido
+                estadistica[2] += max(duracion - self._sobrecosto, 1)
+            self.muestras += 1
+            if self.muestras % self.replanificar_cada == 0:
+                self._replanificar()
+        return all(valido for _, valido in medidas)
+
+    def estadisticas(self) -> List[EstadisticaCampo]:
+        """
+        Obtiene las estadísticas de cada campo, en el orden del plan actual.
+        
+        Returns:
+            List[EstadisticaCampo]: Evaluaciones, fallos y costo medio por campo
+        """
+        with self._candado:
+            por_campo = {
+                nombre: EstadisticaCampo(
+                    nombre, evaluaciones, fallos,
+                    total_ns / evaluaciones if evaluaciones else 0.0)
+                for (nombre, _), (evaluaciones, fallos, total_ns)
+                in zip(self._comprobaciones, self._acumulados)
+            }
+        return [por_campo[nombre] for nombre in self._plan]
+
+    def replanificar(self) -> Tuple[str, ...]:
+        """
+        Recalcula el plan con las estadísticas actuales.
+        
+        Returns:
+            Tuple[str, ...]: El plan resultante
+        """
+        with self._candado:
+            self._replanificar()
+        return self._plan
+
+    def _replanificar(self) -> None:
+        """Ordena los campos por prioridad; se llama con el candado tomado."""
+        estadisticas = [
+            EstadisticaCampo(nombre, evaluaciones, fallos,
+                             total_ns / evaluaciones if evaluaciones else 0.0)
+            for (nombre, _), (evaluaciones, fallos, total_ns)
+            in zip(self._comprobaciones, self._acumulados)
+        ]
+        if not all(estadistica.evaluaciones for estadistica in estadisticas):
+            return
+        ordenadas = sorted(estadisticas,
+                           key=lambda estadistica: estadistica.prioridad)
+        plan = tuple(estadistica.campo for estadistica in ordenadas)
+        if plan != self._plan:
+            self._veredicto = self.esquema.compilar_veredicto(plan)
+            self._plan = plan
+            self.replanificaciones += 1
+
+    def reiniciar_estadisticas(self) -> None:
+        """Descarta las muestras acumuladas; el plan actual se mantiene."""
+        with self._candado:
+            # Por campo: [evaluaciones, fallos, nanosegundos acumulados]
+            self._acumulados = [[0, 0, 0] for _ in self._comprobaciones]
+            self.muestras = 0
+
+    def __repr__(self) -> str:
+        """Representación técnica del planificador."""
+        return (f"PlanificadorValidacion(plan={list(self._plan)}, "
+                f"muestras={self.muestras})")
@@ -0,0 +1,307 @@
+"""
+Módulo registro con un almacén de personas en memoria indexado.
+
+Este módulo contiene la clase PersonaRegistro, que mantiene índices hash
+sobre el documento, el email y el celular normalizados (con restricción
+de unicidad) y un índice ordenado sobre la edad para consultas por rango.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from .core import Persona
+from .validators import ValidadorDatosPersonales, ValidadorDatosContacto
+
+
+CAMPOS_UNICOS = ('documento_identidad', 'email', 'celular')
+
+
+class ErrorDuplicado(ValueError):
+    """Se lanza cuando una persona viola una restricción de unicidad."""
+
+
+def normalizar_documento(documento: Optional[str]) -> Optional[str]:
+    """Clave de índice del documento: sin espacios ni guiones."""
+    if not documento:
+        return None
+    return ValidadorDatosPersonales.normalizar_documento(documento)
+
+
+def normalizar_email(email: Optional[str]) -> Optional[str]:
+    """Clave de índice del email: en minúsculas y sin espacios en los extremos."""
+    if not email:
+        return None
+    return email.lower().strip()
+
+
+def normalizar_celular(celular: Optional[str]) -> Optional[str]:
+    """
+    Clave de índice del celular: su forma E.164, con o sin código de país.
+    
+    Si el número no corresponde a ningún plan conocido se usa sin
+    espacios, guiones, paréntesis ni '+'.
+    """
+    if not celular:
+        return None
+    return (ValidadorDatosContacto.normalizar_e164(celular)
+            or ValidadorDatosContacto.normalizar_celular(celular))
+
+
+def _claves(persona: Persona) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Obtiene las claves normalizadas de los campos únicos de una persona."""
+    return (
+        normalizar_documento(persona.documento_identidad),
+        normalizar_email(persona.email),
+        normalizar_celular(persona.celular),
+    )
+
+
+def _edad(persona: Persona) -> Optional[int]:
+    """
+    Obtiene la edad de una persona como entero para el índice ordenado.
+    
+    Raises:
+        ValueError: Si la edad no es un número entero
+    """
+    edad = persona.edad
+    if edad is None:
+        return None
+    try:
+        return int(edad)
+    except (TypeError, ValueError):
+        raise ValueError(f"Edad inválida para el registro: {edad!r}.") from None
+
+
+class PersonaRegistro:
+    """
+    Registro de personas en memoria con índices secundarios.
+    
+    Cada persona recibe un identificador entero. Las búsquedas por
+    documento, email o celular son O(1) y las consultas por rango de edad
+    usan bisect sobre las edades presentes. Las personas registradas no
+    deben modificarse directamente: para cambiarlas use
+    insertar_o_actualizar() con un objeto nuevo.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa un registro vacío."""
+        self._personas: Dict[int, Persona] = {}
+        self._claves: Dict[int, Tuple[Optional[str], ...]] = {}
+        self._indices: Tuple[Dict[str, int], ...] = tuple({} for _ in CAMPOS_UNICOS)
+        self._por_edad: Dict[int, Set[int]] = {}
+        self._edades: List[int] = []
+        self._siguiente_id = 0
+
+    def __len__(self) -> int:
+        """Cantidad de personas registradas."""
+        return len(self._personas)
+
+    def __iter__(self) -> Iterator[Persona]:
+        """Recorre las personas en orden de inserción."""
+        return iter(self._personas.values())
+
+    def __contains__(self, identificador: int) -> bool:
+        """Indica si existe una persona con ese identificador."""
+        return identificador in self._personas
+
+    def obtener(self, identificador: int) -> Persona:
+        """
+        Obtiene una persona por su identificador.
+        
+        Raises:
+            KeyError: Si el identificador no existe
+        """
+        return self._personas[identificador]
+
+    def agregar(self, persona: Persona) -> int:
+        """
+        Agrega una persona nueva al registro.
+        
+        Args:
+            persona (Persona): La persona a agregar
+            
+        Returns:
+            int: Identificador asignado a la persona
+            
+        Raises:
+            ErrorDuplicado: Si su documento, email o celular ya existen
+            ValueError: Si la edad no es un número entero
+        """
+        # Todo lo que puede fallar se comprueba antes de modificar el registro
+        claves = _claves(persona)
+        edad = _edad(persona)
+        self._verificar_unicidad(claves, None)
+        identificador = self._siguiente_id
+        self._siguiente_id += 1
+        self._personas[identificador] = persona
+        self._indexar(identificador, (None,) * len(CAMPOS_UNICOS), claves, None, edad)
+        return identificador
+
+    def actualizar(self, identificador: int, persona: Persona) -> None:
+        """
+        Reemplaza la persona de un identificador existente.
+        
+        Solo se modifican los índices de los campos cuyo valor cambió.
+        
+        Args:
+            identificador (int): Identificador de la persona a reemplazar
+            persona (Persona): Los nuevos datos
+            
+        Raises:
+            KeyError: Si el identificador no existe
+            ErrorDuplicado: Si los nuevos datos chocan con otra persona
+            ValueError: Si la edad no es un número entero
+        """
+        anterior = self._personas[identificador]
+        claves = _claves(persona)
+        edad = _edad(persona)
+        self._verificar_unicidad(claves, identificador)
+        self._personas[identificador] = persona
+        self._indexar(identificador, self._claves[identificador], claves,
+                      _edad(anterior), edad)
+
+    def insertar_o_actualizar(self, persona: Persona,
+                              campo: str = 'documento_identidad') -> int:
+        """
+        Inserta la persona o actualiza la existente con la misma clave.
+        
+        Args:
+            persona (Persona): La persona a guardar
+            campo (str): Campo único usado para identificarla
+            
+        Returns:
+            int: Identificador de la persona insertada o actualizada
+            
+        Raises:
+            ValueError: Si el campo no es único o la persona no lo tiene
+            ErrorDuplicado: Si otro campo único choca con otra persona
+            ValueError: Si la edad no es un número entero
+        """
+        posicion = self._posicion(campo)
+        clave = _claves(persona)[posicion]
+        if clave is None:
+            raise ValueError(f"La persona no tiene '{campo}' para identificarla.")
+        identificador = self._indices[posicion].get(clave)
+        if identificador is None:
+            return self.agregar(persona)
+        self.actualizar(identificador, persona)
+        return identificador
+
+    def eliminar(self, identificador: int) -> Persona:
+        """
+        Elimina una persona del registro.
+        
+        Returns:
+            Persona: La persona eliminada
+            
+        Raises:
+            KeyError: Si el identificador no existe
+        """
+        persona = self._personas.pop(identificador)
+        self._indexar(identificador, self._claves.pop(identificador),
+                      (None,) * len(CAMPOS_UNICOS), _edad(persona), None)
+        return persona
+
+    def buscar(self, campo: str, valor: str) -> Optional[Persona]:
+        """
+        Busca una persona por un campo único.
+        
+        El valor se normaliza igual que en los validadores, por lo que
+        '+591 7123-4567', '5917123 4567' y '71234567' encuentran a la misma persona.
+        
+        Args:
+            campo (str): 'documento_identidad', 'email' o 'celular'
+            valor (str): Valor buscado
+            
+        Returns:
+            Optional[Persona]: La persona encontrada o None
+        """
+        posicion = self._posicion(campo)
+        normalizadores = (normalizar_documento, normalizar_email, normalizar_celular)
+        clave = normalizadores[posicion](valor)
+        identificador = None if clave is None else self._indices[posicion].get(clave)
+        return None if identificador is None else self._personas[identificador]
+
+    def buscar_por_documento(self, documento: str) -> Optional[Persona]:
+        """Busca una persona por su documento de identidad."""
+        return self.buscar('documento_identidad', documento)
+
+    def buscar_por_email(self, email: str) -> Optional[Persona]:
+        """Busca una persona por su email."""
+        return self.buscar('email', email)
+
+    def buscar_por_celular(self, celular: str) -> Optional[Persona]:
+        """Busca una persona por su celular."""
+        return self.buscar('celular', celular)
+
+    def rango_edad(self, minima: int, maxima: int) -> Iterator[Persona]:
+        """
+        Recorre las personas con edad entre minima y maxima (inclusive).
+        
+        Args:
+            minima (int): Edad mínima
+            maxima (int): Edad máxima
+            
+        Returns:
+            Iterator[Persona]: Las personas en orden creciente de edad
+        """
+        edades = self._edades
+        inicio = bisect_left(edades, minima)
+        fin = bisect_right(edades, maxima)
+        for edad in edades[inicio:fin]:
+            for identificador in self._por_edad[edad]:
+                yield self._personas[identificador]
+
+    def _posicion(self, campo: str) -> int:
+        """Obtiene la posición de un campo único en los índices."""
+        try:
+            return CAMPOS_UNICOS.index(campo)
+        except ValueError:
+            raise ValueError(
+                f"Campo inválido: '{campo}'. Debe ser uno de {CAMPOS_UNICOS}."
+            ) from None
+
+    def _verificar_unicidad(self, claves: Tuple[Optional[str], ...],
+                            identificador: Optional[int]) -> None:
+        """Comprueba que ninguna clave pertenezca a otra persona."""
+        for campo, indice, clave in zip(CAMPOS_UNICOS, self._indices, claves):
+            if clave is None:
+                continue
+            existente = indice.get(clave)
+            if existente is not None and existente != identificador:
+                raise ErrorDuplicado(
+                    f"Ya existe una persona con {campo} '{clave}' (id {existente})."
+                )
+
+    def _indexar(self, identificador: int, anteriores: Tuple[Optional[str], ...],
+                 nuevas: Tuple[Optional[str], ...], edad_anterior: Optional[int],
+                 edad_nueva: Optional[int]) -> None:
+        """Actualiza solo los índices cuyas claves cambiaron."""
+        for indice, anterior, nueva in zip(self._indices, anteriores, nuevas):
+            if anterior == nueva:
+                continue
+            if anterior is not None:
+                del indice[anterior]
+            if nueva is not None:
+                indice[nueva] = identificador
+        if identificador in self._personas:
+            self._claves[identificador] = nuevas
+
+        if edad_anterior == edad_nueva:
+            return
+        if edad_anterior is not None:
+            grupo = self._por_edad[edad_anterior]
+            grupo.discard(identificador)
+            if not grupo:
+                del self._por_edad[edad_anterior]
+                del self._edades[bisect_left(self._edades, edad_anterior)]
+        if edad_nueva is not None:
+            nuevo_grupo = self._por_edad.get(edad_nueva)
+            if nuevo_grupo is None:
+                nuevo_grupo = self._por_edad[edad_nueva] = set()
+                insort(self._edades, edad_nueva)
+            nuevo_grupo.add(identificador)
+
+    def __repr__(self) -> str:
+        """Representación técnica del registro."""
+        return f"PersonaRegistro(personas={len(self)})"
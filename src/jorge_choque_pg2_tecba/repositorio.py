@@ -0,0 +1,359 @@
+"""
+Módulo de persistencia de personas validadas en SQLite.
+
+RepositorioPersonas guarda personas ya construidas en una base SQLite
+local. Las escrituras se agrupan en lotes: cada lote es una transacción
+explícita con un solo executemany, de modo que cargar millones de filas
+no paga una transacción (ni un fsync) por persona. Las sentencias son
+constantes y el módulo sqlite3 las prepara una vez y las reutiliza.
+
+La base usa WAL: las lecturas no bloquean la escritura ni entre sí. Las
+consultas se hacen desde un pool de conexiones de solo lectura, así que
+varios hilos pueden leer mientras otro escribe. Los recorridos completos
+usan una conexión propia, fuera del pool, y entregan las filas por
+lotes con fetchmany, sin cargar el resultado completo en memoria, como
+Persona o como PersonaTabla.
+
+Los campos únicos se indexan normalizados, como en registro: el
+documento sin espacios ni guiones (con restricción de unicidad), el
+email en minúsculas y el celular con registro.normalizar_celular: en
+formato E.164 (+591...) si corresponde a un plan conocido y, si no, sin
+separadores.
+
+Ejemplo:
+    >>> from jorge_choque_pg2_tecba.repositorio import RepositorioPersonas
+    >>> with RepositorioPersonas("personas.sqlite") as repositorio:
+    ...     repositorio.insertar(personas)
+    ...     repositorio.guardar(actualizadas)   # inserta o actualiza por documento
+    ...     persona = repositorio.buscar_por_documento("1234567")
+    ...     for tabla in repositorio.iterar_lotes(50_000):
+    ...         procesar(tabla.columna("email"))
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from itertools import islice
+from operator import attrgetter
+from queue import Empty, LifoQueue
+from threading import Lock
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from .core import Persona, PersonaInmutable, PersonaTabla
+from .registro import (
+    ErrorDuplicado,
+    normalizar_celular,
+    normalizar_documento,
+    normalizar_email,
+)
+
+
+CAMPOS = PersonaTabla.COLUMNAS
+
+_ESQUEMA = (
+    'CREATE TABLE IF NOT EXISTS personas ('
+    ' id INTEGER PRIMARY KEY,'
+    ' nombre TEXT NOT NULL,'
+    ' edad INTEGER,'
+    ' documento_identidad TEXT,'
+    ' email TEXT,'
+    ' celular TEXT,'
+    ' direccion TEXT,'
+    ' clave_documento TEXT,'
+    ' clave_email TEXT,'
+    ' clave_celular TEXT)',
+    'CREATE UNIQUE INDEX IF NOT EXISTS personas_documento'
+    ' ON personas (clave_documento)',
+    'CREATE INDEX IF NOT EXISTS personas_email ON personas (clave_email)',
+    'CREATE INDEX IF NOT EXISTS personas_celular ON personas (clave_celular)',
+)
+
+_COLUMNAS = ', '.join(CAMPOS)
+_INSERTAR = (f'INSERT INTO personas ({_COLUMNAS},'
+             ' clave_documento, clave_email, clave_celular) '
+             f'VALUES ({", ".join("?" * (len(CAMPOS) + 3))})')
+_GUARDAR = (_INSERTAR + ' ON CONFLICT (clave_documento) DO UPDATE SET '
+            + ', '.join(f'{columna} = excluded.{columna}' for columna in
+                        CAMPOS + ('clave_email', 'clave_celular')))
+_SELECCIONAR = f'SELECT {_COLUMNAS} FROM personas'
+
+_valores = attrgetter(*CAMPOS)
+
+PersonaGuardable = Union[Persona, PersonaInmutable]
+
+
+def _fila(persona: PersonaGuardable) -> Tuple:
+    """Valores de una persona para _INSERTAR, con las claves normalizadas."""
+    nombre, edad, documento, email, celular, direccion = _valores(persona)
+    return (nombre, None if edad is None else int(edad), documento, email,
+            celular, direccion,
+            normalizar_documento(documento), normalizar_email(email),
+            normalizar_celular(celular))
+
+
+def _persona(fila: Tuple) -> Persona:
+    """Crea una Persona desde una fila guardada, sin volver a validarla."""
+    persona = Persona.__new__(Persona)
+    (persona._nombre, persona._edad, persona._documento_identidad,
+     persona._email, persona._celular, persona._direccion) = fila
+    return persona
+
+
+class RepositorioPersonas:
+    """
+    Repositorio de personas en un archivo SQLite.
+    
+    Una sola conexión escribe (protegida por un Lock) y hasta `lectores`
+    conexiones de solo lectura atienden las consultas. Cada recorrido
+    abre su propia conexión, de modo que un recorrido en curso no ocupa
+    el pool y pueden hacerse consultas mientras tanto; todos los métodos
+    pueden llamarse desde varios hilos. Las personas leídas se crean sin
+    volver a validarlas, así que la base solo debe escribirse con este
+    repositorio.
+    """
+
+    def __init__(self, ruta: str, lectores: int = 4, tamano_lote: int = 10_000):
+        """
+        Abre (o crea) la base de datos.
+        
+        Args:
+            ruta (str): Ruta del archivo SQLite (no se admite ':memory:')
+            lectores (int): Máximo de conexiones de lectura abiertas para
+                las consultas (los recorridos no cuentan)
+            tamano_lote (int): Filas por transacción al escribir y por
+                lote al leer
+                
+        Raises:
+            ValueError: Si lectores o tamano_lote no son positivos, o si
+                la ruta es ':memory:'
+        """
+        if lectores < 1 or tamano_lote < 1:
+            raise ValueError(
+                "La cantidad de lectores y el tamaño de lote deben ser al menos 1.")
+        if ruta == ':memory:':
+            raise ValueError("El repositorio necesita un archivo: las conexiones de "
+                             "lectura no comparten una base ':memory:'.")
+        self.ruta = ruta
+        self.tamano_lote = tamano_lote
+        self.lectores = lectores
+        # isolation_level=None: las transacciones se abren y cierran
+        # explícitamente
+        self._escritor = sqlite3.connect(ruta, isolation_level=None,
+                                         check_same_thread=False)
+        self._escritor.execute('PRAGMA journal_mode=WAL')
+        self._escritor.execute('PRAGMA synchronous=NORMAL')
+        for sentencia in _ESQUEMA:
+            self._escritor.execute(sentencia)
+        self._candado = Lock()
+        self._libres: LifoQueue = LifoQueue()
+        self._abiertos = 0
+        self._candado_lectores = Lock()
+        self._conexiones: List[sqlite3.Connection] = []
+
+    def insertar(self, personas: Iterable[PersonaGuardable]) -> int:
+        """
+        Inserta personas nuevas, tamano_lote filas por transacción.
+        
+        Args:
+            personas (Iterable[PersonaGuardable]): Personas ya construidas
+            
+        Returns:
+            int: Cantidad de personas insertadas
+            
+        Raises:
+            ErrorDuplicado: Si un documento ya existe; el lote que lo
+                contiene se deshace y los lotes anteriores quedan guardados
+            sqlite3.IntegrityError: Si se viola otra restricción (por
+                ejemplo, una persona sin nombre)
+        """
+        try:
+            return self._escribir(_INSERTAR, personas)
+        except sqlite3.IntegrityError as error:
+            if 'UNIQUE constraint failed' not in str(error):
+                raise
+            raise ErrorDuplicado(
+                "Ya existe una persona con ese documento_identidad "
+                f"({error}).") from error
+
+    def guardar(self, personas: Iterable[PersonaGuardable]) -> int:
+        """
+        Inserta o actualiza personas por documento, tamano_lote por transacción.
+        
+        Las personas sin documento siempre se insertan.
+        
+        Args:
+            personas (Iterable[PersonaGuardable]): Personas ya construidas
+            
+        Returns:
+            int: Cantidad de personas escritas
+        """
+        return self._escribir(_GUARDAR, personas)
+
+    def _escribir(self, sentencia: str, personas: Iterable[PersonaGuardable]) -> int:
+        """Ejecuta la sentencia por lotes, cada uno en su transacción."""
+        filas = map(_fila, personas)
+        total = 0
+        with self._candado:
+            while True:
+                lote = list(islice(filas, self.tamano_lote))
+                if not lote:
+                    return total
+                self._escritor.execute('BEGIN IMMEDIATE')
+                try:
+                    self._escritor.executemany(sentencia, lote)
+                except BaseException:
+                    self._escritor.execute('ROLLBACK')
+                    raise
+                self._escritor.execute('COMMIT')
+                total += len(lote)
+
+    def eliminar(self, documento: str) -> bool:
+        """
+        Elimina la persona con un documento.
+        
+        Args:
+            documento (str): Documento, con o sin espacios y guiones
+            
+        Returns:
+            bool: True si existía
+        """
+        with self._candado:
+            cursor = self._escritor.execute(
+                'DELETE FROM personas WHERE clave_documento = ?',
+                (normalizar_documento(documento),))
+        return cursor.rowcount > 0
+
+    @contextmanager
+    def _lector(self) -> Iterator[sqlite3.Connection]:
+        """Toma una conexión de lectura del pool y la devuelve al terminar."""
+        try:
+            conexion = self._libres.get_nowait()
+        except Empty:
+            with self._candado_lectores:
+                abrir = self._abiertos < self.lectores
+                if abrir:
+                    self._abiertos += 1
+            if abrir:
+                conexion = self._abrir_lector()
+            else:
+                conexion = self._libres.get()
+        try:
+            yield conexion
+        finally:
+            self._libres.put(conexion)
+
+    def __len__(self) -> int:
+        """Cantidad de personas guardadas."""
+        with self._lector() as conexion:
+            cantidad: int = conexion.execute(
+                'SELECT count(*) FROM personas').fetchone()[0]
+            return cantidad
+
+    def _buscar(self, columna: str, clave: Optional[str]) -> List[Persona]:
+        """Personas cuya clave normalizada coincide."""
+        if clave is None:
+            return []
+        with self._lector() as conexion:
+            filas = conexion.execute(f'{_SELECCIONAR} WHERE {columna} = ? ORDER BY id',
+                                     (clave,)).fetchall()
+        return [_persona(fila) for fila in filas]
+
+    def buscar_por_documento(self, documento: str) -> Optional[Persona]:
+        """
+        Busca una persona por documento (sin importar espacios ni guiones).
+        
+        Returns:
+            Optional[Persona]: La persona, o None si no existe
+        """
+        encontradas = self._buscar('clave_documento', normalizar_documento(documento))
+        return encontradas[0] if encontradas else None
+
+    def buscar_por_email(self, email: str) -> List[Persona]:
+        """Busca las personas con un email (sin importar mayúsculas)."""
+        return self._buscar('clave_email', normalizar_email(email))
+
+    def buscar_por_celular(self, celular: str) -> List[Persona]:
+        """Busca las personas con un celular (sin importar separadores)."""
+        return self._buscar('clave_celular', normalizar_celular(celular))
+
+    def _abrir_lector(self) -> sqlite3.Connection:
+        """Abre una conexión de solo lectura y la registra para cerrar()."""
+        conexion = sqlite3.connect(f'file:{self.ruta}?mode=ro', uri=True,
+                                   check_same_thread=False)
+        with self._candado_lectores:
+            self._conexiones.append(conexion)
+        return conexion
+
+    def _filas(self, tamano_lote: Optional[int]) -> Iterator[List[Tuple]]:
+        """
+        Recorre la tabla por lotes con una conexión de lectura propia.
+        
+        La conexión no se toma del pool: el recorrido la retiene mientras
+        no se agote, y quien lo consume puede hacer consultas entretanto.
+        """
+        tamano = tamano_lote or self.tamano_lote
+        conexion = self._abrir_lector()
+        try:
+            cursor = conexion.execute(f'{_SELECCIONAR} ORDER BY id')
+            while True:
+                lote = cursor.fetchmany(tamano)
+                if not lote:
+                    return
+                yield lote
+        finally:
+            with self._candado_lectores:
+                if conexion in self._conexiones:
+                    self._conexiones.remove(conexion)
+            conexion.close()
+
+    def iterar(self, tamano_lote: Optional[int] = None) -> Iterator[Persona]:
+        """
+        Recorre todas las personas en orden de inserción.
+        
+        Se leen tamano_lote filas a la vez; el recorrido ve la base como
+        estaba al empezar, aunque otro hilo escriba mientras tanto.
+        
+        Args:
+            tamano_lote (Optional[int]): Filas por lectura; por defecto
+                el del repositorio
+                
+        Returns:
+            Iterator[Persona]: Personas creadas sin volver a validarlas
+        """
+        for lote in self._filas(tamano_lote):
+            yield from map(_persona, lote)
+
+    def iterar_lotes(self, tamano_lote: Optional[int] = None) -> Iterator[PersonaTabla]:
+        """
+        Recorre todas las personas como tablas columnares.
+        
+        Args:
+            tamano_lote (Optional[int]): Filas por tabla; por defecto
+                el del repositorio
+                
+        Returns:
+            Iterator[PersonaTabla]: Una tabla por lote, sin crear objetos Persona
+        """
+        for lote in self._filas(tamano_lote):
+            tabla = PersonaTabla()
+            for campo, valores in zip(CAMPOS, zip(*lote)):
+                tabla._columnas[campo].extender(list(valores))
+            yield tabla
+
+    def cerrar(self) -> None:
+        """Cierra la conexión de escritura y las de lectura."""
+        with self._candado:
+            self._escritor.close()
+        with self._candado_lectores:
+            for conexion in self._conexiones:
+                conexion.close()
+            self._conexiones.clear()
+
+    def __enter__(self) -> 'RepositorioPersonas':
+        return self
+
+    def __exit__(self, *excepcion: object) -> None:
+        self.cerrar()
+
+    def __repr__(self) -> str:
+        """Representación técnica del repositorio."""
+        return f"RepositorioPersonas(ruta={self.ruta!r}, lectores={self.lectores})"
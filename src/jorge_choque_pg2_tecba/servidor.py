@@ -0,0 +1,476 @@
+"""
+Módulo servidor HTTP/JSON local de validación de personas, con asyncio.
+
+El servidor expone las reglas de Persona para que varios servicios usen
+una sola instancia en lugar de una copia de la librería cada uno. Las
+peticiones concurrentes se agrupan en micro-lotes (hasta un tamaño máximo
+o un tiempo de espera) que se validan en un pool de procesos o hilos.
+Cuando la cola de registros pendientes está llena el servidor responde
+503 de inmediato en lugar de acumular trabajo.
+
+Solo usa la biblioteca estándar. Endpoints:
+    POST /validar   Un objeto JSON o una lista de objetos con los campos
+                    de Persona; responde un resultado por objeto
+    GET  /salud     Estado y estadísticas del servidor
+
+Uso desde la línea de comandos:
+    python -m jorge_choque_pg2_tecba.servidor --puerto 8080 \\
+        --lote-maximo 256 --espera-ms 2 --trabajadores 4
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .esquema import validar_persona
+
+
+MENSAJES_HTTP = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+    500: 'Internal Server Error',
+    503: 'Service Unavailable',
+}
+
+_FIN_CABECERAS = b'\r\n\r\n'
+_LONGITUD_MAXIMA_CABECERAS = 16 * 1024
+
+
+def validar_lote(registros: List[Dict]) -> List[Dict]:
+    """
+    Valida un lote de registros. Se ejecuta dentro del pool de trabajadores.
+    
+    Args:
+        registros (List[Dict]): Diccionarios con los campos de Persona
+        
+    Returns:
+        List[Dict]: Por registro: 'valido', 'codigos', 'mensajes' y
+        'persona' (los datos normalizados, o None si no es válido)
+    """
+    respuestas = []
+    for registro in registros:
+        if not isinstance(registro, dict):
+            respuestas.append({'valido': False, 'codigos': ['registro_invalido'],
+                               'mensajes': ['Cada registro debe ser un objeto JSON.'],
+                               'persona': None})
+            continue
+        resultado = validar_persona(registro)
+        respuestas.append({
+            'valido': resultado.valido,
+            'codigos': list(resultado.codigos),
+            'mensajes': list(resultado.mensajes),
+            'persona': (resultado.persona.obtener_todos_los_datos()
+                        if resultado.persona is not None else None),
+        })
+    return respuestas
+
+
+class ColaLlena(Exception):
+    """Se lanza cuando no hay lugar en la cola para los registros recibidos."""
+
+
+class AgrupadorLotes:
+    """
+    Agrupa registros de peticiones concurrentes en micro-lotes.
+    
+    Un lote se envía al pool cuando junta lote_maximo registros o cuando
+    pasan espera segundos desde su primer registro. Como máximo hay
+    lotes_en_vuelo lotes procesándose a la vez; mientras tanto los
+    registros esperan en una cola acotada.
+    """
+
+    def __init__(self, ejecutor: Executor, lote_maximo: int = 256,
+                 espera: float = 0.002, capacidad_cola: int = 10_000,
+                 lotes_en_vuelo: int = 8):
+        """
+        Inicializa el agrupador.
+        
+        Args:
+            ejecutor (Executor): Pool donde se ejecuta validar_lote
+            lote_maximo (int): Cantidad máxima de registros por lote
+            espera (float): Segundos que se espera a completar un lote
+            capacidad_cola (int): Registros pendientes como máximo
+            lotes_en_vuelo (int): Lotes procesándose a la vez como máximo
+            
+        Raises:
+            ValueError: Si algún límite no es positivo
+        """
+        if lote_maximo < 1 or capacidad_cola < 1 or lotes_en_vuelo < 1:
+            raise ValueError("Los límites del agrupador deben ser al menos 1.")
+        if espera < 0:
+            raise ValueError("La espera no puede ser negativa.")
+        self._ejecutor = ejecutor
+        self.lote_maximo = lote_maximo
+        self.espera = espera
+        self.capacidad_cola = capacidad_cola
+        self._cola: 'asyncio.Queue[Tuple[Dict, asyncio.Future]]' = asyncio.Queue(
+            capacidad_cola)
+        self._en_vuelo = asyncio.Semaphore(lotes_en_vuelo)
+        self._tarea: Optional[asyncio.Task] = None
+        self.lotes = 0
+        self.registros = 0
+        self.rechazos = 0
+
+    def iniciar(self) -> None:
+        """Arranca la tarea que arma y envía los lotes."""
+        if self._tarea is None:
+            self._tarea = asyncio.ensure_future(self._despachar())
+
+    async def detener(self) -> None:
+        """Detiene la tarea de despacho."""
+        if self._tarea is not None:
+            self._tarea.cancel()
+            try:
+                await self._tarea
+            except asyncio.CancelledError:
+                pass
+            self._tarea = None
+
+    async def validar(self, registros: List[Dict]) -> List[Dict]:
+        """
+        Encola los registros y espera sus resultados.
+        
+        Raises:
+            ColaLlena: Si la cola no tiene lugar para todos los registros
+        """
+        cola = self._cola
+        if cola.maxsize - cola.qsize() < len(registros):
+            self.rechazos += 1
+            raise ColaLlena()
+        loop = asyncio.get_event_loop()
+        futuros = []
+        for registro in registros:
+            futuro = loop.create_future()
+            cola.put_nowait((registro, futuro))
+            futuros.append(futuro)
+        return list(await asyncio.gather(*futuros))
+
+    async def _despachar(self) -> None:
+        """Arma los lotes con lo que haya en la cola y los envía al pool."""
+        cola = self._cola
+        while True:
+            lote = [await cola.get()]
+            # Si el lote no está completo se espera una vez a que lleguen más
+            if self.espera and cola.qsize() < self.lote_maximo - 1:
+                await asyncio.sleep(self.espera)
+            while len(lote) < self.lote_maximo and not cola.empty():
+                lote.append(cola.get_nowait())
+            await self._en_vuelo.acquire()
+            asyncio.ensure_future(self._procesar(lote))
+
+    async def _procesar(self, lote: List[Tuple[Dict, asyncio.Future]]) -> None:
+        """Valida un lote en el pool y entrega cada resultado a su petición."""
+        try:
+            loop = asyncio.get_event_loop()
+            registros = [registro for registro, _ in lote]
+            try:
+                resultados = await loop.run_in_executor(self._ejecutor, validar_lote,
+                                                        registros)
+            except Exception as error:  # el error se entrega a cada petición del lote
+                for _, futuro in lote:
+                    if not futuro.done():
+                        futuro.set_exception(error)
+                return
+            self.lotes += 1
+            self.registros += len(lote)
+            for (_, futuro), resultado in zip(lote, resultados):
+                if not futuro.done():
+                    futuro.set_result(resultado)
+        finally:
+            self._en_vuelo.release()
+
+    def estadisticas(self) -> Dict:
+        """Lotes y registros procesados, peticiones rechazadas y cola actual."""
+        return {
+            'lotes': self.lotes,
+            'registros': self.registros,
+            'registros_por_lote': self.registros / self.lotes if self.lotes else 0.0,
+            'rechazos': self.rechazos,
+            'en_cola': self._cola.qsize(),
+            'capacidad_cola': self.capacidad_cola,
+        }
+
+
+class ServidorValidacion:
+    """
+    Servidor HTTP/1.1 mínimo (con keep-alive) sobre asyncio.
+    
+    Ejemplo:
+        >>> servidor = ServidorValidacion(puerto=8080, trabajadores=4)
+        >>> asyncio.run(servidor.servir())
+    """
+
+    def __init__(self, host: str = '127.0.0.1', puerto: int = 8080,
+                 lote_maximo: int = 256, espera: float = 0.002,
+                 capacidad_cola: int = 10_000, trabajadores: Optional[int] = None,
+                 hilos: bool = False, tamano_maximo_cuerpo: int = 1024 * 1024):
+        """
+        Inicializa el servidor.
+        
+        Args:
+            host (str): Dirección donde escuchar
+            puerto (int): Puerto donde escuchar (0 elige uno libre)
+            lote_maximo (int): Registros por micro-lote como máximo
+            espera (float): Segundos que se espera a completar un micro-lote
+            capacidad_cola (int): Registros pendientes antes de responder 503
+            trabajadores (Optional[int]): Tamaño del pool; por defecto os.cpu_count()
+            hilos (bool): Usar un pool de hilos en lugar de procesos
+            tamano_maximo_cuerpo (int): Bytes máximos del cuerpo de una petición
+        """
+        self.host = host
+        self.puerto = puerto
+        self.lote_maximo = lote_maximo
+        self.espera = espera
+        self.capacidad_cola = capacidad_cola
+        self.trabajadores = trabajadores or os.cpu_count() or 1
+        self.hilos = hilos
+        self.tamano_maximo_cuerpo = tamano_maximo_cuerpo
+        self._agrupador: Optional[AgrupadorLotes] = None
+        self._servidor: Optional[asyncio.AbstractServer] = None
+        self._ejecutor: Optional[Executor] = None
+
+    async def iniciar(self) -> None:
+        """Crea el pool y empieza a aceptar conexiones."""
+        clase = ThreadPoolExecutor if self.hilos else ProcessPoolExecutor
+        self._ejecutor = clase(max_workers=self.trabajadores)
+        # Los procesos se crean antes de abrir el socket para que no lo hereden
+        loop = asyncio.get_event_loop()
+        await asyncio.gather(*(loop.run_in_executor(self._ejecutor, validar_lote, [])
+                               for _ in range(self.trabajadores)))
+        self._agrupador = AgrupadorLotes(self._ejecutor, self.lote_maximo, self.espera,
+                                         self.capacidad_cola, 2 * self.trabajadores)
+        self._agrupador.iniciar()
+        self._servidor = await asyncio.start_server(
+            self._atender, self.host, self.puerto, limit=_LONGITUD_MAXIMA_CABECERAS)
+        self.puerto = self._servidor.sockets[0].getsockname()[1]
+
+    async def detener(self) -> None:
+        """Deja de aceptar conexiones y libera el pool."""
+        if self._servidor is not None:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+        if self._agrupador is not None:
+            await self._agrupador.detener()
+        if self._ejecutor is not None:
+            self._ejecutor.shutdown(wait=True)
+
+    async def servir(self) -> None:
+        """Inicia el servidor y atiende peticiones hasta que se cancele."""
+        await self.iniciar()
+        await self.esperar()
+
+    async def esperar(self) -> None:
+        """
+        Atiende peticiones de un servidor ya iniciado hasta que se cancele.
+        
+        Raises:
+            RuntimeError: Si el servidor no se inició con iniciar()
+        """
+        if self._servidor is None:
+            raise RuntimeError("El servidor no está iniciado.")
+        try:
+            await self._servidor.serve_forever()
+        finally:
+            await self.detener()
+
+    async def _atender(self, lector: asyncio.StreamReader,
+                       escritor: asyncio.StreamWriter) -> None:
+        """Atiende las peticiones de una conexión hasta que se cierre."""
+        try:
+            while True:
+                try:
+                    cabecera = await lector.readuntil(_FIN_CABECERAS)
+                except asyncio.IncompleteReadError:
+                    return
+                except asyncio.LimitOverrunError:
+                    await self._responder(
+                        escritor, 413, {'error': 'Cabeceras demasiado grandes.'},
+                        cerrar=True)
+                    return
+                try:
+                    metodo, ruta, cabeceras = self._leer_cabecera(cabecera)
+                    longitud = self._longitud_cuerpo(cabeceras)
+                except ValueError as error:
+                    # Sin una cabecera válida no se sabe dónde termina la petición
+                    await self._responder(escritor, 400, {'error': str(error)},
+                                          cerrar=True)
+                    return
+                if longitud > self.tamano_maximo_cuerpo:
+                    await self._responder(
+                        escritor, 413, {'error': 'Cuerpo demasiado grande.'},
+                        cerrar=True)
+                    return
+                cuerpo = await lector.readexactly(longitud) if longitud else b''
+                cerrar = cabeceras.get('connection', '').lower() == 'close'
+                estado, respuesta = await self._despachar(metodo, ruta, cuerpo)
+                await self._responder(escritor, estado, respuesta, cerrar)
+                if cerrar:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            return
+        finally:
+            escritor.close()
+
+    @staticmethod
+    def _leer_cabecera(cabecera: bytes) -> Tuple[str, str, Dict[str, str]]:
+        """
+        Obtiene el método, la ruta sin la query string y las cabeceras.
+        
+        Raises:
+            ValueError: Si la línea de petición no es 'MÉTODO RUTA HTTP/x'
+        """
+        lineas = cabecera.decode('latin-1').split('\r\n')
+        partes = lineas[0].split(' ')
+        if len(partes) != 3 or not partes[0] or not partes[2].startswith('HTTP/'):
+            raise ValueError(f"Línea de petición inválida: {lineas[0][:100]!r}.")
+        metodo, ruta, _ = partes
+        ruta = urlsplit(ruta).path
+        cabeceras = {}
+        for linea in lineas[1:]:
+            nombre, separador, valor = linea.partition(':')
+            if separador:
+                cabeceras[nombre.strip().lower()] = valor.strip()
+        return metodo, ruta, cabeceras
+
+    @staticmethod
+    def _longitud_cuerpo(cabeceras: Dict[str, str]) -> int:
+        """
+        Obtiene la longitud del cuerpo de la cabecera Content-Length.
+        
+        Raises:
+            ValueError: Si no es un entero no negativo
+        """
+        valor = cabeceras.get('content-length', '') or '0'
+        try:
+            longitud = int(valor)
+        except ValueError:
+            longitud = -1
+        if longitud < 0:
+            raise ValueError(f"Content-Length inválido: {valor[:20]!r}.")
+        return longitud
+
+    async def _despachar(self, metodo: str, ruta: str,
+                         cuerpo: bytes) -> Tuple[int, object]:
+        """Ejecuta el endpoint que corresponde a la petición."""
+        agrupador = self._agrupador
+        if agrupador is None:
+            raise RuntimeError("El servidor no está iniciado.")
+        if ruta == '/salud':
+            if metodo != 'GET':
+                return 405, {'error': 'Use GET.'}
+            return 200, {'estado': 'ok', **agrupador.estadisticas()}
+        if ruta != '/validar':
+            return 404, {'error': f"Ruta desconocida: '{ruta}'."}
+        if metodo != 'POST':
+            return 405, {'error': 'Use POST.'}
+        try:
+            datos = json.loads(cuerpo)
+        except (ValueError, RecursionError):
+            # RecursionError: arreglos u objetos anidados a demasiada profundidad
+            return 400, {'error': 'El cuerpo debe ser JSON válido.'}
+        unico = not isinstance(datos, list)
+        registros = [datos] if unico else datos
+        if len(registros) > self.capacidad_cola:
+            # Nunca cabrían en la cola: reintentar (503) no serviría
+            return 413, {'error': f"Demasiados registros: {len(registros)}. "
+                                  f"El máximo por petición es {self.capacidad_cola}."}
+        try:
+            resultados = await agrupador.validar(registros)
+        except ColaLlena:
+            return 503, {'error': 'Servidor saturado, reintente más tarde.'}
+        except Exception as error:  # p. ej. un proceso del pool terminó
+            return 500, {'error': f"Error al validar: {error}"}
+        return 200, resultados[0] if unico else resultados
+
+    @staticmethod
+    async def _responder(escritor: asyncio.StreamWriter, estado: int, datos: object,
+                         cerrar: bool = False) -> None:
+        """Escribe una respuesta JSON."""
+        cuerpo = json.dumps(datos, ensure_ascii=False).encode('utf-8')
+        cabeceras = [
+            f"HTTP/1.1 {estado} {MENSAJES_HTTP[estado]}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(cuerpo)}",
+        ]
+        if estado == 503:
+            cabeceras.append("Retry-After: 1")
+        if cerrar:
+            cabeceras.append("Connection: close")
+        escritor.write(('\r\n'.join(cabeceras) + '\r\n\r\n').encode('latin-1') + cuerpo)
+        await escritor.drain()
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    """Crea el parser de argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(
+        prog='python -m jorge_choque_pg2_tecba.servidor',
+        description='Servidor HTTP/JSON local de validación de personas.',
+    )
+    parser.add_argument('--host', default='127.0.0.1',
+                        help='Dirección (por defecto 127.0.0.1)')
+    parser.add_argument('--puerto', type=int, default=8080,
+                        help='Puerto (por defecto 8080)')
+    parser.add_argument('--lote-maximo', type=int, default=256,
+                        help='Registros por micro-lote como máximo (por defecto 256)')
+    parser.add_argument('--espera-ms', type=float, default=2.0,
+                        help='Milisegundos de espera para completar un micro-lote '
+                             '(por defecto 2)')
+    parser.add_argument('--cola', type=int, default=10_000,
+                        help='Registros pendientes antes de responder 503 '
+                             '(por defecto 10000)')
+    parser.add_argument('--trabajadores', type=int, default=None,
+                        help='Tamaño del pool (por defecto, uno por CPU)')
+    parser.add_argument('--hilos', action='store_true',
+                        help='Usar un pool de hilos en lugar de procesos')
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada de la línea de comandos.
+    
+    Args:
+        argv (Optional[List[str]]): Argumentos; por defecto sys.argv[1:]
+        
+    Returns:
+        int: Código de salida del proceso
+    """
+    args = crear_parser().parse_args(argv)
+    servidor = ServidorValidacion(
+        args.host, args.puerto, args.lote_maximo, args.espera_ms / 1000,
+        args.cola, args.trabajadores, args.hilos,
+    )
+
+    async def ejecutar() -> None:
+        tarea = asyncio.current_task()
+        try:
+            if tarea is not None:
+                asyncio.get_event_loop().add_signal_handler(signal.SIGTERM,
+                                                            tarea.cancel)
+        except NotImplementedError:  # Windows
+            pass
+        await servidor.iniciar()
+        print(f"Escuchando en http://{servidor.host}:{servidor.puerto}", flush=True)
+        await servidor.esperar()
+
+    try:
+        asyncio.run(ejecutar())
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""
+Módulo de numeración telefónica para normalizar celulares a E.164.
+
+Contiene un plan de numeración móvil simplificado, incluido en la
+librería (no se consulta ningún servicio): para cada región, su código
+de país, los prefijos con que empiezan los celulares, la longitud del
+número nacional y el prefijo troncal que se marca dentro del país.
+
+El plan se compila en un trie de dígitos cuyas ramas son el código de
+país seguido del prefijo móvil. Normalizar un número es recorrerlo una
+sola vez por el trie: el nodo más profundo alcanzado indica el país y
+comprueba el prefijo, y solo queda comparar la longitud restante.
+
+Ejemplo:
+    >>> from jorge_choque_pg2_tecba.telefonos import a_e164
+    >>> a_e164('71234567'), a_e164('+591 7123-4567'), a_e164('(591) 712 34567')
+    ('+59171234567', '+59171234567', '+59171234567')
+    >>> a_e164('612 345 678', region='ES')
+    '+34612345678'
+"""
+
+from typing import Dict, NamedTuple, Optional, Tuple
+
+
+class PlanRegion(NamedTuple):
+    """Numeración móvil de una región."""
+
+    codigo_pais: str
+    prefijos: Tuple[str, ...]
+    largo_minimo: int
+    largo_maximo: int
+    troncal: str = ''
+
+
+# Planes simplificados: solo numeración móvil. Un prefijo vacío acepta
+# cualquier número de la longitud indicada (p. ej. el plan norteamericano).
+PLANES: Dict[str, PlanRegion] = {
+    'BO': PlanRegion('591', ('6', '7'), 8, 8),
+    'AR': PlanRegion('54', ('9',), 11, 11, '0'),
+    'BR': PlanRegion('55', ('',), 11, 11, '0'),
+    'CL': PlanRegion('56', ('9',), 9, 9),
+    'CO': PlanRegion('57', ('3',), 10, 10),
+    'CR': PlanRegion('506', ('6', '7', '8'), 8, 8),
+    'EC': PlanRegion('593', ('9',), 9, 9, '0'),
+    'GT': PlanRegion('502', ('3', '4', '5'), 8, 8),
+    'MX': PlanRegion('52', ('',), 10, 10),
+    'PA': PlanRegion('507', ('6',), 8, 8),
+    'PE': PlanRegion('51', ('9',), 9, 9),
+    'PY': PlanRegion('595', ('9',), 9, 9, '0'),
+    'UY': PlanRegion('598', ('9',), 8, 8, '0'),
+    'VE': PlanRegion('58', ('4',), 10, 10, '0'),
+    'US': PlanRegion('1', tuple('23456789'), 10, 10),
+    'CA': PlanRegion('1', tuple('23456789'), 10, 10),
+    'ES': PlanRegion('34', ('6', '7'), 9, 9),
+    'FR': PlanRegion('33', ('6', '7'), 9, 9, '0'),
+    'IT': PlanRegion('39', ('3',), 9, 10),
+    'DE': PlanRegion('49', ('15', '16', '17'), 10, 11, '0'),
+    'GB': PlanRegion('44', ('7',), 10, 10, '0'),
+    'CN': PlanRegion('86', ('1',), 11, 11),
+}
+
+REGION_POR_DEFECTO = 'BO'
+
+# En cada nodo del trie, la clave None guarda el plan que termina ahí
+_FIN = None
+
+
+def _compilar(planes: Dict[str, PlanRegion]) -> Tuple[Dict, Dict[str, Dict]]:
+    """
+    Construye el trie de código de país + prefijo móvil.
+    
+    Returns:
+        Tuple[Dict, Dict[str, Dict]]: La raíz del trie y, por región, el
+        nodo donde termina su código de país
+    """
+    raiz: Dict = {}
+    nodos_pais: Dict[str, Dict] = {}
+    for region, plan in planes.items():
+        nodo = raiz
+        for digito in plan.codigo_pais:
+            nodo = nodo.setdefault(digito, {})
+        nodos_pais[region] = nodo
+        for prefijo in plan.prefijos:
+            rama = nodo
+            for digito in prefijo:
+                rama = rama.setdefault(digito, {})
+            rama[_FIN] = plan
+    return raiz, nodos_pais
+
+
+_TRIE, _NODOS_PAIS = _compilar(PLANES)
+
+
+def _recorrer(nodo: Dict, digitos: str, con_codigo: bool) -> Optional[str]:
+    """
+    Recorre los dígitos desde un nodo y arma el número E.164.
+    
+    Args:
+        nodo (Dict): Nodo desde el que se empieza
+        digitos (str): Dígitos por recorrer
+        con_codigo (bool): Si `digitos` empieza con el código de país;
+            si no, el recorrido empieza en el nodo del código
+            
+    Returns:
+        Optional[str]: El número E.164, o None si ningún plan lo acepta
+    """
+    plan = nodo.get(_FIN)
+    for digito in digitos:
+        siguiente = nodo.get(digito)
+        if siguiente is None:
+            break
+        nodo = siguiente
+        plan = nodo.get(_FIN, plan)
+    if plan is None:
+        return None
+    nacional = len(digitos) - (len(plan.codigo_pais) if con_codigo else 0)
+    if not plan.largo_minimo <= nacional <= plan.largo_maximo:
+        return None
+    return '+' + (digitos if con_codigo else plan.codigo_pais + digitos)
+
+
+def a_e164(celular: Optional[str], region: str = REGION_POR_DEFECTO) -> Optional[str]:
+    """
+    Convierte un celular a su forma canónica E.164 ('+' y solo dígitos).
+    
+    Los números con '+' o con el prefijo internacional '00' se toman como
+    internacionales. Los demás se interpretan en la región indicada (sin
+    el prefijo troncal, si lo tienen); si no corresponden a ella pero
+    empiezan con el código de país, como '59171234567', se toman como
+    internacionales escritos sin '+'.
+    
+    Args:
+        celular (Optional[str]): Número con espacios, guiones, paréntesis o '+'
+        region (str): Código ISO de la región de los números nacionales
+        
+    Returns:
+        Optional[str]: El número en E.164, o None si no es un celular de
+        un plan conocido
+        
+    Raises:
+        ValueError: Si la región no está en PLANES
+    """
+    plan = PLANES.get(region)
+    if plan is None:
+        raise ValueError(
+            f"Región desconocida: '{region}'. Debe ser una de {tuple(PLANES)}.")
+    if not celular:
+        return None
+    digitos = (celular.replace(' ', '').replace('-', '').replace('(', '')
+               .replace(')', '').replace('+', ''))
+    if not (digitos.isascii() and digitos.isdigit()) or len(digitos) > 17:
+        return None
+    if digitos.startswith('00'):
+        return _recorrer(_TRIE, digitos[2:], True)
+    if celular.lstrip()[:1] == '+':
+        return _recorrer(_TRIE, digitos, True)
+    if plan.troncal and digitos.startswith(plan.troncal):
+        digitos = digitos[len(plan.troncal):]
+    numero = _recorrer(_NODOS_PAIS[region], digitos, False)
+    if numero is None and digitos.startswith(plan.codigo_pais):
+        numero = _recorrer(_TRIE, digitos, True)
+    return numero
@@ -5,9 +5,72 @@ Este módulo contiene clases para validar diferentes tipos de datos:
 - ValidadorBase: Clase base con validaciones básicas
 - ValidadorDatosPersonales: Validaciones para datos personales
 - ValidadorDatosContacto: Validaciones para datos de contacto
+- ValidadorLote: Validaciones de columnas completas con máscaras compactas
+
+Los validadores no modifican su estado después de crearse, así que una
+misma instancia puede usarse desde varios hilos a la vez.
 """
 
 import re
+from string import ascii_letters, digits
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Optional,
+)
+
+from .telefonos import REGION_POR_DEFECTO, a_e164
+
+
+# Caracteres para los que str.isspace() es True; es exactamente el conjunto
+# que reconoce \s en los patrones de re para cadenas str
+_ESPACIOS = (
+    '\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680'
+    '\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a'
+    '\u2028\u2029\u202f\u205f\u3000'
+)
+
+# Reglas de solo clase de caracteres, como conjuntos de caracteres permitidos.
+# Equivalen a los patrones ^[...]+$ que usaban re.match en cada llamada:
+#   letras:       [a-zA-ZáéíóúÁÉÍÓÚñÑüÜ\s]
+#   alfanumérico: [a-zA-Z0-9áéíóúÁÉÍÓÚñÑüÜ\s]
+#   dirección:    [a-zA-Z0-9áéíóúÁÉÍÓÚñÑüÜ\s.,#-]
+_CARACTERES_LETRAS = frozenset(ascii_letters + 'áéíóúÁÉÍÓÚñÑüÜ' + _ESPACIOS)
+_CARACTERES_ALFANUMERICOS = _CARACTERES_LETRAS | frozenset(digits)
+_CARACTERES_DIRECCION = _CARACTERES_ALFANUMERICOS | frozenset('.,#-')
+
+# El email no es una regla de solo clase de caracteres: se compila una vez
+_PATRON_EMAIL = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Partes del email para el modo seguro, que no usa expresiones regulares
+_CARACTERES_EMAIL_LOCAL = frozenset(ascii_letters + digits + '._%+-')
+_CARACTERES_EMAIL_DOMINIO = frozenset(ascii_letters + digits + '.-')
+_CARACTERES_EMAIL_TLD = frozenset(ascii_letters)
+
+# Longitud máxima de la entrada sin limpiar. Se comprueba en O(1) antes de
+# cualquier limpieza o expresión regular, para que un campo enorme se
+# rechace de inmediato. Es mucho mayor que cualquier valor válido.
+LONGITUD_MAXIMA_ENTRADA = 1024
+
+LONGITUD_MAXIMA_EMAIL = 100
+
+# Máscara de ValidadorLote: bytearray o, con usar_numpy=True, un arreglo
+# booleano de NumPy (que no trae anotaciones de tipos)
+_Mascara = Any
+
+
+def _entero(texto: str) -> Optional[int]:
+    """
+    Convierte a entero un texto de dígitos.
+    
+    Algunos caracteres cumplen str.isdigit() pero int() no los acepta
+    (como '²'); para ellos devuelve None.
+    """
+    try:
+        return int(texto)
+    except ValueError:
+        return None
 
 
 class ValidadorBase:
@@ -47,8 +110,7 @@ class ValidadorBase:
         if not valor:
             return False
         # Permite letras, espacios, acentos y caracteres especiales del español
-        patron = r'^[a-zA-ZáéíóúÁÉÍÓÚñÑüÜ\s]+$'
-        return bool(re.match(patron, valor))
+        return _CARACTERES_LETRAS.issuperset(valor)
     
     @staticmethod
     def validar_alfanumerico(valor: str) -> bool:
@@ -64,8 +126,7 @@ class ValidadorBase:
         if not valor:
             return False
         # Permite letras, números, espacios y algunos caracteres especiales
-        patron = r'^[a-zA-Z0-9áéíóúÁÉÍÓÚñÑüÜ\s]+$'
-        return bool(re.match(patron, valor))
+        return _CARACTERES_ALFANUMERICOS.issuperset(valor)
 
 
 class ValidadorDatosPersonales(ValidadorBase):
@@ -86,11 +147,13 @@ class ValidadorDatosPersonales(ValidadorBase):
         Returns:
             bool: True si la edad es válida, False en caso contrario
         """
+        if not edad or len(edad) > LONGITUD_MAXIMA_ENTRADA:
+            return False
         if not self.validar_solo_numeros(edad):
             return False
         
-        edad_num = int(edad)
-        return 0 <= edad_num <= 150
+        edad_num = _entero(edad)
+        return edad_num is not None and 0 <= edad_num <= 150
     
     def validar_nombre(self, nombre: str) -> bool:
         """
@@ -102,7 +165,9 @@ class ValidadorDatosPersonales(ValidadorBase):
         Returns:
             bool: True si el nombre es válido, False en caso contrario
         """
-        if not nombre or len(nombre.strip()) < 2:
+        if not nombre or len(nombre) > LONGITUD_MAXIMA_ENTRADA:
+            return False
+        if len(nombre.strip()) < 2:
             return False
         
         # Remover espacios extra y validar
@@ -110,6 +175,19 @@ class ValidadorDatosPersonales(ValidadorBase):
         return (self.validar_solo_letras(nombre_limpio) and 
                 2 <= len(nombre_limpio) <= 50)
     
+    @staticmethod
+    def normalizar_documento(documento: str) -> str:
+        """
+        Obtiene la forma normalizada de un documento (sin espacios ni guiones).
+        
+        Args:
+            documento (str): El documento a normalizar
+            
+        Returns:
+            str: El documento sin espacios ni guiones
+        """
+        return documento.replace(' ', '').replace('-', '')
+    
     def validar_documento_identidad(self, documento: str) -> bool:
         """
         Valida que el documento de identidad tenga formato válido.
@@ -120,11 +198,10 @@ class ValidadorDatosPersonales(ValidadorBase):
         Returns:
             bool: True si el documento es válido, False en caso contrario
         """
-        if not documento:
+        if not documento or len(documento) > LONGITUD_MAXIMA_ENTRADA:
             return False
         
-        # Remover espacios y guiones
-        documento_limpio = documento.replace(' ', '').replace('-', '')
+        documento_limpio = self.normalizar_documento(documento)
         
         # Debe contener solo números y tener entre 7 y 12 dígitos
         return (self.validar_solo_numeros(documento_limpio) and 
@@ -139,6 +216,17 @@ class ValidadorDatosContacto(ValidadorBase):
     específicas de datos de contacto como email, celular y dirección.
     """
     
+    def __init__(self, modo_seguro: bool = False):
+        """
+        Inicializa el validador.
+        
+        Args:
+            modo_seguro (bool): Si es True, ninguna validación usa
+                expresiones regulares y todas corren en tiempo lineal
+                respecto de la entrada (útil con datos no confiables)
+        """
+        self.modo_seguro = modo_seguro
+    
     def validar_email(self, email: str) -> bool:
         """
         Valida que el email tenga un formato válido.
@@ -149,14 +237,76 @@ class ValidadorDatosContacto(ValidadorBase):
         Returns:
             bool: True si el email es válido, False en caso contrario
         """
-        if not email:
+        # La longitud se comprueba antes que el patrón
+        if not email or len(email) > LONGITUD_MAXIMA_EMAIL:
             return False
         
-        # Patrón básico para email
-        patron = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+        if self.modo_seguro:
+            return self._validar_email_lineal(email)
+        return bool(_PATRON_EMAIL.match(email))
+    
+    @staticmethod
+    def _validar_email_lineal(email: str) -> bool:
+        """
+        Valida el patrón de email sin expresiones regulares, en tiempo lineal.
         
-        # Validar patrón y longitud
-        return bool(re.match(patron, email)) and len(email) <= 100
+        Acepta exactamente lo mismo que _PATRON_EMAIL con re.match: una
+        parte local, una sola '@' y un dominio cuyo último segmento tras el
+        último '.' tiene al menos dos letras. Como '$' también coincide
+        antes de un salto de línea final, se ignora uno solo al final.
+        """
+        if email[-1:] == '\n':
+            email = email[:-1]
+        local, arroba, dominio = email.partition('@')
+        if not arroba or not local or not _CARACTERES_EMAIL_LOCAL.issuperset(local):
+            return False
+        if not _CARACTERES_EMAIL_DOMINIO.issuperset(dominio):
+            return False
+        punto = dominio.rfind('.')
+        tld = dominio[punto + 1:]
+        return (punto > 0 and len(tld) >= 2
+                and _CARACTERES_EMAIL_TLD.issuperset(tld))
+    
+    @staticmethod
+    def normalizar_celular(celular: str) -> str:
+        """
+        Obtiene la forma normalizada de un celular.
+        
+        Args:
+            celular (str): El celular a normalizar
+            
+        Returns:
+            str: El celular sin espacios, guiones, paréntesis ni '+'
+        """
+        return (celular.replace(' ', '')
+                .replace('-', '')
+                .replace('(', '')
+                .replace(')', '')
+                .replace('+', ''))
+    
+    @staticmethod
+    def normalizar_e164(celular: str,
+                        region: str = REGION_POR_DEFECTO) -> Optional[str]:
+        """
+        Obtiene la forma canónica E.164 de un celular (ver telefonos.a_e164).
+        
+        Así '+591 7123-4567', '(591) 712 34567' y '71234567' dan el mismo
+        '+59171234567'.
+        
+        Args:
+            celular (str): El celular a normalizar
+            region (str): Código ISO de la región de los números nacionales
+            
+        Returns:
+            Optional[str]: El número en E.164, o None si no es un celular
+            de un plan conocido
+            
+        Raises:
+            ValueError: Si la región no existe
+        """
+        if celular and len(celular) > LONGITUD_MAXIMA_ENTRADA:
+            return None
+        return a_e164(celular, region)
     
     def validar_celular(self, celular: str) -> bool:
         """
@@ -168,15 +318,10 @@ class ValidadorDatosContacto(ValidadorBase):
         Returns:
             bool: True si el celular es válido, False en caso contrario
         """
-        if not celular:
+        if not celular or len(celular) > LONGITUD_MAXIMA_ENTRADA:
             return False
         
-        # Remover espacios, guiones y paréntesis
-        celular_limpio = (celular.replace(' ', '')
-                         .replace('-', '')
-                         .replace('(', '')
-                         .replace(')', '')
-                         .replace('+', ''))
+        celular_limpio = self.normalizar_celular(celular)
         
         # Debe contener solo números y tener entre 8 y 15 dígitos
         return (self.validar_solo_numeros(celular_limpio) and 
@@ -192,14 +337,204 @@ class ValidadorDatosContacto(ValidadorBase):
         Returns:
             bool: True si la dirección es válida, False en caso contrario
         """
-        if not direccion or len(direccion.strip()) < 5:
+        if not direccion or len(direccion) > LONGITUD_MAXIMA_ENTRADA:
+            return False
+        if len(direccion.strip()) < 5:
             return False
         
         # Remover espacios extra
         direccion_limpia = ' '.join(direccion.split())
         
         # Debe ser alfanumérica y permitir algunos caracteres especiales
-        patron = r'^[a-zA-Z0-9áéíóúÁÉÍÓÚñÑüÜ\s.,#-]+$'
+        return (_CARACTERES_DIRECCION.issuperset(direccion_limpia) and 
+                5 <= len(direccion_limpia) <= 200)
+
+
+class ValidadorLote:
+    """
+    Validador de columnas completas de datos.
+    
+    Aplica las mismas reglas que ValidadorDatosPersonales y
+    ValidadorDatosContacto sobre iterables de valores. La validación sigue
+    siendo un bucle de Python por valor: cada columna se recorre una sola
+    vez con una expresión generadora, sin una llamada a método por valor y
+    con los conjuntos de caracteres y patrones precompilados enlazados a
+    variables locales. No hay un núcleo vectorizado; la ganancia frente a
+    validar fila por fila es constante, no de orden.
+    
+    Cada método devuelve una máscara compacta con un byte por fila
+    (1 = válido, 0 = inválido). Con usar_numpy=True la misma máscara se
+    entrega como arreglo booleano de NumPy, sin copiar el buffer; NumPy
+    no se usa para validar.
+    """
+    
+    def __init__(self, usar_numpy: bool = False):
+        """
+        Inicializa el validador de lotes.
+        
+        Args:
+            usar_numpy (bool): Si es True, las máscaras se devuelven como
+                arreglos booleanos de NumPy (sin copiar el buffer)
+                
+        Raises:
+            ImportError: Si usar_numpy es True y NumPy no está instalado
+        """
+        self._np: Any = None
+        if usar_numpy:
+            try:
+                import numpy
+            except ImportError as error:
+                raise ImportError(
+                    "usar_numpy=True requiere tener NumPy instalado."
+                ) from error
+            self._np = numpy
+    
+    def _resultado(self, mascara: bytearray) -> _Mascara:
+        """Convierte la máscara al tipo de salida configurado."""
+        if self._np is None:
+            return mascara
+        return self._np.frombuffer(mascara, dtype=self._np.bool_)
+    
+    def validar_nombres(self, nombres: Iterable[str]) -> _Mascara:
+        """
+        Valida una columna de nombres (ver ValidadorDatosPersonales.validar_nombre).
+        
+        Args:
+            nombres (Iterable[str]): Los nombres a validar
+            
+        Returns:
+            bytearray: Máscara con 1 en las filas válidas
+        """
+        solo_letras = _CARACTERES_LETRAS.issuperset
+        maximo = LONGITUD_MAXIMA_ENTRADA
+        mascara = bytearray(
+            1 if (n and len(n) <= maximo
+                  and 2 <= len(limpio := ' '.join(n.split())) <= 50
+                  and solo_letras(limpio)) else 0
+            for n in nombres
+        )
+        return self._resultado(mascara)
+    
+    def validar_edades(self, edades: Iterable) -> _Mascara:
+        """
+        Valida una columna de edades (ver ValidadorDatosPersonales.validar_edad).
+        
+        Acepta tanto cadenas como enteros; los valores que no son cadenas
+        se convierten con str(), igual que Persona.establecer_edad.
+        
+        Args:
+            edades (Iterable): Las edades a validar
+            
+        Returns:
+            bytearray: Máscara con 1 en las filas válidas
+        """
+        maximo = LONGITUD_MAXIMA_ENTRADA
+        mascara = bytearray(
+            1 if (len(texto := e if type(e) is str else str(e)) <= maximo
+                  and texto.isdigit()
+                  and (n := _entero(texto)) is not None and n <= 150) else 0
+            for e in edades
+        )
+        return self._resultado(mascara)
+    
+    def validar_documentos(self, documentos: Iterable[str]) -> _Mascara:
+        """
+        Valida una columna de documentos (ver
+        ValidadorDatosPersonales.validar_documento_identidad).
+        
+        Args:
+            documentos (Iterable[str]): Los documentos a validar
+            
+        Returns:
+            bytearray: Máscara con 1 en las filas válidas
+        """
+        maximo = LONGITUD_MAXIMA_ENTRADA
+        mascara = bytearray(
+            1 if (d and len(d) <= maximo
+                  and 7 <= len(limpio := d.replace(' ', '').replace('-', '')) <= 12
+                  and limpio.isdigit()) else 0
+            for d in documentos
+        )
+        return self._resultado(mascara)
+    
+    def validar_emails(self, emails: Iterable[str]) -> _Mascara:
+        """
+        Valida una columna de emails (ver ValidadorDatosContacto.validar_email).
         
-        return (bool(re.match(patron, direccion_limpia)) and 
-                5 <= len(direccion_limpia) <= 200)
\ No newline at end of file
+        Args:
+            emails (Iterable[str]): Los emails a validar
+            
+        Returns:
+            bytearray: Máscara con 1 en las filas válidas
+        """
+        coincide = _PATRON_EMAIL.match
+        mascara = bytearray(
+            1 if (e and len(e) <= LONGITUD_MAXIMA_EMAIL and coincide(e)) else 0
+            for e in emails
+        )
+        return self._resultado(mascara)
+    
+    def validar_celulares(self, celulares: Iterable[str]) -> _Mascara:
+        """
+        Valida una columna de celulares (ver ValidadorDatosContacto.validar_celular).
+        
+        Args:
+            celulares (Iterable[str]): Los celulares a validar
+            
+        Returns:
+            bytearray: Máscara con 1 en las filas válidas
+        """
+        # str.replace encadenado es más rápido que str.translate con tabla
+        maximo = LONGITUD_MAXIMA_ENTRADA
+        mascara = bytearray(
+            1 if (c and len(c) <= maximo
+                  and 8 <= len(limpio := c.replace(' ', '').replace('-', '')
+                                          .replace('(', '').replace(')', '')
+                                          .replace('+', '')) <= 15
+                  and limpio.isdigit()) else 0
+            for c in celulares
+        )
+        return self._resultado(mascara)
+    
+    def normalizar_celulares(self, celulares: Iterable[str],
+                             region: str = REGION_POR_DEFECTO) -> List[Optional[str]]:
+        """
+        Normaliza una columna de celulares a E.164 (ver
+        ValidadorDatosContacto.normalizar_e164).
+        
+        Args:
+            celulares (Iterable[str]): Los celulares a normalizar
+            region (str): Código ISO de la región de los números nacionales
+            
+        Returns:
+            List[Optional[str]]: El número E.164 de cada fila, o None
+            
+        Raises:
+            ValueError: Si la región no existe
+        """
+        normalizar = a_e164
+        a_e164('', region)   # valida la región una sola vez
+        maximo = LONGITUD_MAXIMA_ENTRADA
+        return [normalizar(c, region) if c and len(c) <= maximo else None
+                for c in celulares]
+    
+    def validar_direcciones(self, direcciones: Iterable[str]) -> _Mascara:
+        """
+        Valida una columna de direcciones (ver
+        ValidadorDatosContacto.validar_direccion).
+        
+        Args:
+            direcciones (Iterable[str]): Las direcciones a validar
+            
+        Returns:
+            bytearray: Máscara con 1 en las filas válidas
+        """
+        caracteres_validos = _CARACTERES_DIRECCION.issuperset
+        maximo = LONGITUD_MAXIMA_ENTRADA
+        mascara = bytearray(
+            1 if (d and len(d) <= maximo
+                  and 5 <= len(limpia := ' '.join(d.split())) <= 200
+                  and caracteres_validos(limpia)) else 0
+            for d in direcciones
+        )
+        return self._resultado(mascara)
@@ -0,0 +1,60 @@
+"""
+Pruebas del archivo binario de personas: lectura por índice, lotes que
+fallan a medias y bloques with que terminan con una excepción.
+"""
+
+import pytest
+
+from jorge_choque_pg2_tecba.archivo import (
+    EscritorArchivo,
+    LectorArchivo,
+    guardar_personas,
+)
+from jorge_choque_pg2_tecba.core import Persona
+
+
+def persona(nombre, edad=30):
+    return Persona().establecer_nombre(nombre).establecer_edad(edad)
+
+
+def test_guardar_y_leer(tmp_path):
+    ruta = str(tmp_path / 'personas.jcpa')
+    personas = [persona('Ana Pérez'),
+                persona('Luis Mamani', 41).establecer_email('l@x.bo')]
+    assert guardar_personas(ruta, personas) == 2
+    with LectorArchivo(ruta) as archivo:
+        assert len(archivo) == 2
+        assert archivo[1].email == 'l@x.bo'
+        assert archivo[-1].edad == 41
+        assert [p.nombre for p in archivo] == ['Ana Pérez', 'Luis Mamani']
+
+
+def test_lote_con_campo_demasiado_largo_no_deja_filas(tmp_path):
+    ruta = str(tmp_path / 'personas.jcpa')
+    larga = persona('Ana Pérez')
+    larga._direccion = 'x' * 70_000
+    with EscritorArchivo(ruta) as escritor:
+        with pytest.raises(ValueError):
+            escritor.agregar_personas([persona('Eva Quispe'), larga])
+        assert len(escritor) == 0
+        escritor.agregar(persona('Luis Mamani'))
+    with LectorArchivo(ruta) as archivo:
+        assert [p.nombre for p in archivo] == ['Luis Mamani']
+
+
+def test_excepcion_en_el_bloque_no_finaliza_el_archivo(tmp_path):
+    ruta = str(tmp_path / 'personas.jcpa')
+    with pytest.raises(RuntimeError):
+        with EscritorArchivo(ruta) as escritor:
+            escritor.agregar(persona('Ana Pérez'))
+            raise RuntimeError("falla a mitad de la escritura")
+    with pytest.raises(ValueError):
+        LectorArchivo(ruta)
+
+
+def test_edad_en_texto_se_guarda_como_entero(tmp_path):
+    ruta = str(tmp_path / 'personas.jcpa')
+    guardar_personas(ruta, [persona('Ana Pérez', '31')])
+    with LectorArchivo(ruta) as archivo:
+        assert archivo[0].edad == 31
+        assert archivo.persona(0).edad == 31
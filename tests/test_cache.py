@@ -0,0 +1,29 @@
+"""
+Pruebas de ValidadorConCache: mismos resultados que el validador y las
+entradas que no deben ocupar la caché.
+"""
+
+from jorge_choque_pg2_tecba.cache import ValidadorConCache
+from jorge_choque_pg2_tecba.validators import (
+    LONGITUD_MAXIMA_ENTRADA,
+    ValidadorDatosContacto,
+    ValidadorDatosPersonales,
+)
+
+
+def test_resultados_iguales_al_validador():
+    validador = ValidadorDatosContacto()
+    contacto = ValidadorConCache(validador, tamano_maximo=2)
+    for email in ['ana@correo.bo', 'x', 'ana@correo.bo', 'luis@correo.bo', 'x']:
+        assert contacto.validar_email(email) == validador.validar_email(email)
+    estadisticas = contacto.estadisticas()['validar_email']
+    assert (estadisticas.aciertos, estadisticas.fallos) == (1, 4)
+    assert estadisticas.tamano == 2
+
+
+def test_entradas_demasiado_largas_no_se_guardan():
+    personales = ValidadorConCache(ValidadorDatosPersonales())
+    for letra in 'abc':
+        assert not personales.validar_nombre(letra * (LONGITUD_MAXIMA_ENTRADA + 1))
+    assert personales.validar_nombre('Ana' + ' ' * (LONGITUD_MAXIMA_ENTRADA - 3))
+    assert personales.estadisticas()['validar_nombre'].tamano == 1
@@ -0,0 +1,126 @@
+"""
+Pruebas de ValidadorConcurrente: orden de los resultados, propagación de
+errores, memoria acotada y cierre de los hilos del pool.
+"""
+
+import random
+import threading
+import time
+
+import pytest
+
+from jorge_choque_pg2_tecba import concurrente
+from jorge_choque_pg2_tecba.concurrente import (
+    ValidadorConcurrente,
+    gil_habilitado,
+    validar_concurrente,
+)
+from jorge_choque_pg2_tecba.esquema import validar_persona
+
+
+def filas_de_prueba(cantidad):
+    """Filas válidas e inválidas alternadas."""
+    filas = []
+    for i in range(cantidad):
+        if i % 3:
+            filas.append({'nombre': 'Ana Pérez', 'edad': str(i % 150),
+                          'email': f'ana{i}@correo.bo'})
+        else:
+            filas.append({'nombre': 'A', 'edad': str(200 + i), 'email': 'no es email'})
+    return filas
+
+
+def hilos_del_pool():
+    """Hilos vivos creados por algún ValidadorConcurrente."""
+    return [hilo for hilo in threading.enumerate()
+            if hilo.name.startswith('validacion')]
+
+
+def test_resultados_iguales_a_validar_persona():
+    filas = filas_de_prueba(500)
+    with ValidadorConcurrente(hilos=4, tamano_bloque=7) as validador:
+        resultados = validador.validar(filas)
+    esperados = [validar_persona(fila) for fila in filas]
+    assert [r.valido for r in resultados] == [r.valido for r in esperados]
+    assert [r.mensajes for r in resultados] == [r.mensajes for r in esperados]
+
+
+def test_orden_de_entrada_aunque_los_bloques_terminen_desordenados(monkeypatch):
+    azar = random.Random(1)
+
+    def lento(fila, esquema):
+        time.sleep(azar.random() / 2000)
+        return fila['i']
+
+    monkeypatch.setattr(concurrente, 'validar_persona', lento)
+    with ValidadorConcurrente(hilos=8, tamano_bloque=3) as validador:
+        assert validador.validar({'i': i} for i in range(1_000)) == list(range(1_000))
+
+
+def test_validar_iter_lee_la_entrada_de_a_poco():
+    leidas = 0
+
+    def filas():
+        nonlocal leidas
+        for fila in filas_de_prueba(10_000):
+            leidas += 1
+            yield fila
+
+    with ValidadorConcurrente(hilos=2, tamano_bloque=10) as validador:
+        resultados = validador.validar_iter(filas())
+        next(resultados)
+        # Como máximo 2 bloques pendientes por hilo más el bloque que se está armando
+        assert leidas <= (2 * 2 + 1) * 10
+        assert sum(1 for _ in resultados) == 10_000 - 1
+
+
+def test_error_de_una_fila_se_propaga_y_el_pool_sigue_funcionando():
+    filas = filas_de_prueba(50)
+    filas[37] = None   # validar_persona necesita un diccionario
+    with ValidadorConcurrente(hilos=4, tamano_bloque=5) as validador:
+        with pytest.raises(AttributeError):
+            validador.validar(filas)
+        assert len(validador.validar(filas_de_prueba(20))) == 20
+
+
+def test_error_de_la_entrada_se_propaga():
+    def filas():
+        yield from filas_de_prueba(25)
+        raise OSError("se cortó la lectura")
+
+    with ValidadorConcurrente(hilos=2, tamano_bloque=10) as validador:
+        with pytest.raises(OSError, match="se cortó"):
+            validador.validar(filas())
+
+
+def test_cerrar_termina_los_hilos():
+    antes = set(hilos_del_pool())
+    validador = ValidadorConcurrente(hilos=4, tamano_bloque=10)
+    validador.validar(filas_de_prueba(200))
+    assert set(hilos_del_pool()) - antes
+    validador.cerrar()
+    assert set(hilos_del_pool()) - antes == set()
+    with pytest.raises(RuntimeError):
+        validador.validar(filas_de_prueba(1))
+
+
+def test_validar_concurrente_no_deja_hilos():
+    antes = set(hilos_del_pool())
+    resultados = validar_concurrente(filas_de_prueba(100), hilos=3, tamano_bloque=9)
+    assert len(resultados) == 100
+    assert set(hilos_del_pool()) - antes == set()
+
+
+def test_entrada_vacia():
+    with ValidadorConcurrente(hilos=2) as validador:
+        assert validador.validar([]) == []
+
+
+@pytest.mark.parametrize('argumentos', [{'hilos': 0}, {'tamano_bloque': 0}])
+def test_parametros_invalidos(argumentos):
+    with pytest.raises(ValueError):
+        ValidadorConcurrente(**argumentos)
+
+
+def test_gil_habilitado():
+    assert isinstance(gil_habilitado(), bool)
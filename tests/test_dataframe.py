@@ -0,0 +1,147 @@
+"""
+Pruebas del accesor DataFrame.validacion.
+
+Cada máscara debe coincidir valor por valor con el validador escalar que
+usa Persona.desde_dict, y validos() con Persona.desde_dict en modo
+'acumular', con cadenas de Python, de pyarrow y columnas object.
+"""
+
+import importlib.util
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+from jorge_choque_pg2_tecba import dataframe  # noqa: E402
+from jorge_choque_pg2_tecba.core import Persona  # noqa: E402
+from jorge_choque_pg2_tecba.validators import (  # noqa: E402
+    ValidadorDatosContacto,
+    ValidadorDatosPersonales,
+)
+
+
+_PERSONALES = ValidadorDatosPersonales()
+_CONTACTO = ValidadorDatosContacto()
+ESCALARES = {
+    'nombre': _PERSONALES.validar_nombre,
+    'edad': _PERSONALES.validar_edad,
+    'documento_identidad': _PERSONALES.validar_documento_identidad,
+    'email': _CONTACTO.validar_email,
+    'celular': _CONTACTO.validar_celular,
+    'direccion': _CONTACTO.validar_direccion,
+}
+
+BASE = {
+    'nombre': 'Ana Pérez',
+    'edad': '30',
+    'documento_identidad': '1234567',
+    'email': 'ana@correo.bo',
+    'celular': '71234567',
+    'direccion': 'Calle Sucre 123',
+}
+
+# Valores límite por campo: espacios Unicode, saltos de línea, dígitos no
+# ASCII, longitudes en el borde, vacíos y nulos
+LIMITES = {
+    'nombre': ['Ana Pérez', 'Ana\x1cPérez', ' 　 ', 'Jo\nsé', 'A  ', 'Ñ' * 50,
+               'Ñ' * 51, 'Ana-María', 'Ana2', 'x' * 1025, '', None],
+    'edad': ['0', '150', '151', '007', '٣٠', '３０', '²', '1' * 30, ' 30', '+30', '-1',
+             '30.0', '', None],
+    'documento_identidad': ['1234567', '123 456-78', '-1234567-', '１２３４５６７',
+                            '123456789012', '1234567890123', '٣' * 8, '12345a7',
+                            '', None],
+    'email': ['ana@correo.bo\n', 'ana@correo.bo\n\n', 'ana@correo.b', 'a@b.co',
+              'ANA@X.ORG ', 'a@b.c0m', 'á@b.com', 'ana@@b.co', 'a' * 95 + '@b.bo',
+              'a' * 96 + '@b.bo', '', None],
+    'celular': ['(591) 712-34567', '+59171234567', '7123 4567', '+++71234567',
+                '71234567x', '1' * 15, '1' * 16, '', None],
+    'direccion': ['Calle  Sucre   #12', '\tAv. Arce, N 5', 'Z 1 2', 'Zona Sur',
+                  'a' * 200, 'a' * 201, 'ab  c', 'Calle 1 / 2', '', None],
+}
+
+TIPOS = [
+    pytest.param(object, id='object'),
+    pytest.param(pd.StringDtype('python'), id='string[python]'),
+    pytest.param('pyarrow', id='string[pyarrow]', marks=pytest.mark.skipif(
+        importlib.util.find_spec('pyarrow') is None, reason='requiere pyarrow')),
+]
+
+
+def construir(tipo):
+    """Una fila válida más una fila por cada valor límite de cada campo."""
+    if tipo == 'pyarrow':
+        tipo = pd.StringDtype('pyarrow')
+    filas = [dict(BASE)]
+    for campo, valores in LIMITES.items():
+        filas.extend(dict(BASE, **{campo: valor}) for valor in valores)
+    return pd.DataFrame(filas, columns=list(dataframe.CAMPOS), dtype=tipo)
+
+
+def registros(df):
+    """Filas del DataFrame como diccionarios, con None en los nulos."""
+    return df.astype(object).where(df.notna(), None).to_dict('records')
+
+
+def escalar(campo, valor):
+    """Resultado del validador escalar sobre str(valor); un nulo no es válido."""
+    return valor is not None and ESCALARES[campo](str(valor))
+
+
+@pytest.mark.parametrize('tipo', TIPOS)
+def test_mascaras_coinciden_con_validadores_escalares(tipo):
+    df = construir(tipo)
+    mascaras = df.validacion.mascaras()
+    for campo in dataframe.CAMPOS:
+        esperado = [escalar(campo, fila[campo]) for fila in registros(df)]
+        assert list(mascaras[campo]) == esperado, campo
+
+
+@pytest.mark.parametrize('tipo', TIPOS)
+def test_validos_coincide_con_desde_dict(tipo):
+    df = construir(tipo)
+    esperado = [Persona.desde_dict(fila, modo='acumular').valido
+                for fila in registros(df)]
+    assert list(df.validacion.validos()) == esperado
+
+
+def test_codigos_distinguen_ausente_de_invalido():
+    df = pd.DataFrame({'nombre': ['Ana Pérez', '', None, 'A1'],
+                       'email': ['ana@correo.bo', None, 'x', '']})
+    codigos = df.validacion.codigos()
+    assert list(codigos['nombre']) == [dataframe.VALIDO, dataframe.AUSENTE,
+                                       dataframe.AUSENTE, dataframe.INVALIDO]
+    assert list(codigos['email']) == [dataframe.VALIDO, dataframe.AUSENTE,
+                                      dataframe.INVALIDO, dataframe.AUSENTE]
+    assert list(df.validacion.validos()) == [True, False, False, False]
+
+
+@pytest.mark.parametrize('tipo', ['int64', 'Int64', 'float64', object])
+def test_edad_numerica_como_desde_dict(tipo):
+    """Los enteros se validan por su valor; 30.0 no es válido, como en desde_dict."""
+    valores = [30, 0, 150, 151, -1, None] if tipo != 'int64' else [30, 0, 150, 151, -1]
+    if tipo is object:
+        valores = valores + [30.0, 30.5]
+    df = pd.DataFrame({'nombre': 'Ana Pérez', 'edad': pd.Series(valores, dtype=tipo)})
+    esperado = [Persona.desde_dict(fila, modo='acumular').valido
+                for fila in registros(df)]
+    assert list(df.validacion.validos()) == esperado
+    if tipo == 'float64':
+        assert not df['edad'].validacion.mascara('edad').any()
+
+
+def test_columnas_con_otros_nombres():
+    df = pd.DataFrame({'nombre_completo': ['Ana Pérez', 'A'],
+                       'correo': ['ana@correo.bo', 'x']})
+    columnas = {'nombre': 'nombre_completo', 'email': 'correo'}
+    assert list(df.validacion.mascaras(columnas).columns) == ['nombre', 'email']
+    assert list(df.validacion.validos(columnas)) == [True, False]
+
+
+def test_sin_columna_nombre_ninguna_fila_es_valida():
+    df = pd.DataFrame({'email': ['ana@correo.bo']})
+    assert list(df.validacion.validos()) == [False]
+
+
+def test_campo_inexistente():
+    with pytest.raises(ValueError):
+        pd.Series(['x']).validacion.mascara('apellido')
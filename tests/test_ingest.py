@@ -0,0 +1,43 @@
+"""
+Pruebas de la línea de comandos de ingest: salidas separadas, líneas
+JSONL ilegibles y errores de lectura del CSV.
+"""
+
+import json
+
+from jorge_choque_pg2_tecba import ingest
+
+
+def test_csv_separa_validas_y_rechazadas(tmp_path, capsys):
+    entrada = tmp_path / 'personas.csv'
+    entrada.write_text('nombre,edad\nAna Pérez,30\nA1,300\n', encoding='utf-8')
+    validos, rechazados = tmp_path / 'validos.csv', tmp_path / 'rechazados.csv'
+    codigo = ingest.main([str(entrada), '--validos', str(validos),
+                          '--rechazados', str(rechazados), '--procesos', '1'])
+    assert codigo == 0
+    assert 'Filas válidas: 1, filas rechazadas: 1' in capsys.readouterr().out
+    assert validos.read_text(encoding='utf-8').startswith(
+        'nombre,edad,documento_identidad,email,celular,direccion\nAna Pérez,30,')
+    assert rechazados.read_text(encoding='utf-8').startswith('nombre,edad,motivo\n')
+
+
+def test_jsonl_ilegible_se_rechaza_con_su_linea(tmp_path):
+    entrada = tmp_path / 'personas.jsonl'
+    entrada.write_text('{"nombre": "Ana Pérez"}\nbasura\n[1]\n', encoding='utf-8')
+    rechazados = tmp_path / 'rechazados.jsonl'
+    codigo = ingest.main([str(entrada), '--validos', str(tmp_path / 'validos.jsonl'),
+                          '--rechazados', str(rechazados), '--procesos', '1'])
+    assert codigo == 0
+    lineas = rechazados.read_text(encoding='utf-8').splitlines()
+    filas = [json.loads(linea) for linea in lineas]
+    assert [fila[ingest.CAMPO_LINEA] for fila in filas] == [2, 3]
+
+
+def test_csv_mal_formado_termina_con_un_mensaje(tmp_path, capsys):
+    entrada = tmp_path / 'personas.csv'
+    entrada.write_text('nombre,edad\n"' + 'x' * 200_000 + '",30\n', encoding='utf-8')
+    codigo = ingest.main([str(entrada), '--validos', str(tmp_path / 'validos.csv'),
+                          '--rechazados', str(tmp_path / 'rechazados.csv'),
+                          '--procesos', '1'])
+    assert codigo == 1
+    assert capsys.readouterr().err.startswith('Error: field larger than field limit')
@@ -0,0 +1,97 @@
+"""
+Pruebas de la instrumentación de metricas: solo cuenta la llamada más
+externa de cada hilo.
+"""
+
+import threading
+
+import pytest
+
+from jorge_choque_pg2_tecba import metricas
+from jorge_choque_pg2_tecba.core import Persona
+from jorge_choque_pg2_tecba.validators import (
+    ValidadorBase,
+    ValidadorDatosContacto,
+    ValidadorDatosPersonales,
+    ValidadorLote,
+)
+
+
+@pytest.fixture
+def instrumentado():
+    metricas.reiniciar()
+    metricas.activar()
+    try:
+        yield
+    finally:
+        metricas.desactivar()
+        metricas.reiniciar()
+
+
+def llamadas():
+    """Llamadas registradas por método, sin los que no se llamaron."""
+    return {nombre: datos['llamadas']
+            for nombre, datos in metricas.instantanea()['metodos'].items()
+            if datos['llamadas']}
+
+
+def test_setter_cuenta_solo_la_llamada_externa(instrumentado):
+    Persona().establecer_nombre('Ana Pérez')
+    with pytest.raises(ValueError):
+        Persona().establecer_nombre('A1')
+    assert llamadas() == {'Persona.establecer_nombre': 2}
+    metodo = metricas.instantanea()['metodos']['Persona.establecer_nombre']
+    assert metodo['rechazos'] == {metricas.CARACTERES_INVALIDOS: 1}
+
+
+def test_validador_cuenta_solo_la_llamada_externa(instrumentado):
+    ValidadorDatosPersonales().validar_nombre('Ana Pérez')
+    ValidadorDatosPersonales.validar_solo_letras('Ana')
+    assert llamadas() == {'ValidadorDatosPersonales.validar_nombre': 1,
+                          'ValidadorBase.validar_solo_letras': 1}
+
+
+def test_cada_hilo_cuenta_sus_llamadas(instrumentado):
+    barrera = threading.Barrier(4)
+
+    def trabajar():
+        barrera.wait()
+        for _ in range(100):
+            Persona().establecer_edad('30')
+
+    hilos = [threading.Thread(target=trabajar) for _ in range(4)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert llamadas() == {'Persona.establecer_edad': 400}
+
+
+def test_argumentos_por_nombre(instrumentado):
+    assert ValidadorDatosContacto().validar_email(email='a@b.co')
+    assert not ValidadorBase.validar_solo_letras(valor='')
+    Persona().establecer_nombre(nombre='Ana')
+    with pytest.raises(ValueError):
+        Persona().establecer_edad(edad='200')
+    assert llamadas() == {'ValidadorDatosContacto.validar_email': 1,
+                          'ValidadorBase.validar_solo_letras': 1,
+                          'Persona.establecer_nombre': 1,
+                          'Persona.establecer_edad': 1}
+    metodos = metricas.instantanea()['metodos']
+    rechazos = {nombre: datos['rechazos'] for nombre, datos in metodos.items()
+                if datos['rechazos']}
+    assert rechazos == {'ValidadorBase.validar_solo_letras': {metricas.VACIO: 1},
+                        'Persona.establecer_edad': {metricas.FUERA_DE_RANGO: 1}}
+
+
+def test_validador_lote_no_se_cuenta(instrumentado):
+    ValidadorLote().validar_nombres(['Ana Pérez', 'A1'])
+    assert llamadas() == {}
+
+
+def test_desactivar_restaura_los_metodos():
+    original = Persona.__dict__['establecer_nombre']
+    metricas.activar()
+    assert Persona.__dict__['establecer_nombre'] is not original
+    metricas.desactivar()
+    assert Persona.__dict__['establecer_nombre'] is original
@@ -0,0 +1,29 @@
+"""
+Pruebas de las copias de Persona: reemplazar() conserva el tipo y solo
+valida los campos que cambian.
+"""
+
+import pytest
+
+from jorge_choque_pg2_tecba.core import Persona
+
+
+class Cliente(Persona):
+    __slots__ = ()
+
+
+def test_reemplazar_conserva_la_subclase():
+    cliente = Cliente().establecer_nombre('Ana Pérez').establecer_edad(30)
+    copia = cliente.reemplazar(edad=31, email='ana@correo.bo')
+    assert type(copia) is Cliente
+    assert (copia.nombre, copia.edad, copia.email) == ('Ana Pérez', 31, 'ana@correo.bo')
+    assert cliente.edad == 30
+
+
+def test_reemplazar_valida_los_campos_nuevos():
+    persona = Persona().establecer_nombre('Ana Pérez')
+    with pytest.raises(ValueError):
+        persona.reemplazar(edad=200)
+    with pytest.raises(TypeError):
+        persona.reemplazar(apellido='Pérez')
+    assert persona.reemplazar(nombre=None).nombre is None
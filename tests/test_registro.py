@@ -0,0 +1,49 @@
+"""
+Pruebas de PersonaRegistro: índices únicos, rango de edad y que un
+registro que falla no quede indexado a medias.
+"""
+
+import pytest
+
+from jorge_choque_pg2_tecba.core import Persona
+from jorge_choque_pg2_tecba.registro import ErrorDuplicado, PersonaRegistro
+
+
+def persona(documento, edad):
+    return (Persona().establecer_nombre('Ana Pérez')
+            .establecer_documento_identidad(documento).establecer_edad(edad))
+
+
+def test_edad_en_texto_se_indexa_como_entero():
+    registro = PersonaRegistro()
+    registro.agregar(persona('1234567', 30))
+    registro.agregar(persona('7654321', '31'))
+    assert [p.documento_identidad for p in registro.rango_edad(31, 31)] == ['7654321']
+    assert len(list(registro.rango_edad(0, 150))) == 2
+
+
+def test_fallo_no_deja_la_persona_a_medias():
+    registro = PersonaRegistro()
+    registro.agregar(persona('1234567', 30))
+    mala = persona('7654321', 30)
+    mala._edad = 'treinta'
+    with pytest.raises(ValueError):
+        registro.agregar(mala)
+    with pytest.raises(ErrorDuplicado):
+        registro.agregar(persona('123-4567', 40))
+    assert len(registro) == 1
+    assert registro.buscar_por_documento('7654321') is None
+    assert list(registro.rango_edad(40, 40)) == []
+
+
+def test_actualizar_mueve_la_edad():
+    registro = PersonaRegistro()
+    identificador = registro.agregar(persona('1234567', 30))
+    mala = persona('1234567', 30)
+    mala._edad = 'treinta'
+    with pytest.raises(ValueError):
+        registro.actualizar(identificador, mala)
+    registro.insertar_o_actualizar(persona('1234567', '45'))
+    assert list(registro.rango_edad(30, 30)) == []
+    assert [p.edad for p in registro.rango_edad(45, 45)] == ['45']
+    assert len(registro) == 1
@@ -0,0 +1,26 @@
+"""
+Pruebas de PersonaTabla: edades guardadas como texto y filas rechazadas
+que no deben dejar columnas de distinto largo.
+"""
+
+import pytest
+
+from jorge_choque_pg2_tecba.core import Persona, PersonaTabla
+
+
+def test_edad_en_texto_se_guarda_como_entero():
+    personas = [Persona().establecer_nombre('Ana Pérez').establecer_edad('30'),
+                Persona().establecer_nombre('Luis Mamani')]
+    tabla = PersonaTabla.desde_personas(personas)
+    assert [tabla.fila(i)['edad'] for i in range(len(tabla))] == [30, None]
+    assert list(tabla.columna('edad')) == [30, None]
+
+
+def test_edad_invalida_no_agrega_ninguna_columna():
+    tabla = PersonaTabla()
+    tabla.agregar_filas([{'nombre': 'Ana Pérez', 'edad': 30}])
+    with pytest.raises(ValueError):
+        tabla.agregar_filas([{'nombre': 'Luis Mamani', 'edad': 'treinta'}])
+    assert len(tabla) == 1
+    assert len(tabla.columna('nombre')) == 1
+    assert list(tabla.columna('nombre')) == ['Ana Pérez']
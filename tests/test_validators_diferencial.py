@@ -0,0 +1,192 @@
+"""
+Pruebas diferenciales de los validadores basados en conjuntos de caracteres.
+
+Comparan ValidadorBase, ValidadorDatosPersonales, ValidadorDatosContacto
+(también en modo seguro) y ValidadorLote con las implementaciones
+originales, que usaban re.match con patrones ^[...]+$, sobre entradas
+generadas y casos límite: dígitos y espacios Unicode, saltos de línea
+finales y los límites de longitud.
+"""
+
+import random
+import re
+import sys
+
+import pytest
+
+from jorge_choque_pg2_tecba.validators import (
+    LONGITUD_MAXIMA_EMAIL,
+    LONGITUD_MAXIMA_ENTRADA,
+    ValidadorBase,
+    ValidadorDatosContacto,
+    ValidadorDatosPersonales,
+    ValidadorLote,
+    _CARACTERES_ALFANUMERICOS,
+    _CARACTERES_DIRECCION,
+    _CARACTERES_LETRAS,
+    _ESPACIOS,
+)
+
+
+PATRON_LETRAS = r'^[a-zA-ZáéíóúÁÉÍÓÚñÑüÜ\s]+$'
+PATRON_ALFANUMERICO = r'^[a-zA-Z0-9áéíóúÁÉÍÓÚñÑüÜ\s]+$'
+PATRON_DIRECCION = r'^[a-zA-Z0-9áéíóúÁÉÍÓÚñÑüÜ\s.,#-]+$'
+PATRON_EMAIL = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+
+
+# Implementaciones originales, con re.match en cada llamada. Los validadores
+# actuales además rechazan las entradas de más de LONGITUD_MAXIMA_ENTRADA
+# caracteres antes de limpiarlas.
+
+def original_solo_letras(valor):
+    return bool(valor) and bool(re.match(PATRON_LETRAS, valor))
+
+
+def original_alfanumerico(valor):
+    return bool(valor) and bool(re.match(PATRON_ALFANUMERICO, valor))
+
+
+def original_nombre(nombre):
+    if not nombre or len(nombre.strip()) < 2:
+        return False
+    nombre_limpio = ' '.join(nombre.split())
+    return original_solo_letras(nombre_limpio) and 2 <= len(nombre_limpio) <= 50
+
+
+def original_direccion(direccion):
+    if not direccion or len(direccion.strip()) < 5:
+        return False
+    direccion_limpia = ' '.join(direccion.split())
+    return (bool(re.match(PATRON_DIRECCION, direccion_limpia))
+            and 5 <= len(direccion_limpia) <= 200)
+
+
+def original_email(email):
+    if not email:
+        return False
+    return bool(re.match(PATRON_EMAIL, email)) and len(email) <= 100
+
+
+def acotado(original):
+    """Aplica el límite de longitud de la entrada a una validación original."""
+    return lambda valor: len(valor) <= LONGITUD_MAXIMA_ENTRADA and original(valor)
+
+
+# Caracteres que las reglas aceptan y caracteres parecidos que no
+ACEPTADOS = 'aZñÑüÜáÉ09 .,#-@_%+'
+ESPACIOS_UNICODE = '\t\n\r\x0b\x0c\x1c\x85\xa0\u1680\u2003\u2028\u202f\u3000'
+PARECIDOS = 'àçÀ\u0301ı²٣０\u200b\ufeff\x00/;:!?\'"ſ\u212a'
+ALFABETO = ACEPTADOS * 4 + ESPACIOS_UNICODE + PARECIDOS
+
+
+def generar(semilla, cantidad, largo_maximo=60):
+    """Cadenas aleatorias mezclando caracteres aceptados y casi aceptados."""
+    azar = random.Random(semilla)
+    cadenas = []
+    for _ in range(cantidad):
+        cadena = ''.join(azar.choices(ALFABETO, k=azar.randint(0, largo_maximo)))
+        if azar.random() < 0.2:
+            cadena += '\n'
+        cadenas.append(cadena)
+    return cadenas
+
+
+def generar_emails(semilla, cantidad):
+    """Emails aleatorios cerca del patrón: partes válidas con algún defecto."""
+    azar = random.Random(semilla)
+    piezas_local = ['ana', 'a.b', 'x_y', 'p%q', 'm+n', '-', '', 'ñ', 'a b', '٣']
+    piezas_dominio = ['correo', 'mail.co', 'a-b', '', '.', 'ñu', 'x..y', '٣']
+    tlds = ['bo', 'com', 'c', '', 'c0m', 'BO', 'ñu', 'io\n', 'com\n\n', 'ｃｏｍ']
+    emails = []
+    for _ in range(cantidad):
+        local = ''.join(azar.choices(piezas_local, k=azar.randint(1, 3)))
+        dominio = ''.join(azar.choices(piezas_dominio, k=azar.randint(1, 3)))
+        arrobas = azar.choice(['@', '@', '@', '', '@@'])
+        emails.append(f"{local}{arrobas}{dominio}.{azar.choice(tlds)}")
+    return emails
+
+
+CASOS_LIMITE = [
+    '', ' ', '\n', 'a', 'ab', 'ab\n', 'ab\n\n', '\nab', 'a\u3000b', 'a\x85b',
+    'José Pérez', 'JOSÉ  PÉREZ ', 'Ñandú\t', 'Zoë', 'O\'Brien', 'ab\u200bcd',
+    '٣٠', '²', 'Calle 1 #23-4, Of. 5', 'Av. Arce 123', 'K' * 50, 'K' * 51,
+    'a' + ' ' * 3000 + 'b',
+]
+
+
+def test_espacios_son_exactamente_los_de_regex():
+    """\\s de re para str y _ESPACIOS reconocen los mismos caracteres."""
+    espacio = re.compile(r'\s')
+    de_regex = {chr(c) for c in range(sys.maxunicode + 1) if espacio.match(chr(c))}
+    assert de_regex == set(_ESPACIOS)
+
+
+@pytest.mark.parametrize('patron, conjunto', [
+    (r'[a-zA-ZáéíóúÁÉÍÓÚñÑüÜ\s]', _CARACTERES_LETRAS),
+    (r'[a-zA-Z0-9áéíóúÁÉÍÓÚñÑüÜ\s]', _CARACTERES_ALFANUMERICOS),
+    (r'[a-zA-Z0-9áéíóúÁÉÍÓÚñÑüÜ\s.,#-]', _CARACTERES_DIRECCION),
+])
+def test_conjuntos_equivalen_a_las_clases_de_caracteres(patron, conjunto):
+    """Cada conjunto contiene exactamente los caracteres de su clase."""
+    clase = re.compile(patron)
+    de_regex = {chr(c) for c in range(sys.maxunicode + 1) if clase.fullmatch(chr(c))}
+    assert de_regex == conjunto
+
+
+@pytest.mark.parametrize('actual, original', [
+    (ValidadorBase.validar_solo_letras, original_solo_letras),
+    (ValidadorBase.validar_alfanumerico, original_alfanumerico),
+    (ValidadorDatosPersonales().validar_nombre, acotado(original_nombre)),
+    (ValidadorDatosContacto().validar_direccion, acotado(original_direccion)),
+])
+def test_reglas_de_caracteres_coinciden_con_regex(actual, original):
+    """Las reglas de solo clase de caracteres aceptan lo mismo que re.match."""
+    for valor in CASOS_LIMITE + generar(1, 5000):
+        assert actual(valor) == original(valor), repr(valor)
+
+
+@pytest.mark.parametrize('modo_seguro', [False, True])
+def test_email_coincide_con_regex(modo_seguro):
+    """El email acepta lo mismo que el patrón original, también sin regex."""
+    validador = ValidadorDatosContacto(modo_seguro=modo_seguro)
+    casos = ['ana@correo.bo', 'ana@correo.bo\n', 'ana@correo.bo\n\n', 'ana@@correo.bo',
+             'ana@correo.b', 'a@b.c0', 'a@.bo', 'a@b..bo', 'a@b.BO', '@b.bo', 'a@b.ｂｏ',
+             'a' * (LONGITUD_MAXIMA_EMAIL - 5) + '@b.bo',
+             'a' * (LONGITUD_MAXIMA_EMAIL - 4) + '@b.bo']
+    for email in casos + generar_emails(2, 5000) + generar(3, 2000):
+        assert validador.validar_email(email) == original_email(email), repr(email)
+
+
+def test_lote_coincide_con_regex():
+    """ValidadorLote da las mismas máscaras que las reglas originales."""
+    lote = ValidadorLote()
+    valores = CASOS_LIMITE + generar(4, 3000)
+    assert list(lote.validar_nombres(valores)) == [
+        int(acotado(original_nombre)(v)) for v in valores]
+    assert list(lote.validar_direcciones(valores)) == [
+        int(acotado(original_direccion)(v)) for v in valores]
+    emails = generar_emails(5, 3000)
+    assert list(lote.validar_emails(emails)) == [int(original_email(e)) for e in emails]
+
+
+@pytest.mark.parametrize('edad, valida', [
+    ('0', True), ('150', True), ('151', False), ('007', True), ('٣٠', True),
+    ('３０', True), ('²', False), ('1²', False), ('30\n', False), (' 30', False),
+    ('-1', False), ('', False), ('1' * (LONGITUD_MAXIMA_ENTRADA + 1), False),
+])
+def test_edad_con_digitos_unicode(edad, valida):
+    """Los dígitos Unicode que int() acepta valen; los demás se rechazan sin error."""
+    assert ValidadorDatosPersonales().validar_edad(edad) is valida
+    assert ValidadorLote().validar_edades([edad])[0] == int(valida)
+
+
+@pytest.mark.parametrize('validar, relleno', [
+    (ValidadorDatosPersonales().validar_nombre, 'Ana' + ' '),
+    (ValidadorDatosContacto().validar_direccion, 'Calle' + ' '),
+])
+def test_limite_de_longitud_de_entrada(validar, relleno):
+    """Una entrada que se acorta al limpiarla vale solo hasta el límite sin limpiar."""
+    base = relleno + 'x'
+    en_limite = base + ' ' * (LONGITUD_MAXIMA_ENTRADA - len(base))
+    assert validar(en_limite)
+    assert not validar(en_limite + ' ')